@@ -3,12 +3,13 @@ import logging
 import sys
 import time
 import tkinter as tk
-from typing import Any, Dict
+from typing import Any
 
 from app.ui_components import UIComponents
 from service.keyboard_handler import KeyboardHandler
 from service.notification import NotificationManager
 from service.recording_controller import RecordingController
+from service.replacement_rules import Replacements
 from utils.config_manager import save_config
 
 
@@ -19,7 +20,7 @@ class VoiceInputManager:
             config: configparser.ConfigParser,
             recorder: Any,
             client: Any,
-            replacements: Dict[str, str],
+            replacements: Replacements,
             version: str
     ):
         self.master = master
@@ -33,6 +34,7 @@ class VoiceInputManager:
             'toggle_recording': self.toggle_recording,
             'toggle_punctuation': self.toggle_punctuation,
             'reload_audio': self.ui_components.reload_latest_audio,
+            'submit_file': self.submit_file,
         }
 
         self.ui_components.update_callbacks(callbacks)
@@ -57,11 +59,10 @@ class VoiceInputManager:
             self.toggle_recording,
             self.toggle_punctuation,
             self.ui_components.reload_latest_audio,
-            self.close_application,
+            self.cancel_or_close,
         )
 
         self.client = client
-        self.master.bind('<<LoadAudioFile>>', self.recording_controller.handle_audio_file)
 
         start_minimized = self.config['OPTIONS'].getboolean('START_MINIMIZED', True)
         if start_minimized:
@@ -70,6 +71,9 @@ class VoiceInputManager:
     def toggle_recording(self):
         self.recording_controller.toggle_recording()
 
+    def submit_file(self, file_path: str):
+        return self.recording_controller.submit_file(file_path)
+
     def toggle_punctuation(self):
         use_punctuation = not self.recording_controller.use_punctuation
         self.recording_controller.use_punctuation = use_punctuation
@@ -78,6 +82,12 @@ class VoiceInputManager:
         self.config['FORMATTING']['USE_PUNCTUATION'] = str(use_punctuation)
         save_config(self.config)
 
+    def cancel_or_close(self):
+        """終了キー: 文字起こしの処理中ならキャンセルし、処理中でなければ終了する"""
+        if self.recording_controller.cancel_current_job():
+            return
+        self.close_application()
+
     def close_application(self):
         try:
             if self.recording_controller:
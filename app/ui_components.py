@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Callable, Dict, Optional
 
+from service.recording_history import get_recording_history
 from service.replacements_editor import ReplacementsEditor
 
 class UIComponents:
@@ -20,6 +21,7 @@ class UIComponents:
         self.callbacks = callbacks
         self._toggle_recording = callbacks.get('toggle_recording', lambda: None)
         self._toggle_punctuation = callbacks.get('toggle_punctuation', lambda: None)
+        self._submit_file = callbacks.get('submit_file', lambda file_path: None)
         self.status_label: Optional[tk.Label] = None
         self.punctuation_status_label: Optional[tk.Label] = None
         self.punctuation_button: Optional[tk.Button] = None
@@ -100,6 +102,7 @@ class UIComponents:
         self.callbacks = callbacks
         self._toggle_recording = callbacks.get('toggle_recording', self._toggle_recording)
         self._toggle_punctuation = callbacks.get('toggle_punctuation', self._toggle_punctuation)
+        self._submit_file = callbacks.get('submit_file', self._submit_file)
 
     def update_record_button(self, is_recording: bool):
         assert self.record_button is not None
@@ -120,15 +123,18 @@ class UIComponents:
     def reload_latest_audio(self):
         latest_file = self.get_latest_audio_file()
         if latest_file:
-            self.master.clipboard_clear()
-            self.master.clipboard_append(latest_file)
-            self.master.event_generate('<<LoadAudioFile>>')
-        else:
-            messagebox.showwarning("警告", "音声ファイルが見つかりません")
+            return self._submit_file(latest_file)
+        messagebox.showwarning("警告", "音声ファイルが見つかりません")
+        return None
 
     def get_latest_audio_file(self):
         try:
-            files = glob.glob(os.path.join(self.config['PATHS']['TEMP_DIR'], "*.wav"))
+            temp_dir = self.config['PATHS']['TEMP_DIR']
+            latest = get_recording_history(temp_dir).latest()
+            if latest is not None:
+                return latest.path
+            # 履歴が無い場合（履歴導入前の録音のみ）はディレクトリを走査する
+            files = glob.glob(os.path.join(temp_dir, "audio_*.wav"))
             if not files:
                 return None
             return max(files, key=os.path.getmtime)
@@ -143,9 +149,8 @@ class UIComponents:
             initialdir=self.config['PATHS']['TEMP_DIR']
         )
         if file_path:
-            self.master.clipboard_clear()
-            self.master.clipboard_append(file_path)
-            self.master.event_generate('<<LoadAudioFile>>')
+            return self._submit_file(file_path)
+        return None
 
     def open_replacements_editor(self):
         ReplacementsEditor(self.master, self.config)
@@ -9,11 +9,19 @@ from groq import Groq
 from utils.env_loader import load_env_variables
 
 
-def setup_groq_client() -> Groq:
+def setup_groq_client(base_url: Optional[str] = None) -> Groq:
+    """Groqクライアントを作成
+
+    base_url（未指定時は環境変数GROQ_BASE_URL）を指定すると接続先を差し替える（模擬サーバーでのテスト用）
+    """
     env_vars = load_env_variables()
     api_key = env_vars.get("GROQ_API_KEY")
+    base_url = base_url or env_vars.get("GROQ_BASE_URL")
     if not api_key:
         raise ValueError("GROQ_API_KEYが未設定です")
+    if base_url:
+        logging.info(f"Groq APIの接続先を変更しました: {base_url}")
+        return Groq(api_key=api_key, base_url=base_url)
     return Groq(api_key=api_key)
 
 
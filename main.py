@@ -1,17 +1,22 @@
 import logging
+import multiprocessing
 import os
 import sys
+import time
 import tkinter as tk
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox
+from typing import Sequence
 
 from app import __version__
-from app.main_window import VoiceInputManager
-from external_service.groq_api import setup_groq_client
-from service.audio_recorder import AudioRecorder
-from service.text_processing import initialize_text_processing, load_replacements
 from utils.config_manager import load_config
+from utils.lazy_import import preload_modules
 from utils.log_rotation import setup_logging, setup_debug_logging
+from utils.startup_trace import exit_after_startup, get_startup_trace
+
+# ウィンドウ表示後にバックグラウンドで読み込むモジュール（groq・pydantic・httpxなどを含む）
+PRELOAD_MODULES = ('app.main_window', 'pyaudio', 'pyperclip', 'keyboard')
 
 
 def main():
@@ -23,20 +28,42 @@ def main():
     app = None
 
     try:
-        config = load_config()
-        setup_logging(config)
+        trace = get_startup_trace()
+        with trace.phase('load_config'):
+            config = load_config()
+        with trace.phase('setup_logging'):
+            setup_logging(config)
 
-        debug_logger = setup_debug_logging()
+        with trace.phase('setup_debug_logging'):
+            debug_logger = setup_debug_logging()
 
         logging.info("アプリケーションを開始します")
 
-        initialize_text_processing()
-
-        recorder = AudioRecorder(config)
-        client = setup_groq_client()
-        replacements = load_replacements()
-        root = tk.Tk()
-        app = VoiceInputManager(root, config, recorder, client, replacements, __version__)
+        # ウィンドウを先に表示し、モジュールの読み込み・クライアント作成・置換ルールの準備は並行して行う
+        with trace.phase('ウィンドウ表示'):
+            root = tk.Tk()
+            loading_label = _show_loading(root)
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='Startup') as executor:
+            preload_future = executor.submit(_preload_modules)
+            client_future = executor.submit(_create_client)
+            replacements_future = executor.submit(_load_replacements)
+            with trace.phase('バックグラウンド処理の待機'):
+                _wait_for_startup(root, [preload_future, client_future, replacements_future])
+            preload_future.result()
+            client = client_future.result()
+            replacements = replacements_future.result()
+        loading_label.destroy()
+
+        from app.main_window import VoiceInputManager
+        from service.audio_recorder import AudioRecorder
+        from service.text_processing import initialize_text_processing
+
+        with trace.phase('initialize_text_processing'):
+            initialize_text_processing()
+        with trace.phase('AudioRecorder.__init__'):
+            recorder = AudioRecorder(config)
+        with trace.phase('UI構築'):
+            app = VoiceInputManager(root, config, recorder, client, replacements, __version__)
 
         def safe_close():
             try:
@@ -47,6 +74,10 @@ def main():
                 logging.debug(f"終了処理エラー詳細: {traceback.format_exc()}")
 
         root.protocol("WM_DELETE_WINDOW", safe_close)
+        trace.mark('mainloop')
+        root.after_idle(_on_first_idle, root)
+        # プリロール用の待機入力は最初の表示の後に開始する（無効なら何もしない）
+        root.after_idle(recorder.start_standby)
         root.mainloop()
         logging.info("アプリケーションが正常に終了しました")
 
@@ -116,6 +147,54 @@ App: {'初期化済み' if app else '未初期化'}
             logging.debug(f"クリーンアップエラー詳細: {traceback.format_exc()}")
 
 
+def _show_loading(root: tk.Tk) -> tk.Label:
+    root.title("GroqWhisper")
+    # 準備が終わるまでは閉じるボタンを無効にする
+    root.protocol("WM_DELETE_WINDOW", lambda: None)
+    label = tk.Label(root, text="起動中...")
+    label.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+    root.update()
+    return label
+
+
+def _wait_for_startup(root: tk.Tk, futures: Sequence[Future]):
+    """バックグラウンドの準備が終わるまでウィンドウのイベントを処理しながら待つ"""
+    while not all(future.done() for future in futures):
+        root.update()
+        time.sleep(0.01)
+
+
+def _on_first_idle(root: tk.Tk):
+    trace = get_startup_trace()
+    trace.mark('最初のアイドル')
+    trace.emit()
+    if exit_after_startup():
+        root.quit()
+
+
+def _preload_modules():
+    with get_startup_trace().phase('モジュール読み込み'):
+        preload_modules(PRELOAD_MODULES)
+
+
+def _create_client():
+    with get_startup_trace().phase('setup_groq_client'):
+        from external_service.groq_api import setup_groq_client
+        return setup_groq_client()
+
+
+def _load_replacements():
+    trace = get_startup_trace()
+    with trace.phase('load_replacements'):
+        from service.text_processing import load_replacement_rules
+        replacements = load_replacement_rules()
+    with trace.phase('compile_replacement_rules'):
+        from service.replacement_rules import compile_replacement_rules
+        # コンパイル結果はキャッシュされ、RecordingControllerのパイプライン構築で再利用される
+        compile_replacement_rules(replacements)
+    return replacements
+
+
 def _emergency_cleanup(app):
     try:
         logging.info("緊急クリーンアップを開始します")
@@ -166,4 +245,6 @@ def _show_error_dialog(message: str, title: str = "エラー"):
 
 
 if __name__ == "__main__":
+    # 録音プロセス（capture_mode = process）を実行ファイル版でも起動できるようにする
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,320 @@
+import argparse
+import configparser
+import heapq
+import itertools
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+import wave
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from groq import Groq  # noqa: E402
+
+from scripts.mock_groq_server import MockGroqServer  # noqa: E402
+from service.clipboard_backend import InMemoryClipboardBackend, set_clipboard_backend  # noqa: E402
+from service.recording_controller import RecordingController  # noqa: E402
+from utils.config_manager import load_config  # noqa: E402
+
+Frames = Tuple[List[bytes], int]
+
+
+class FakeMaster:
+    """Tkの代わりにafter()のコールバックを1つのスレッドで時刻順に実行する"""
+
+    def __init__(self):
+        self._queue: List[Tuple[float, int, Callable, tuple]] = []
+        self._cancelled = set()
+        self._ids = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'FakeMaster':
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name='FakeMaster', daemon=True)
+        self._thread.start()
+        return self
+
+    def destroy(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(2.0)
+
+    def after(self, ms: int, func: Callable, *args: Any) -> str:
+        with self._condition:
+            after_id = next(self._ids)
+            heapq.heappush(self._queue, (time.monotonic() + ms / 1000, after_id, func, args))
+            self._condition.notify()
+        return f"after#{after_id}"
+
+    def after_cancel(self, after_id: str):
+        with self._condition:
+            self._cancelled.add(int(after_id.split('#')[1]))
+
+    def winfo_exists(self) -> bool:
+        return self._running
+
+    def quit(self):
+        pass
+
+    def lift(self):
+        pass
+
+    def attributes(self, *args: Any):
+        pass
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                while self._running and (not self._queue or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                _, after_id, func, args = heapq.heappop(self._queue)
+                if after_id in self._cancelled:
+                    self._cancelled.discard(after_id)
+                    continue
+            func(*args)
+
+
+class FakeRecorder:
+    """transcribe_audio_framesを直接呼ぶため録音は行わない"""
+
+    is_recording = False
+
+    def stop_recording(self) -> Frames:
+        return [], 0
+
+    def set_segment_callback(self, callback):
+        pass
+
+    def close(self):
+        pass
+
+    def take_saved_file(self):
+        return None
+
+
+def synthetic_frames(seconds: float, sample_rate: int = 16000, chunk: int = 1024) -> Frames:
+    """正弦波（440Hz）の16bit PCMをチャンクに分割して返す"""
+    total = int(seconds * sample_rate)
+    samples = array('h', (int(8000 * math.sin(2 * math.pi * 440 * i / sample_rate)) for i in range(total)))
+    data = samples.tobytes()
+    size = chunk * 2
+    return [data[i:i + size] for i in range(0, len(data), size)], sample_rate
+
+
+def load_wav_frames(path: str, chunk: int = 1024) -> Frames:
+    """録音済みのWAVファイルをチャンクに分割して返す"""
+    with wave.open(path, 'rb') as wf:
+        sample_rate = wf.getframerate()
+        frames = []
+        while True:
+            data = wf.readframes(chunk)
+            if not data:
+                break
+            frames.append(data)
+    return frames, sample_rate
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """最近傍順位法による百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _user_config(config: configparser.ConfigParser, temp_dir: str) -> configparser.ConfigParser:
+    # 保存ファイル名が秒単位のため、利用者ごとに一時ディレクトリを分ける
+    copied = configparser.ConfigParser()
+    copied.read_dict(config)
+    copied['PATHS']['TEMP_DIR'] = temp_dir
+    return copied
+
+
+class _SimulatedUser:
+    def __init__(self, master: FakeMaster, config: configparser.ConfigParser, client: Groq):
+        self.done = threading.Event()
+        self.failed: Optional[str] = None
+        self.controller = RecordingController(
+            master,
+            config,
+            FakeRecorder(),
+            client,
+            {},
+            {'update_record_button': lambda *args: None, 'update_status_label': lambda *args: None},
+            self._on_notification
+        )
+        original_on_output_done = self.controller._on_output_done
+
+        def on_output_done(future):
+            original_on_output_done(future)
+            if future.exception() is not None:
+                self.failed = str(future.exception())
+            self.done.set()
+
+        self.controller._on_output_done = on_output_done
+
+    def _on_notification(self, title: str, message: str):
+        self.failed = message
+        self.done.set()
+
+    def run_job(self, frames: List[bytes], sample_rate: int, timeout: float) -> Optional[str]:
+        """録音停止から貼り付け完了までを実行し、失敗時はメッセージを返す"""
+        self.done.clear()
+        self.failed = None
+        self.controller.transcribe_audio_frames(frames, sample_rate)
+        if not self.done.wait(timeout):
+            return 'タイムアウト'
+        return self.failed
+
+
+def run_load_test(
+        users: int,
+        jobs_per_user: int,
+        sessions: Sequence[Frames],
+        base_url: str,
+        think_time: float = 0.0,
+        config: Optional[configparser.ConfigParser] = None,
+        job_timeout: float = 30.0,
+        max_retries: int = 2
+) -> Dict[str, Any]:
+    """N人の利用者が並行して録音を送り、文字起こしから貼り付けまでの処理量と待ち時間を計測
+
+    TkとPyAudioは使わず、クリップボードとキー入力はメモリ上の偽物に置き換える
+    """
+    config = config or load_config()
+    master = FakeMaster().start()
+    backend = InMemoryClipboardBackend()
+    previous_backend = set_clipboard_backend(backend)
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def user_loop(user: _SimulatedUser, index: int):
+        for job in range(jobs_per_user):
+            frames, sample_rate = sessions[(index + job) % len(sessions)]
+            start = time.perf_counter()
+            error = user.run_job(frames, sample_rate, job_timeout)
+            elapsed = time.perf_counter() - start
+            with lock:
+                if error is None:
+                    latencies.append(elapsed)
+                else:
+                    errors.append(error)
+            if think_time > 0:
+                time.sleep(think_time)
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_root, \
+                patch('service.keystroke_output.keyboard.write'):
+            client = Groq(api_key=os.environ.get('GROQ_API_KEY', 'load-test'), base_url=base_url,
+                          max_retries=max_retries)
+            simulated = [
+                _SimulatedUser(master, _user_config(config, os.path.join(temp_root, f"user{i}")), client)
+                for i in range(users)
+            ]
+            threads = [
+                threading.Thread(target=user_loop, args=(user, i), name=f"LoadTestUser{i}")
+                for i, user in enumerate(simulated)
+            ]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            wall_seconds = time.perf_counter() - start
+    finally:
+        set_clipboard_backend(previous_backend)
+        master.destroy()
+
+    return {
+        'users': users,
+        'jobs': len(latencies) + len(errors),
+        'completed': len(latencies),
+        'errors': len(errors),
+        'error_messages': sorted(set(errors)),
+        'wall_seconds': wall_seconds,
+        'jobs_per_second': len(latencies) / wall_seconds if wall_seconds > 0 else 0.0,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': max(latencies, default=0.0),
+        'pasted': len(backend.pasted_texts),
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    lines = [
+        f"利用者数: {result['users']}  ジョブ数: {result['jobs']}  "
+        f"成功: {result['completed']}  失敗: {result['errors']}",
+        f"処理量: {result['jobs_per_second']:.2f} ジョブ/秒（{result['wall_seconds']:.2f}秒）",
+        "待ち時間(ms): " + '  '.join(
+            f"{key}={result[key] * 1000:.1f}" for key in ('p50', 'p90', 'p95', 'p99', 'max')
+        ),
+    ]
+    for message in result['error_messages']:
+        lines.append(f"  失敗: {message}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='録音から貼り付けまでのパイプラインの負荷試験')
+    parser.add_argument('--users', type=int, default=4, help='同時に操作する利用者数')
+    parser.add_argument('--jobs', type=int, default=5, help='利用者あたりのジョブ数')
+    parser.add_argument('--wav', action='append', default=[], help='再生する録音済みWAVファイル（複数指定可）')
+    parser.add_argument('--seconds', type=float, default=5.0, help='WAV未指定時の合成音声の長さ（秒）')
+    parser.add_argument('--think', type=float, default=0.0, help='ジョブ間の待機（秒）')
+    parser.add_argument('--base-url', help='使用する文字起こしサーバー（未指定時は模擬サーバーを起動）')
+    parser.add_argument('--latency', default='lognormal:0.4,0.3', help='模擬サーバーの応答遅延の分布')
+    parser.add_argument('--error-429', type=float, default=0.0, help='模擬サーバーが429を返す割合')
+    parser.add_argument('--error-500', type=float, default=0.0, help='模擬サーバーが500を返す割合')
+    parser.add_argument('--max-concurrent', type=int, help='模擬サーバーの同時処理数の上限')
+    parser.add_argument('--json', action='store_true', help='結果をJSONで出力')
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    chunk = int(config['AUDIO']['CHUNK'])
+    if args.wav:
+        sessions = [load_wav_frames(path, chunk) for path in args.wav]
+    else:
+        sessions = [synthetic_frames(args.seconds, int(config['AUDIO']['SAMPLE_RATE']), chunk)]
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = MockGroqServer(
+            latency=args.latency,
+            error_429_rate=args.error_429,
+            error_500_rate=args.error_500,
+            max_concurrent=args.max_concurrent,
+        ).start()
+        base_url = server.base_url
+    try:
+        result = run_load_test(args.users, args.jobs, sessions, base_url, args.think, config)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(json.dumps(result, ensure_ascii=False, indent=2) if args.json else format_report(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
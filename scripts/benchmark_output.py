@@ -0,0 +1,111 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import service.safe_paste_sendinput as safe_paste_sendinput  # noqa: E402
+from service.clipboard_backend import AdaptiveDelay, InMemoryClipboardBackend  # noqa: E402
+from service.keystroke_output import CLIPBOARD, KEYSTROKE, type_text  # noqa: E402
+
+DEFAULT_LENGTHS = [20, 200, 2000]
+DEFAULT_PASTE_DELAY = 0.2
+
+
+def _simulated_write(key_seconds: float):
+    def write(text: str, delay: float = 0):
+        if key_seconds > 0:
+            time.sleep(key_seconds * len(text))
+    return write
+
+
+def run_clipboard_output(text: str, backend: InMemoryClipboardBackend, paste_delay: float = DEFAULT_PASTE_DELAY):
+    """クリップボード経由の出力（コピー検証・貼り付け前の待機・貼り付け）"""
+    if not safe_paste_sendinput.safe_clipboard_copy(text, backend):
+        raise RuntimeError("クリップボードへのコピーに失敗しました")
+    delay = safe_paste_sendinput.get_paste_delay(paste_delay)
+    if delay > 0:
+        time.sleep(delay)
+    safe_paste_sendinput.safe_paste_text(backend)
+
+
+def measure_output(
+        length: int,
+        iterations: int = 5,
+        clipboard_reads: int = 2,
+        key_seconds: float = 0.0,
+        chunk_size: int = 32,
+        chunk_interval: float = 0.01
+) -> Dict[str, float]:
+    """クリップボード経由とキー入力の1回あたりの出力時間を計測
+
+    keyboardはモックに置き換え、key_secondsで1文字あたりの送信時間を模擬する
+    clipboard_readsはコピーが読み戻しで見えるまでの読み取り回数
+    """
+    text = ('あいうえおカキクケコ漢字テスト。' * (length // 16 + 1))[:length]
+    results: Dict[str, List[float]] = {CLIPBOARD: [], KEYSTROKE: []}
+
+    with patch.object(safe_paste_sendinput, 'clipboard_latency', AdaptiveDelay(initial=0.0, maximum=1.0)):
+        for _ in range(iterations):
+            backend = InMemoryClipboardBackend(visible_after_reads=clipboard_reads)
+            safe_paste_sendinput._last_paste_at = None
+            start = time.perf_counter()
+            run_clipboard_output(text, backend)
+            results[CLIPBOARD].append(time.perf_counter() - start)
+
+    with patch('service.keystroke_output.keyboard.write', side_effect=_simulated_write(key_seconds)):
+        for _ in range(iterations):
+            start = time.perf_counter()
+            type_text(text, chunk_size, chunk_interval)
+            results[KEYSTROKE].append(time.perf_counter() - start)
+
+    return {
+        'length': float(length),
+        CLIPBOARD: statistics.median(results[CLIPBOARD]),
+        KEYSTROKE: statistics.median(results[KEYSTROKE]),
+    }
+
+
+def format_report(results: Sequence[Dict[str, float]]) -> str:
+    lines = [f"{'文字数':>6} {'クリップボード(ms)':>18} {'キー入力(ms)':>13}"]
+    for result in results:
+        lines.append(
+            f"{int(result['length']):>6} {result[CLIPBOARD] * 1000:>18.2f} {result[KEYSTROKE] * 1000:>13.2f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='クリップボード経由とキー入力の出力ベンチマーク')
+    parser.add_argument('--lengths', default=','.join(str(length) for length in DEFAULT_LENGTHS),
+                        help='計測する文字数（カンマ区切り）')
+    parser.add_argument('--iterations', type=int, default=5, help='計測回数')
+    parser.add_argument('--clipboard-reads', type=int, default=2, help='コピーが反映されるまでの読み取り回数')
+    parser.add_argument('--key-us', type=float, default=0.0, help='1文字あたりのキー送信時間（マイクロ秒）')
+    parser.add_argument('--chunk-size', type=int, default=32, help='キー入力の分割文字数')
+    parser.add_argument('--chunk-interval', type=float, default=0.01, help='キー入力の分割ごとの待機（秒）')
+    args = parser.parse_args(argv)
+
+    results = [
+        measure_output(
+            int(length),
+            args.iterations,
+            args.clipboard_reads,
+            args.key_us / 1_000_000,
+            args.chunk_size,
+            args.chunk_interval
+        )
+        for length in args.lengths.split(',') if length.strip()
+    ]
+    print(format_report(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
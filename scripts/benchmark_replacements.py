@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from service.replacement_rules import ReplacementMatcher, ReplacementRule  # noqa: E402
+from service.text_processing import load_replacement_rules  # noqa: E402
+
+DEFAULT_RULE_COUNTS = [10, 100, 1000, 10000, 100000]
+DEFAULT_TRANSCRIPT_LENGTH = 1000
+
+HIRAGANA = [chr(code) for code in range(ord('ぁ'), ord('ゖ'))]
+KATAKANA = [chr(code) for code in range(ord('ァ'), ord('ヶ'))]
+# 常用漢字に近い範囲から一部を使用
+KANJI = [chr(code) for code in range(0x4E00, 0x4E00 + 2000)]
+PARTICLES = ['は', 'が', 'を', 'に', 'で', 'と', 'の', 'です', 'ます', 'した']
+
+
+def generate_rule_lines(count: int, seed: int = 0) -> List[str]:
+    """置換ファイル形式の合成ルールを生成（約1%を単語境界・正規表現ルールにする）"""
+    rng = random.Random(seed)
+    patterns = set()
+    lines = []
+    while len(lines) < count:
+        alphabet = rng.choice((KANJI, KATAKANA))
+        pattern = ''.join(rng.choice(alphabet) for _ in range(rng.randint(2, 6)))
+        if pattern in patterns:
+            continue
+        patterns.add(pattern)
+        replacement = ''.join(rng.choice(KANJI) for _ in range(rng.randint(2, 6)))
+        kind_roll = rng.random()
+        if kind_roll < 0.005:
+            lines.append(f"word:{''.join(rng.choice('ABCDEFGHIJ') for _ in range(3))}{len(lines)},{replacement}")
+        elif kind_roll < 0.01:
+            lines.append(f"re:{pattern}[0-9]+,{replacement}")
+        else:
+            lines.append(f"{pattern},{replacement}")
+    return lines
+
+
+def generate_transcript(length: int, rule_lines: Sequence[str] = (), seed: int = 0) -> str:
+    """合成の日本語文字起こしを生成（一定割合でルールの置換前文字列を含める）"""
+    rng = random.Random(seed)
+    literals = [line.split(',')[0] for line in rule_lines if ':' not in line.split(',')[0]]
+    parts: List[str] = []
+    total = 0
+    while total < length:
+        roll = rng.random()
+        if literals and roll < 0.1:
+            word = rng.choice(literals)
+        elif roll < 0.5:
+            word = ''.join(rng.choice(KANJI) for _ in range(rng.randint(1, 3)))
+        elif roll < 0.7:
+            word = ''.join(rng.choice(KATAKANA) for _ in range(rng.randint(2, 5)))
+        else:
+            word = ''.join(rng.choice(HIRAGANA) for _ in range(rng.randint(1, 4)))
+        word += rng.choice(PARTICLES)
+        if rng.random() < 0.15:
+            word += rng.choice('、。')
+        parts.append(word)
+        total += len(word)
+    return ''.join(parts)[:length]
+
+
+def measure_replacements(
+        rule_count: int,
+        transcript_length: int = DEFAULT_TRANSCRIPT_LENGTH,
+        iterations: int = 20,
+        seed: int = 0
+) -> Dict[str, float]:
+    """読み込み・コンパイル・1回あたりの置換時間とメモリを計測"""
+    rule_lines = generate_rule_lines(rule_count, seed)
+    transcript = generate_transcript(transcript_length, rule_lines, seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, 'replacements.txt')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(rule_lines))
+
+        start = time.perf_counter()
+        rules: List[ReplacementRule] = load_replacement_rules(file_path)
+        load_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    # キャッシュを経由せずに毎回コンパイルする
+    matcher = ReplacementMatcher(rules)
+    compile_seconds = time.perf_counter() - start
+    _, compile_peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        matcher.replace(transcript)
+        samples.append(time.perf_counter() - start)
+
+    return {
+        'rules': float(len(rules)),
+        'transcript_length': float(len(transcript)),
+        'load_seconds': load_seconds,
+        'compile_seconds': compile_seconds,
+        'compile_peak_bytes': float(compile_peak_bytes),
+        'per_call_seconds': statistics.median(samples),
+    }
+
+
+def compare_with_baseline(
+        results: Dict[int, Dict[str, float]],
+        baseline: Dict[str, Dict[str, float]],
+        tolerance: float
+) -> List[str]:
+    """基準値に対して1回あたりの置換時間が許容倍率を超えたルール数を返す"""
+    regressions = []
+    for rule_count, result in results.items():
+        reference = baseline.get(str(rule_count))
+        if not reference:
+            continue
+        limit = reference['per_call_seconds'] * tolerance
+        if result['per_call_seconds'] > limit:
+            regressions.append(
+                f"{rule_count}ルール: {result['per_call_seconds'] * 1000:.3f}ms "
+                f"(基準 {reference['per_call_seconds'] * 1000:.3f}ms × {tolerance})"
+            )
+    return regressions
+
+
+def format_report(results: Dict[int, Dict[str, float]]) -> str:
+    lines = [
+        f"{'ルール数':>8} {'読込(ms)':>10} {'コンパイル(ms)':>14} {'置換(ms/回)':>12} {'メモリ(KB)':>11}",
+    ]
+    for rule_count, result in results.items():
+        lines.append(
+            f"{rule_count:>8} {result['load_seconds'] * 1000:>10.2f} "
+            f"{result['compile_seconds'] * 1000:>14.2f} {result['per_call_seconds'] * 1000:>12.3f} "
+            f"{result['compile_peak_bytes'] / 1024:>11.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='置換ルールのベンチマーク')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_RULE_COUNTS),
+                        help='計測するルール数（カンマ区切り）')
+    parser.add_argument('--length', type=int, default=DEFAULT_TRANSCRIPT_LENGTH, help='文字起こしの文字数')
+    parser.add_argument('--iterations', type=int, default=20, help='置換の計測回数')
+    parser.add_argument('--max-per-call-ms', type=float, help='1回あたりの置換時間の上限（ミリ秒）')
+    parser.add_argument('--baseline', help='比較する基準値のJSONファイル')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='基準値に対する許容倍率')
+    parser.add_argument('--save-baseline', help='計測結果を基準値として保存するJSONファイル')
+    args = parser.parse_args(argv)
+
+    results: Dict[int, Dict[str, float]] = {}
+    for size in (int(value) for value in args.sizes.split(',') if value.strip()):
+        results[size] = measure_replacements(size, args.length, args.iterations)
+
+    print(format_report(results))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({str(size): result for size, result in results.items()}, f, indent=2)
+        print(f"基準値を保存しました: {args.save_baseline}")
+
+    failures = []
+    if args.max_per_call_ms is not None:
+        for size, result in results.items():
+            if result['per_call_seconds'] * 1000 > args.max_per_call_ms:
+                failures.append(f"{size}ルール: {result['per_call_seconds'] * 1000:.3f}ms > {args.max_per_call_ms}ms")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            failures.extend(compare_with_baseline(results, json.load(f), args.tolerance))
+
+    if failures:
+        print("性能劣化を検出しました:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
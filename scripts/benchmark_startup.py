@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, MutableMapping, Optional, Sequence
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.startup_trace import EXIT_ENV, TRACE_FILE_ENV  # noqa: E402
+
+# 音声・キーボード・クリップボードはスタブに置き換える
+STUB_MODULES = ('pyaudio', 'keyboard', 'pyperclip')
+# 接続しないアドレス（クライアント作成時に通信は発生しない）
+STUB_BASE_URL = 'http://127.0.0.1:9'
+
+
+def install_stubs(modules: MutableMapping[str, Any] = sys.modules):
+    """子プロセスで音声・キーボード・ネットワークをスタブに置き換える"""
+    for name in STUB_MODULES:
+        stub = MagicMock(name=name)
+        stub.__name__ = name
+        stub.__file__ = None
+        modules[name] = stub
+
+    import utils.env_loader as env_loader
+    env_loader.load_env_variables = lambda: {'GROQ_API_KEY': 'benchmark', 'GROQ_BASE_URL': STUB_BASE_URL}
+
+
+def build_command(real: bool = False) -> List[str]:
+    """1回分の起動コマンド（ディスプレイが無いLinuxではxvfb-runの仮想ディスプレイで実行）"""
+    command = [sys.executable, os.path.abspath(__file__), '--child']
+    if real:
+        command.append('--real')
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        xvfb_run = shutil.which('xvfb-run')
+        if xvfb_run is None:
+            raise RuntimeError("ディスプレイが無く、xvfb-runも見つかりません")
+        command = [xvfb_run, '-a'] + command
+    return command
+
+
+def run_once(real: bool = False, timeout: float = 60.0) -> Dict[str, Any]:
+    """新しいプロセスでメインループ到達まで起動し、段階ごとの所要時間を返す"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        trace_path = os.path.join(work_dir, 'startup.json')
+        env = dict(os.environ, **{TRACE_FILE_ENV: trace_path, EXIT_ENV: '1'})
+        start = time.perf_counter()
+        # 一時ディレクトリなどの相対パスは作業ディレクトリに作られる
+        result = subprocess.run(build_command(real), cwd=work_dir, env=env, timeout=timeout,
+                                capture_output=True, text=True, encoding='utf-8', errors='replace')
+        wall = time.perf_counter() - start
+        if not os.path.exists(trace_path):
+            raise RuntimeError(f"起動に失敗しました（終了コード {result.returncode}）: {result.stderr.strip()[-500:]}")
+        with open(trace_path, encoding='utf-8') as f:
+            trace = json.load(f)
+    trace['wall'] = wall
+    return trace
+
+
+def summarize(traces: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """段階ごとの所要時間（秒）の中央値・最小・最大"""
+    samples: Dict[str, List[float]] = {}
+    for trace in traces:
+        for phase in trace['phases']:
+            samples.setdefault(phase['name'], []).append(phase['duration'])
+        for name, at in trace.get('marks', {}).items():
+            samples.setdefault(name, []).append(at)
+        if 'wall' in trace:
+            samples.setdefault('プロセス全体', []).append(trace['wall'])
+    return {
+        name: {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+        for name, values in samples.items()
+    }
+
+
+def format_summary(summary: Dict[str, Dict[str, float]], runs: int) -> str:
+    lines = [f"起動ベンチマーク（{runs}回）", f"{'中央値(ms)':>11} {'最小':>8} {'最大':>8}  段階"]
+    for name, stats in summary.items():
+        lines.append(
+            f"{stats['median'] * 1000:>11.1f} {stats['min'] * 1000:>8.1f} {stats['max'] * 1000:>8.1f}  {name}"
+        )
+    return '\n'.join(lines)
+
+
+def _run_child(real: bool):
+    if not real:
+        install_stubs()
+    import main as app_main
+    app_main.main()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='起動時間（メインループ到達まで）のベンチマーク')
+    parser.add_argument('--runs', type=int, default=5, help='起動回数')
+    parser.add_argument('--real', action='store_true', help='音声・キーボードをスタブに置き換えない')
+    parser.add_argument('--json', action='store_true', help='結果をJSONで出力')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _run_child(args.real)
+        return 0
+
+    traces = [run_once(args.real) for _ in range(args.runs)]
+    summary = summarize(traces)
+    print(json.dumps(summary, ensure_ascii=False, indent=2) if args.json else format_summary(summary, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+import argparse
+import email.parser
+import email.policy
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPTION_PATH = '/audio/transcriptions'
+DEFAULT_TEXT = 'これはテスト用の文字起こし結果です。'
+
+LatencySampler = Callable[[random.Random], float]
+
+
+def parse_latency(spec: str) -> LatencySampler:
+    """遅延分布の指定を解析
+
+    fixed:秒 / uniform:最小,最大 / normal:平均,標準偏差 / lognormal:中央値,sigma
+    """
+    kind, _, params = spec.partition(':')
+    values = [float(value) for value in params.split(',') if value.strip()] if params else []
+    kind = kind.strip().lower()
+
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'normal' and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == 'lognormal' and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"無効な遅延分布の指定です: {spec}")
+
+
+class MockGroqServer:
+    """Groqの文字起こしAPI（/openai/v1/audio/transcriptions）を模擬するローカルHTTPサーバー
+
+    応答遅延の分布、429/500/タイムアウトの注入、同時処理数と毎秒リクエスト数の上限を設定できる
+    """
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            latency: str = 'fixed:0',
+            error_429_rate: float = 0.0,
+            error_500_rate: float = 0.0,
+            timeout_rate: float = 0.0,
+            hang_seconds: float = 30.0,
+            max_concurrent: Optional[int] = None,
+            requests_per_second: Optional[float] = None,
+            text: str = DEFAULT_TEXT,
+            seed: int = 0
+    ):
+        self.host = host
+        self.port = port
+        self.latency = parse_latency(latency)
+        self.error_429_rate = error_429_rate
+        self.error_500_rate = error_500_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.requests_per_second = requests_per_second
+        self.text = text
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._tokens = requests_per_second or 0.0
+        self._token_time = time.monotonic()
+        self._stopping = threading.Event()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.requests = 0
+        self.status_counts: Dict[int, int] = {}
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def base_url(self) -> str:
+        """Groqクライアントのbase_urlに指定するURL"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'MockGroqServer':
+        self._stopping.clear()
+        self._server = ThreadingHTTPServer((self.host, self.port), _TranscriptionHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self  # type: ignore[attr-defined]
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='MockGroqServer', daemon=True)
+        self._thread.start()
+        logger.info(f"模擬Groqサーバーを起動しました: {self.base_url}")
+        return self
+
+    def stop(self):
+        self._stopping.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(5.0)
+            self._thread = None
+
+    def __enter__(self) -> 'MockGroqServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'status_counts': dict(self.status_counts),
+                'max_active': self.max_active,
+            }
+
+    def _record_status(self, status: int):
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def _take_token(self) -> bool:
+        """毎秒リクエスト数の上限（トークンバケット）"""
+        if not self.requests_per_second:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.requests_per_second,
+                self._tokens + (now - self._token_time) * self.requests_per_second
+            )
+            self._token_time = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _draw(self):
+        with self._lock:
+            self.requests += 1
+            roll = self._rng.random()
+            delay = self.latency(self._rng)
+        if roll < self.timeout_rate:
+            return 'timeout', delay
+        roll -= self.timeout_rate
+        if roll < self.error_429_rate:
+            return 429, delay
+        roll -= self.error_429_rate
+        if roll < self.error_500_rate:
+            return 500, delay
+        return 200, delay
+
+    def _enter(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _leave(self):
+        with self._lock:
+            self.active -= 1
+
+
+class _TranscriptionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def mock(self) -> MockGroqServer:
+        return self.server.mock  # type: ignore[attr-defined]
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not self.path.rstrip('/').endswith(TRANSCRIPTION_PATH):
+            self._send_json(404, {'error': {'message': f'Unknown path: {self.path}', 'type': 'invalid_request_error'}})
+            return
+
+        if not self.mock._take_token():
+            self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'rate_limit_error'}},
+                            {'retry-after': '1'})
+            return
+
+        fields = _parse_multipart(self.headers.get('Content-Type', ''), body)
+        if 'file' not in fields:
+            self._send_json(400, {'error': {'message': 'file is required', 'type': 'invalid_request_error'}})
+            return
+
+        outcome, delay = self.mock._draw()
+        slots = self.mock._slots
+        if slots is not None:
+            slots.acquire()
+        self.mock._enter()
+        try:
+            if outcome == 'timeout':
+                # 応答せずに待ち続け、クライアント側のタイムアウトを発生させる
+                self.mock._stopping.wait(self.mock.hang_seconds)
+                self.mock._record_status(0)
+                self.close_connection = True
+                return
+            self.mock._stopping.wait(delay)
+        finally:
+            self.mock._leave()
+            if slots is not None:
+                slots.release()
+
+        if outcome == 429:
+            self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'rate_limit_error'}},
+                            {'retry-after': '0'})
+        elif outcome == 500:
+            self._send_json(500, {'error': {'message': 'Internal server error', 'type': 'internal_server_error'}})
+        else:
+            self._send_transcription(fields.get('response_format', 'json'))
+
+    def _send_transcription(self, response_format: str):
+        text = self.mock.text
+        if response_format == 'text':
+            self._send(200, text.encode('utf-8'), 'text/plain; charset=utf-8')
+        elif response_format == 'verbose_json':
+            self._send_json(200, {'text': text, 'segments': [], 'x_groq': {'id': 'mock'}})
+        else:
+            self._send_json(200, {'text': text, 'x_groq': {'id': 'mock'}})
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json', headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.mock._record_status(status)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Dict[str, str]:
+    """multipart/form-dataのフィールド名と値（ファイルはファイル名）を返す"""
+    if not content_type.startswith('multipart/form-data'):
+        return {}
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode('latin-1') + body
+    )
+    fields: Dict[str, str] = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        if not name:
+            continue
+        filename = part.get_filename()
+        if filename is not None:
+            fields[name] = filename
+        else:
+            fields[name] = part.get_content().strip() if part.get_content_maintype() == 'text' else ''
+    return fields
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Groq文字起こしAPIの模擬サーバー')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default='lognormal:0.4,0.3',
+                        help='応答遅延の分布（fixed:秒, uniform:最小,最大, normal:平均,標準偏差, lognormal:中央値,sigma）')
+    parser.add_argument('--error-429', type=float, default=0.0, help='429を返す割合')
+    parser.add_argument('--error-500', type=float, default=0.0, help='500を返す割合')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='応答しない割合')
+    parser.add_argument('--max-concurrent', type=int, help='同時処理数の上限')
+    parser.add_argument('--rps', type=float, help='毎秒リクエスト数の上限（超過時は429）')
+    parser.add_argument('--text', default=DEFAULT_TEXT, help='返す文字起こし結果')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockGroqServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_429_rate=args.error_429,
+        error_500_rate=args.error_500,
+        timeout_rate=args.timeout_rate,
+        max_concurrent=args.max_concurrent,
+        requests_per_second=args.rps,
+        text=args.text,
+    ).start()
+    print(f"GROQ_BASE_URL={server.base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats(), ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 起動の段階ごとに読み込むモジュール（main.pyの段階的な起動に対応）
+STAGES = {
+    'ウィンドウ表示まで': ('main',),
+    'バックグラウンド読み込み完了まで': ('main', 'app.main_window', 'pyaudio', 'pyperclip', 'keyboard'),
+}
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """python -X importtime の出力を解析"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+def run_importtime(modules: Sequence[str], python: str = sys.executable) -> List[ImportRecord]:
+    """新しいプロセスでモジュールを読み込み、読み込み時間を取得"""
+    code = '; '.join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+    )
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or [''])[-1]
+        raise RuntimeError(f"モジュールの読み込みに失敗しました: {last_line}")
+    return parse_importtime(result.stderr)
+
+
+def package_totals(records: Sequence[ImportRecord]) -> Dict[str, int]:
+    """トップレベルのパッケージごとの読み込み時間（自身の時間の合計、マイクロ秒）"""
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.module.split('.')[0]] += record.self_us
+    return dict(totals)
+
+
+def format_report(stages: Dict[str, List[ImportRecord]], top: int = 15) -> str:
+    lines = []
+    for name, records in stages.items():
+        total_ms = sum(record.self_us for record in records) / 1000
+        lines.append(f"== {name}: {total_ms:.1f}ms（{len(records)}モジュール）")
+        totals = sorted(package_totals(records).items(), key=lambda item: item[1], reverse=True)
+        for package, self_us in totals[:top]:
+            lines.append(f"  {self_us / 1000:>8.1f}ms  {package}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='起動時のモジュール読み込み時間のレポート（-X importtime）')
+    parser.add_argument('--modules', help='計測するモジュール（カンマ区切り、未指定時は起動の段階ごと）')
+    parser.add_argument('--top', type=int, default=15, help='表示するパッケージ数')
+    args = parser.parse_args(argv)
+
+    if args.modules:
+        stages = {args.modules: tuple(module.strip() for module in args.modules.split(',') if module.strip())}
+    else:
+        stages = STAGES
+    print(format_report({name: run_importtime(modules) for name, modules in stages.items()}, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,91 @@
 import configparser
 import logging
+import math
+import operator
 import os
+import threading
 import wave
+from array import array
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Mapping, NamedTuple, Tuple, Optional, Union
 
-import pyaudio
+from service.capture_process import CaptureProcess
+from service.frame_store import SpillingFrameStore
+from service.recording_history import get_recording_history
+from service.wav_stream_writer import StreamingWavWriter
+from utils.config_manager import get_config_value
+from utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import pyaudio
+else:
+    pyaudio = lazy_import('pyaudio')
+
+SegmentCallback = Callable[[List[bytes], int], None]
+
+CAPTURE_MODES = ('blocking', 'callback', 'process')
+FRAME_STORAGES = ('memory', 'spill')
+
+Frames = Union[List[bytes], SpillingFrameStore]
+
+
+def chunk_rms(data: bytes) -> float:
+    """16bit PCMのチャンクの二乗平均平方根"""
+    samples = array('h')
+    samples.frombytes(data[:len(data) - len(data) % 2])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+
+class AudioLevel(NamedTuple):
+    duration: float
+    rms: float
+    peak: int
+
+
+def measure_frames(frames: Iterable[bytes], sample_rate: int, channels: int = 1) -> AudioLevel:
+    """16bit PCMのフレーム全体の長さ・RMS・ピーク（フレームごとに array で集計し、全体を結合しない）"""
+    count = 0
+    squares = 0
+    peak = 0
+    for data in frames:
+        samples = array('h')
+        samples.frombytes(data[:len(data) - len(data) % 2])
+        if not samples:
+            continue
+        count += len(samples)
+        squares += sum(map(operator.mul, samples, samples))
+        peak = max(peak, max(samples), -min(samples))
+    if not count:
+        return AudioLevel(0.0, 0.0, 0)
+    return AudioLevel(count / channels / sample_rate, math.sqrt(squares / count), peak)
+
+
+class CaptureMetrics:
+    """1回の録音のキャプチャ統計（CHUNK・バッファサイズの調整用）"""
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.chunks = 0
+        self.overflows = 0
+        self.dropped_frames = 0
+
+    @property
+    def dropped_seconds(self) -> float:
+        return self.dropped_frames / self.sample_rate if self.sample_rate else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'chunks': self.chunks,
+            'overflows': self.overflows,
+            'dropped_frames': self.dropped_frames,
+            'dropped_seconds': self.dropped_seconds,
+        }
+
+    def summary(self) -> str:
+        return (f"チャンク数={self.chunks}, オーバーフロー={self.overflows}, "
+                f"欠落={self.dropped_frames}フレーム（{self.dropped_seconds:.3f}秒、無音で補完）")
 
 
 class AudioRecorder:
@@ -14,33 +94,238 @@ class AudioRecorder:
         self.channels = int(config['AUDIO']['CHANNELS'])
         self.chunk = int(config['AUDIO']['CHUNK'])
         self.temp_dir = config['PATHS']['TEMP_DIR']
-        self.frames: List[bytes] = []
+        self.frames: Frames = []
         self.is_recording = False
-        self.p: Optional[pyaudio.PyAudio] = None
-        self.stream: Optional[pyaudio.Stream] = None
+        self.p: Optional['pyaudio.PyAudio'] = None
+        self.stream: Optional['pyaudio.Stream'] = None
+
+        # callback: PyAudioのコールバックで確保済みのバッファへ直接書き込む（録音スレッドは待つだけ）
+        self.capture_mode = str(get_config_value(config, 'AUDIO', 'capture_mode', 'blocking')).lower()
+        if self.capture_mode not in CAPTURE_MODES:
+            logging.getLogger(__name__).warning(f"不明な録音方式のため blocking を使用します: {self.capture_mode}")
+            self.capture_mode = 'blocking'
+        buffer_seconds = get_config_value(config, 'RECORDING', 'auto_stop_timer', 60) + 5
+        self._buffer_bytes = int(buffer_seconds * self.sample_rate * self.channels * 2)
+        self._capture_view: Optional[memoryview] = None
+        self._write_pos = 0
+        self._read_pos = 0
+        self._drain_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._next_adc_time: Optional[float] = None
+
+        self.metrics = CaptureMetrics(self.sample_rate)
+
+        # process: 別プロセスで入力し、共有メモリのリングバッファから受け取る
+        self._capture_process: Optional[CaptureProcess] = None
+        self._using_process = False
+        self._process_pos = 0
+        self._process_overflows = 0
+        self._process_dropped = 0
+        self._process_failures = 0
+        self._pull_lock = threading.Lock()
+
+        # 待機中も入力を続け、直近 preroll_ms の音声を録音の先頭に加える（callback 方式のみ）
+        self.preroll_ms = get_config_value(config, 'AUDIO', 'preroll_ms', 0)
+        if self.preroll_ms and self.capture_mode != 'callback':
+            logging.getLogger(__name__).warning("プリロールは capture_mode = callback の場合のみ有効です")
+            self.preroll_ms = 0
+        # 待機中も録音バッファへ書き続け、録音開始時は直近 preroll 分の位置から取り出す（コピーしない）
+        self._preroll_bytes = int(self.preroll_ms * self.sample_rate / 1000) * self.channels * 2
+        self._buffer_bytes = max(self._buffer_bytes, self._preroll_bytes * 2)
+        self._standby_from = 0
+        self._drain_limit: Optional[int] = None
+        self._standby_lock = threading.Lock()
+        self.is_standby = False
+
+        # 録音中にWAVファイルへ逐次書き込む（停止時には保存済み、異常終了時も途中まで残る）
+        self.stream_to_disk = get_config_value(config, 'RECORDING', 'stream_to_disk', False)
+        self._writer: Optional[StreamingWavWriter] = None
+        self._saved_file: Optional[str] = None
+
+        # spill: 直近 spill_memory_seconds 分を超えたフレームを一時ファイルへ退避し、録音バッファも固定長で使い回す
+        self.frame_storage = str(get_config_value(config, 'RECORDING', 'frame_storage', 'memory')).lower()
+        if self.frame_storage not in FRAME_STORAGES:
+            logging.getLogger(__name__).warning(f"不明なフレームの保持方式のため memory を使用します: {self.frame_storage}")
+            self.frame_storage = 'memory'
+        self.spill_memory_seconds = get_config_value(config, 'RECORDING', 'spill_memory_seconds', 30.0)
+        self._capture_ring = self.frame_storage == 'spill'
+
+        # 区切り録音（セグメントごとにコールバックへ渡す）
+        self.segment_callback: Optional[SegmentCallback] = None
+        self.segment_start = 0
+        self.segment_min_seconds = get_config_value(config, 'RECORDING', 'segment_min_seconds', 2.0)
+        self.segment_max_seconds = get_config_value(config, 'RECORDING', 'segment_max_seconds', 15.0)
+        self.segment_silence_ms = get_config_value(config, 'RECORDING', 'segment_silence_ms', 600)
+        self.silence_threshold = get_config_value(config, 'RECORDING', 'silence_threshold', 500.0)
+        self._silent_chunks = 0
 
         os.makedirs(self.temp_dir, exist_ok=True)
 
         self.logger = logging.getLogger(__name__)
 
+    def set_segment_callback(self, callback: Optional[SegmentCallback]):
+        """無音または最大長で区切ったセグメントを録音中に受け取るコールバックを設定"""
+        self.segment_callback = callback
+
+    def start_standby(self) -> bool:
+        """プリロール用の待機入力を開始（プリロールが無効なら何もしない）"""
+        if not self.preroll_ms or self.is_standby or self.is_recording:
+            return False
+        try:
+            self.p = pyaudio.PyAudio()
+            self._reset_capture_buffer()
+            with self._standby_lock:
+                self._standby_from = 0
+                self._drain_limit = 0
+                self.is_standby = True
+            self.stream = self._open_callback_stream()
+            self.logger.info(f"プリロール用の待機入力を開始しました: {self.preroll_ms}ms")
+            return True
+        except Exception as e:
+            self.is_standby = False
+            self.logger.error(f"待機入力の開始中にエラーが発生しました: {e}")
+            return False
+
+    def close(self):
+        """待機入力・録音プロセスを終了してデバイスを解放"""
+        if self._capture_process is not None and not self.is_recording:
+            self._capture_process.stop()
+            self._capture_process = None
+        if not self.is_standby:
+            return
+        self.is_standby = False
+        if not self.is_recording:
+            self._close_stream()
+
+    def _open_callback_stream(self) -> 'pyaudio.Stream':
+        p = self.p
+        if p is None:
+            raise RuntimeError("PyAudioが初期化されていません")
+        return p.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            frames_per_buffer=self.chunk,
+            stream_callback=self._on_audio,
+        )
+
+    def _new_frames(self) -> Frames:
+        if self.frame_storage == 'spill':
+            memory_bytes = int(self.spill_memory_seconds * self.sample_rate) * self.channels * 2
+            return SpillingFrameStore(self.temp_dir, memory_bytes)
+        return []
+
     def start_recording(self):
+        self.frames = self._new_frames()
+        self.segment_start = 0
+        self._silent_chunks = 0
+        self.metrics = CaptureMetrics(self.sample_rate)
+        self._open_stream_file()
+        if self.is_standby and self.stream is not None:
+            self._start_from_standby()
+            return
+
+        if self.capture_mode == 'process':
+            if self._start_process_capture():
+                return
+            self.logger.warning("録音プロセスを使えないため、この録音はコールバック方式で入力します")
+
         self.is_recording = True
-        self.frames = []
+        # 前回の録音で閉じたストリームを残さない（開けなければ録音スレッドがエラーにする）
+        self.stream = None
         try:
-            self.p = pyaudio.PyAudio()
-            self.stream = self.p.open(
-                format=pyaudio.paInt16,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk,
-            )
+            p = self.p = pyaudio.PyAudio()
+            if self.capture_mode in ('callback', 'process'):
+                self._reset_capture_buffer()
+                self.stream = self._open_callback_stream()
+            else:
+                self.stream = p.open(
+                    format=pyaudio.paInt16,
+                    channels=self.channels,
+                    rate=self.sample_rate,
+                    input=True,
+                    frames_per_buffer=self.chunk,
+                )
             self.logger.info("音声入力を開始しました。")
         except Exception as e:
             self.logger.error(f"音声入力の開始中に予期せぬエラーが発生しました: {e}")
 
-    def stop_recording(self) -> Tuple[List[bytes], int]:
+    def _start_from_standby(self):
+        # 待機中のストリームをそのまま使い、読み込み位置を直近 preroll 分だけ戻す（バッファ内の音声はコピーしない）
+        with self._standby_lock:
+            end = self._write_pos
+            self._read_pos = max(self._standby_from, end - self._preroll_bytes)
+            filled = end - self._read_pos
+            self._drain_limit = None
+            self._next_adc_time = None
+            self._stopped.clear()
+            self.is_recording = True
+        self.logger.info(f"音声入力を開始しました（プリロール {filled // (self.channels * 2) * 1000 // self.sample_rate}ms）。")
+
+    def _start_process_capture(self) -> bool:
+        """録音プロセスでの入力を開始する。開始できなければプロセスを片付けて False を返す"""
+        process = self._capture_process
+        try:
+            if process is None:
+                process = self._capture_process = CaptureProcess(self.sample_rate, self.channels, self.chunk)
+            self._reset_capture_buffer()
+            self._process_overflows = process.ring.overflows
+            self._process_dropped = process.ring.dropped_frames
+            self._process_failures = process.ring.failures
+            self._process_pos = process.begin()
+            self._using_process = True
+            self.is_recording = True
+            self.logger.info("音声入力を開始しました（録音プロセス）。")
+            return True
+        except Exception as e:
+            self.is_recording = False
+            self._using_process = False
+            self.logger.error(f"録音プロセスの開始中にエラーが発生しました: {e}")
+            self._capture_process = None
+            if process is not None:
+                try:
+                    process.stop()
+                except Exception as stop_error:
+                    self.logger.error(f"録音プロセスの終了中にエラーが発生しました: {stop_error}")
+            return False
+
+    def _stop_process_capture(self):
         self.is_recording = False
+        self._using_process = False
+        process = self._capture_process
+        if process is None:
+            return
+        process.pause()
+        self._pull_from_process()
+        # 録音プロセス側で数えたオーバーフローのうち、この録音の分を加える
+        self.metrics.chunks = self._write_pos // (self.chunk * self.channels * 2)
+        self.metrics.overflows += process.ring.overflows - self._process_overflows
+        self.metrics.dropped_frames += process.ring.dropped_frames - self._process_dropped
+
+    def _pull_from_process(self):
+        """共有メモリのリングバッファから新しい音声を録音バッファへ移す"""
+        process = self._capture_process
+        if process is None:
+            return
+        with self._pull_lock:
+            ring = process.ring
+            start = self._process_pos
+            position, views, lost = ring.read(start)
+            if lost:
+                self._write_capture(bytes(lost))
+            for view in views:
+                self._write_capture(view)
+            views = None
+            if lost:
+                # 読み込みが追いつかずリングバッファが一周した分は無音で補完して数える
+                self.metrics.overflows += 1
+                self.metrics.dropped_frames += lost // (self.channels * 2)
+            if ring.overwritten(start + lost):
+                self.logger.warning("録音プロセスの音声の読み込みが間に合わず、一部が上書きされました")
+            self._process_pos = position
+
+    def _close_stream(self):
         try:
             if self.stream:
                 self.stream.stop_stream()
@@ -54,16 +339,193 @@ class AudioRecorder:
         except Exception as e:
             self.logger.error(f"PyAudio終了中に予期せぬエラーが発生しました: {e}")
 
+    def stop_recording(self) -> Tuple[Frames, int]:
+        if self.is_standby:
+            # ストリームは閉じずに待機へ戻る。録音の末尾までを取り出し、以降の待機中の音声は取り出さない
+            with self._standby_lock:
+                self.is_recording = False
+                self._drain()
+                self._standby_from = self._drain_limit = self._write_pos
+        elif self._using_process:
+            self._stop_process_capture()
+        else:
+            self.is_recording = False
+            self._close_stream()
+
+        if self.capture_mode in ('callback', 'process'):
+            self._stopped.set()
+            self._drain()
+        self._finish_stream_file()
+
         self.logger.info("音声入力を停止しました。")
+        if self.metrics.overflows:
+            self.logger.warning(f"録音中に入力のオーバーフローが発生しました: {self.metrics.summary()}")
+        else:
+            self.logger.info(f"録音の統計: {self.metrics.summary()}")
         return self.frames, self.sample_rate
 
+    def _open_stream_file(self):
+        self._saved_file = None
+        if not self.stream_to_disk:
+            return
+        try:
+            writer = self._writer = StreamingWavWriter(audio_file_path(self.temp_dir), self.sample_rate, self.channels)
+        except Exception as e:
+            self._writer = None
+            self.logger.error(f"録音の逐次保存を開始できません: {e}")
+            return
+        # 異常終了しても再読み込みで途中までのファイルを選べるよう、開いた時点で履歴に追加する
+        _record_history(self.temp_dir, writer.path, 0.0, 0)
+
+    def _finish_stream_file(self):
+        writer = self._writer
+        if writer is None:
+            return
+        self._writer = None
+        path = writer.close(timeout=5.0)
+        if path:
+            _update_history(self.temp_dir, path, writer.duration, writer.bytes_written)
+            self._saved_file = path
+            self.logger.info(f"音声ファイル保存完了: {path}")
+
+    def take_saved_file(self) -> Optional[str]:
+        """逐次保存した直前の録音ファイルを返す（1回のみ）"""
+        path, self._saved_file = self._saved_file, None
+        return path
+
+    def _reset_capture_buffer(self):
+        if self._capture_view is None:
+            self._capture_view = memoryview(bytearray(self._buffer_bytes))
+        self._write_pos = 0
+        self._read_pos = 0
+        self._drain_limit = None
+        self._next_adc_time = None
+        self._stopped.clear()
+
+    def _on_audio(
+            self,
+            in_data: Optional[bytes],
+            frame_count: int,
+            time_info: Mapping[str, float],
+            status: int
+    ) -> Tuple[Optional[bytes], int]:
+        # PortAudioのスレッドから呼ばれる。書き込み位置の更新のみで受け渡す（録音中はロックを取らない）
+        if self._capture_view is None:
+            return None, pyaudio.paComplete
+        if in_data is None:
+            return None, pyaudio.paContinue
+        if not self.is_recording and self.is_standby:
+            with self._standby_lock:
+                if not self.is_recording:
+                    self._write_standby(in_data)
+                    return None, pyaudio.paContinue
+        self.metrics.chunks += 1
+        if status & pyaudio.paInputOverflow:
+            self.metrics.overflows += 1
+
+        # 入力時刻が飛んでいれば欠落した分を無音で埋めて時間軸を保つ
+        adc_time = time_info.get('input_buffer_adc_time') if time_info else None
+        if adc_time and self._next_adc_time is not None:
+            missing = round((adc_time - self._next_adc_time) * self.sample_rate)
+            if missing >= frame_count:
+                self.metrics.dropped_frames += missing
+                self._write_capture(bytes(missing * self.channels * 2))
+        if adc_time:
+            self._next_adc_time = adc_time + frame_count / self.sample_rate
+
+        self._write_capture(in_data)
+        return None, pyaudio.paContinue if self.is_recording or self.is_standby else pyaudio.paComplete
+
+    def _write_standby(self, data: bytes):
+        view = self._capture_view
+        if view is None:
+            return
+        end = self._write_pos
+        if not self._capture_ring and end + len(data) > len(view):
+            # バッファの末尾に達したら直近 preroll 分だけを先頭へ移して続ける（待機中のみ。録音開始時は移さない）
+            with self._drain_lock:
+                keep = min(self._preroll_bytes, end - self._standby_from)
+                view[:keep] = view[end - keep:end]
+                self._standby_from = 0
+                self._drain_limit = self._read_pos = 0
+                self._write_pos = keep
+        self._write_capture(data)
+
+    def _write_capture(self, data: Union[bytes, memoryview]):
+        view = self._capture_view
+        if view is None:
+            return
+        start = self._write_pos
+        end = start + len(data)
+        if self._capture_ring:
+            # spill: 取り出し済みの領域を使い回すリングバッファとして書き込む（位置は累計のまま）
+            size = len(view)
+            source = memoryview(data)
+            if len(source) > size:
+                source = source[len(source) - size:]
+            pos = (end - len(source)) % size
+            first = min(size - pos, len(source))
+            view[pos:pos + first] = source[:first]
+            view[:len(source) - first] = source[first:]
+            self._write_pos = end
+            return
+        if end > len(view):
+            # 自動停止より長い録音は稀なため、容量を倍にして続ける
+            grown = memoryview(bytearray(max(end, len(view) * 2)))
+            grown[:start] = view[:start]
+            view = self._capture_view = grown
+        view[start:end] = data
+        self._write_pos = end
+
+    def _drain(self):
+        """コールバックが書き込んだ分をチャンク単位のフレームとして取り出す"""
+        with self._drain_lock:
+            # 書き込み位置を先に読む（コールバックはバッファを差し替えてから位置を進める）
+            end = self._write_pos
+            if self._drain_limit is not None:
+                end = min(end, self._drain_limit)
+            view = self._capture_view
+            if view is None or end <= self._read_pos:
+                return
+            if self._capture_ring and end - self._read_pos > len(view):
+                self.logger.warning("録音バッファの取り出しが間に合わず、一部が上書きされました")
+                self._read_pos = end - len(view)
+            chunk_bytes = self.chunk * self.channels * 2
+            writer = self._writer
+            for start in range(self._read_pos, end, chunk_bytes):
+                data = self._read_capture(view, start, min(start + chunk_bytes, end))
+                self.frames.append(data)
+                if writer is not None:
+                    writer.write(data)
+                if self.segment_callback is not None:
+                    self._check_segment(data)
+            self._read_pos = end
+
+    def _read_capture(self, view: memoryview, start: int, end: int) -> bytes:
+        if not self._capture_ring:
+            return view[start:end].tobytes()
+        size = len(view)
+        pos = start % size
+        if pos + end - start <= size:
+            return view[pos:pos + end - start].tobytes()
+        return view[pos:].tobytes() + view[:end - start - (size - pos)].tobytes()
+
     def record(self):
+        if self.capture_mode in ('callback', 'process'):
+            self._record_from_callback()
+            return
         while self.is_recording:
             try:
                 if self.stream is None:
                     raise AttributeError("ストリームが初期化されていません")
-                data = self.stream.read(self.chunk)
+                data = self._read_chunk()
                 self.frames.append(data)
+                # 停止処理が _writer を外すことがあるため、確認した参照のまま書き込む
+                writer = self._writer
+                if writer is not None:
+                    writer.write(data)
+                if self.segment_callback is not None:
+                    self._check_segment(data)
             except AttributeError:
                 self.logger.error(f"音声入力中にストリーム初期化エラーが発生しました")
                 raise
@@ -72,24 +534,151 @@ class AudioRecorder:
                 self.is_recording = False
                 break
 
+    def _read_chunk(self) -> bytes:
+        """1チャンク読み込む。入力のオーバーフローでは録音を止めず、失ったチャンクを無音で埋める"""
+        stream = self.stream
+        if stream is None:
+            raise AttributeError("ストリームが初期化されていません")
+        self.metrics.chunks += 1
+        try:
+            return stream.read(self.chunk)
+        except OSError as e:
+            if e.errno != pyaudio.paInputOverflowed:
+                raise
+        self.metrics.overflows += 1
+        self.metrics.dropped_frames += self.chunk
+        self.logger.debug("入力のオーバーフローのため1チャンクを無音で補完しました")
+        return bytes(self.chunk * self.channels * 2)
+
+    def _record_from_callback(self):
+        if self.is_recording and not self._using_process and self.stream is None:
+            # 入力を開けなかった録音は待たずにエラーにする（blocking 方式と同じく呼び出し元で通知する）
+            self.logger.error("音声入力中にストリーム初期化エラーが発生しました")
+            raise AttributeError("ストリームが初期化されていません")
+        # 区切り録音のときだけチャンクごとに取り出し、それ以外はまとめて取り出す
+        while self.is_recording:
+            interval = self.chunk / self.sample_rate if self.segment_callback is not None else 0.5
+            if self._stopped.wait(interval):
+                break
+            if self._using_process:
+                self._pull_from_process()
+                self._check_process()
+            self._drain()
+
+    def _check_process(self):
+        """録音プロセスが入力を続けているか確認する（失敗していれば録音スレッドのエラーにする）"""
+        process = self._capture_process
+        if process is None or not self.is_recording:
+            return
+        if process.ring.failures != self._process_failures:
+            self.logger.error("録音プロセスで入力を開けないか、入力中にエラーが発生しました")
+            raise RuntimeError("録音プロセスの音声入力に失敗しました")
+        if not process.is_alive:
+            self.logger.error("録音プロセスが終了しています")
+            raise RuntimeError("録音プロセスが終了しています")
+
+    def _check_segment(self, data: bytes):
+        if chunk_rms(data) < self.silence_threshold:
+            self._silent_chunks += 1
+        else:
+            self._silent_chunks = 0
+
+        chunk_seconds = self.chunk / self.sample_rate
+        segment_seconds = (len(self.frames) - self.segment_start) * chunk_seconds
+        silence_seconds = self._silent_chunks * chunk_seconds
+        if segment_seconds < self.segment_min_seconds:
+            return
+        if silence_seconds * 1000 < self.segment_silence_ms and segment_seconds < self.segment_max_seconds:
+            return
+        if self._silent_chunks >= len(self.frames) - self.segment_start:
+            # 無音のみのセグメントは送らない
+            self.segment_start = len(self.frames)
+            return
+        self.emit_segment()
+
+    def emit_segment(self):
+        """未送信のフレームを1つのセグメントとしてコールバックへ渡す"""
+        end = len(self.frames)
+        if self.segment_callback is None or end <= self.segment_start:
+            return
+        segment = self.frames[self.segment_start:end]
+        self.segment_start = end
+        self._silent_chunks = 0
+        try:
+            self.segment_callback(segment, self.sample_rate)
+        except Exception as e:
+            self.logger.error(f"セグメント処理中にエラーが発生しました: {e}")
+
+    def take_remaining_segment(self) -> List[bytes]:
+        """録音停止後、まだセグメントとして送っていないフレームを返す"""
+        remaining = self.frames[self.segment_start:]
+        self.segment_start = len(self.frames)
+        return remaining
+
+
+def release_frames(frames: Frames):
+    """使い終わった録音フレームを解放する（退避した一時ファイルと mmap を閉じる）"""
+    if isinstance(frames, SpillingFrameStore):
+        frames.close()
+
+
+def _record_history(temp_dir: str, path: str, duration: float, size: int):
+    try:
+        get_recording_history(temp_dir).append(path, duration, size)
+    except Exception as e:
+        logging.error(f"録音履歴の更新中にエラー: {str(e)}")
+
+
+def _update_history(temp_dir: str, path: str, duration: float, size: int):
+    try:
+        history = get_recording_history(temp_dir)
+        if history.update(path, duration, size) is None:
+            history.append(path, duration, size)
+    except Exception as e:
+        logging.error(f"録音履歴の更新中にエラー: {str(e)}")
+
+
+def audio_file_path(temp_dir: str, prefix: str = 'audio') -> str:
+    """一時ディレクトリ内の録音ファイルのパス（録音時刻から作成）"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(temp_dir, f"{prefix}_{timestamp}.wav")
+
+
+def save_audio(
+        frames: Iterable[bytes],
+        sample_rate: int,
+        config: configparser.ConfigParser,
+        segment: bool = False
+) -> Optional[str]:
+    """フレームを一時ディレクトリのWAVファイルへ保存する
 
-def save_audio(frames: List[bytes], sample_rate: int, config: configparser.ConfigParser) -> Optional[str]:
+    segment=True（録音途中のセグメント）は segment_*.wav として保存し、録音履歴には追加しない
+    """
     try:
         temp_dir = config['PATHS']['TEMP_DIR']
         if not os.path.exists(temp_dir):
             os.makedirs(temp_dir)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_filename = f"audio_{timestamp}.wav"
-        temp_path = os.path.join(temp_dir, temp_filename)
+        temp_path = audio_file_path(temp_dir, 'segment' if segment else 'audio')
 
         with wave.open(temp_path, "wb") as wf:
             channels = int(config['AUDIO']['CHANNELS'])
             wf.setnchannels(channels)
             wf.setsampwidth(pyaudio.PyAudio().get_sample_size(pyaudio.paInt16))
             wf.setframerate(sample_rate)
-            wf.writeframes(b"".join(frames))
+            if isinstance(frames, list):
+                data = b"".join(frames)
+                wf.writeframes(data)
+                size = len(data)
+            else:
+                # 退避したフレームは全体を結合せず1つずつ書き込む（ヘッダーはクローズ時に確定）
+                size = 0
+                for data in frames:
+                    wf.writeframesraw(data)
+                    size += len(data)
 
         logging.info(f"音声ファイル保存完了: {temp_path}")
+        if not segment:
+            _record_history(temp_dir, temp_path, size / (channels * 2 * sample_rate), size)
 
         return temp_path
 
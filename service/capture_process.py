@@ -0,0 +1,250 @@
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 共有メモリ先頭のカウンター（uint64）: 書き込み済みバイト数の累計、オーバーフロー回数、欠落フレーム数、入力エラー回数
+HEADER_SLOTS = 4
+HEADER_BYTES = HEADER_SLOTS * 8
+_TOTAL, _OVERFLOWS, _DROPPED, _FAILURES = 0, 1, 2, 3
+
+SourceFactory = Callable[[int, int, int], Any]
+
+
+class SharedAudioRing:
+    """共有メモリ上のリングバッファ（書き込みは録音プロセス、読み込みはメインプロセスの各1つ）
+
+    書き込み側はデータを書いてから累計バイト数を進めるため、読み込み側はロックなしで累計までを読める
+    """
+
+    def __init__(self, capacity: int, shm: Optional[shared_memory.SharedMemory] = None):
+        self.capacity = capacity
+        self.shm = shm or shared_memory.SharedMemory(create=True, size=HEADER_BYTES + capacity)
+        self._owner = shm is None
+        buf = self.shm.buf
+        if buf is None:
+            raise ValueError("共有メモリが閉じられています")
+        self._header = buf[:HEADER_BYTES].cast('Q')
+        self._data = buf[HEADER_BYTES:HEADER_BYTES + capacity]
+        if self._owner:
+            for slot in range(HEADER_SLOTS):
+                self._header[slot] = 0
+
+    @property
+    def total(self) -> int:
+        return self._header[_TOTAL]
+
+    @property
+    def overflows(self) -> int:
+        return self._header[_OVERFLOWS]
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._header[_DROPPED]
+
+    @property
+    def failures(self) -> int:
+        """録音プロセスで入力を開けなかった・入力中にエラーになった回数（子プロセスのログは親に届かないため）"""
+        return self._header[_FAILURES]
+
+    def add_failure(self):
+        self._header[_FAILURES] += 1
+
+    def add_overflow(self, frames: int):
+        self._header[_OVERFLOWS] += 1
+        self._header[_DROPPED] += frames
+
+    def write(self, data: bytes):
+        source = memoryview(data)
+        end = self._header[_TOTAL] + len(source)
+        if len(source) > self.capacity:
+            source = source[len(source) - self.capacity:]
+        pos = (end - len(source)) % self.capacity
+        first = min(self.capacity - pos, len(source))
+        self._data[pos:pos + first] = source[:first]
+        self._data[:len(source) - first] = source[first:]
+        self._header[_TOTAL] = end
+
+    def read(self, since: int) -> Tuple[int, List[memoryview], int]:
+        """since以降のデータを共有メモリ上のビュー（コピーなし）で返す。戻り値は (新しい位置, ビュー, 上書きで失ったバイト数)"""
+        total = self._header[_TOTAL]
+        lost = max(0, total - since - self.capacity)
+        start = since + lost
+        if total <= start:
+            return total, [], lost
+        pos = start % self.capacity
+        length = total - start
+        first = min(self.capacity - pos, length)
+        views = [self._data[pos:pos + first]]
+        if length > first:
+            views.append(self._data[:length - first])
+        return total, views, lost
+
+    def overwritten(self, since: int) -> bool:
+        """since以降を読み終える前に書き込み側に追い越されたか"""
+        return self._header[_TOTAL] - since > self.capacity
+
+    def close(self):
+        self._header.release()
+        self._data.release()
+        try:
+            self.shm.close()
+        except BufferError:
+            # fork した録音プロセスには親のビューが残っているため、解放はプロセス終了に任せる
+            pass
+        if self._owner:
+            self.shm.unlink()
+
+
+class _PyAudioSource:
+    """録音プロセス内で開くPyAudioの入力ストリーム"""
+
+    def __init__(self, sample_rate: int, channels: int, chunk: int):
+        import pyaudio
+        self._pyaudio = pyaudio
+        self.chunk = chunk
+        self._p = pyaudio.PyAudio()
+        self._stream = self._p.open(
+            format=pyaudio.paInt16,
+            channels=channels,
+            rate=sample_rate,
+            input=True,
+            frames_per_buffer=chunk,
+        )
+
+    def read(self) -> Optional[bytes]:
+        """1チャンク読み込む。オーバーフローでは None を返す"""
+        try:
+            return self._stream.read(self.chunk)
+        except OSError as e:
+            if e.errno != self._pyaudio.paInputOverflowed:
+                raise
+        return None
+
+    def close(self):
+        try:
+            self._stream.stop_stream()
+            self._stream.close()
+        finally:
+            self._p.terminate()
+
+
+def open_pyaudio_source(sample_rate: int, channels: int, chunk: int) -> _PyAudioSource:
+    return _PyAudioSource(sample_rate, channels, chunk)
+
+
+def _capture_main(shm, capacity, sample_rate, channels, chunk, active, idle, stop, source_factory):
+    # 録音プロセスのエントリーポイント。active の間だけ入力を開き、共有メモリへ書き込む
+    ring = SharedAudioRing(capacity, shm)
+    silence = bytes(chunk * channels * 2)
+    try:
+        while not stop.is_set():
+            if not active.wait(0.1):
+                continue
+            idle.clear()
+            try:
+                source = source_factory(sample_rate, channels, chunk)
+            except Exception as e:
+                logger.error(f"録音プロセスで入力を開けません: {e}")
+                ring.add_failure()
+                active.clear()
+                idle.set()
+                continue
+            try:
+                while active.is_set() and not stop.is_set():
+                    data = source.read()
+                    if data is None:
+                        ring.add_overflow(chunk)
+                        data = silence
+                    ring.write(data)
+            except Exception as e:
+                logger.error(f"録音プロセスの入力中にエラー: {e}")
+                ring.add_failure()
+                active.clear()
+            finally:
+                source.close()
+                idle.set()
+    finally:
+        ring.close()
+
+
+class CaptureProcess:
+    """別プロセスで音声を入力し、共有メモリのリングバッファで受け渡す
+
+    メインプロセスのGILやUIの停止の影響を受けずに入力を続ける。プロセスは録音のたびに作らず、
+    最初の録音で起動して終了まで再利用する（入力デバイスは録音中のみ開く）
+    """
+
+    def __init__(
+            self,
+            sample_rate: int,
+            channels: int,
+            chunk: int,
+            ring_seconds: float = 10.0,
+            source_factory: SourceFactory = open_pyaudio_source
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.chunk = chunk
+        self.frame_bytes = channels * 2
+        self.ring = SharedAudioRing(int(ring_seconds * sample_rate) * self.frame_bytes)
+        self.source_factory = source_factory
+        self._active = multiprocessing.Event()
+        self._idle = multiprocessing.Event()
+        self._stop = multiprocessing.Event()
+        self._idle.set()
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        if self.is_alive:
+            return
+        self._stop.clear()
+        self._process = multiprocessing.Process(
+            target=_capture_main,
+            args=(self.ring.shm, self.ring.capacity, self.sample_rate, self.channels, self.chunk,
+                  self._active, self._idle, self._stop, self.source_factory),
+            name='AudioCapture',
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(f"録音プロセスを開始しました: pid={self._process.pid}")
+
+    def begin(self) -> int:
+        """入力を開始し、この録音の読み込み開始位置を返す"""
+        self.start()
+        position = self.ring.total
+        self._idle.clear()
+        self._active.set()
+        return position
+
+    def pause(self, timeout: float = 1.0) -> bool:
+        """入力を止め、録音プロセスがデバイスを閉じるまで待つ"""
+        self._active.clear()
+        if not self.is_alive:
+            return True
+        if not self._idle.wait(timeout):
+            logger.warning("録音プロセスの入力停止がタイムアウトしました")
+            return False
+        return True
+
+    def stop(self, timeout: float = 2.0):
+        self._active.clear()
+        self._stop.set()
+        process = self._process
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning("録音プロセスの終了がタイムアウトしたため強制終了します")
+                process.terminate()
+                process.join(timeout)
+            self._process = None
+        try:
+            self.ring.close()
+        except Exception as e:
+            logger.error(f"共有メモリの解放中にエラー: {e}")
@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from utils.lazy_import import lazy_import
+
+keyboard = lazy_import('keyboard')
+pyperclip = lazy_import('pyperclip')
+
+logger = logging.getLogger(__name__)
+
+
+class ClipboardBackend(ABC):
+    """クリップボードと貼り付けキー送信のインターフェース"""
+
+    @abstractmethod
+    def copy(self, text: str) -> None:
+        pass
+
+    @abstractmethod
+    def paste(self) -> str:
+        pass
+
+    @abstractmethod
+    def send_paste(self) -> None:
+        pass
+
+
+class SystemClipboardBackend(ClipboardBackend):
+    """pyperclipとkeyboardによるOSクリップボード"""
+
+    def copy(self, text: str) -> None:
+        pyperclip.copy(text)
+
+    def paste(self) -> str:
+        return pyperclip.paste()
+
+    def send_paste(self) -> None:
+        keyboard.send('ctrl+v')
+
+
+class InMemoryClipboardBackend(ClipboardBackend):
+    """テスト用のメモリ上のクリップボード
+
+    visible_after_reads を指定すると、コピー内容はその回数だけ読み取った後に反映される
+    """
+
+    def __init__(self, initial_text: str = '', visible_after_reads: int = 0):
+        self.text = initial_text
+        self.visible_after_reads = visible_after_reads
+        self.pasted_texts: List[str] = []
+        self.copy_count = 0
+        self.read_count = 0
+        self._pending: Optional[str] = None
+        self._pending_reads = 0
+        self._lock = threading.Lock()
+
+    def copy(self, text: str) -> None:
+        with self._lock:
+            self.copy_count += 1
+            if self.visible_after_reads > 0:
+                self._pending = text
+                self._pending_reads = self.visible_after_reads
+            else:
+                self.text = text
+
+    def paste(self) -> str:
+        with self._lock:
+            self.read_count += 1
+            if self._pending is not None:
+                self._pending_reads -= 1
+                if self._pending_reads < 0:
+                    self.text = self._pending
+                    self._pending = None
+            return self.text
+
+    def send_paste(self) -> None:
+        with self._lock:
+            self.pasted_texts.append(self.text)
+
+
+class AdaptiveDelay:
+    """実測値の指数移動平均から待ち時間を決める"""
+
+    def __init__(
+            self,
+            initial: float,
+            minimum: float = 0.0,
+            maximum: float = 1.0,
+            margin: float = 1.5,
+            smoothing: float = 0.3
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.margin = margin
+        self.smoothing = smoothing
+        self.average = initial
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, observed: float):
+        with self._lock:
+            if self.samples == 0:
+                self.average = observed
+            else:
+                self.average += self.smoothing * (observed - self.average)
+            self.samples += 1
+
+    @property
+    def value(self) -> float:
+        return min(max(self.average * self.margin, self.minimum), self.maximum)
+
+
+def wait_for_clipboard(
+        backend: ClipboardBackend,
+        expected: str,
+        timeout: float,
+        poll_interval: float = 0.005
+) -> Optional[float]:
+    """クリップボードの内容が一致するまでポーリングし、要した秒数を返す（タイムアウト時はNone）"""
+    start = time.monotonic()
+    while True:
+        if backend.paste() == expected:
+            return time.monotonic() - start
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            return None
+        time.sleep(min(poll_interval, timeout - elapsed))
+
+
+_backend: ClipboardBackend = SystemClipboardBackend()
+
+
+def get_clipboard_backend() -> ClipboardBackend:
+    return _backend
+
+
+def set_clipboard_backend(backend: ClipboardBackend) -> ClipboardBackend:
+    """クリップボードのバックエンドを差し替え、以前のバックエンドを返す"""
+    global _backend
+    previous = _backend
+    _backend = backend
+    logger.debug(f"クリップボードバックエンドを変更しました: {type(backend).__name__}")
+    return previous
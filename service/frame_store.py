@@ -0,0 +1,115 @@
+import logging
+import mmap
+import tempfile
+import threading
+from array import array
+from collections import deque
+from typing import IO, Deque, Iterator, List, Optional, Union, overload
+
+logger = logging.getLogger(__name__)
+
+
+class SpillingFrameStore:
+    """録音フレームのリストの代わりに使うストア
+
+    直近 memory_bytes 分のフレームだけをメモリに置き、それより古いフレームは一時ディレクトリのファイルへ退避して
+    mmap で読む。録音が長くなってもメモリ使用量は増えない（退避ファイルは閉じると削除される）
+    """
+
+    def __init__(self, temp_dir: str, memory_bytes: int):
+        self.temp_dir = temp_dir
+        self.memory_bytes = memory_bytes
+        self._recent: Deque[bytes] = deque()
+        self._recent_bytes = 0
+        # 退避したフレームのファイル内の終了位置
+        self._ends = array('Q')
+        self._file: Optional[IO[bytes]] = None
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    @property
+    def spilled_bytes(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.spilled_bytes + self._recent_bytes
+
+    def __len__(self) -> int:
+        return len(self._ends) + len(self._recent)
+
+    def __repr__(self) -> str:
+        return f"SpillingFrameStore(frames={len(self)}, spilled={self.spilled_bytes}, recent={self._recent_bytes})"
+
+    def append(self, data: bytes):
+        with self._lock:
+            self._recent.append(data)
+            self._recent_bytes += len(data)
+            while self._recent_bytes > self.memory_bytes and len(self._recent) > 1:
+                self._spill(self._recent.popleft())
+
+    def _spill(self, data: bytes):
+        file = self._file
+        if file is None:
+            file = self._file = tempfile.TemporaryFile(prefix='frames_', suffix='.pcm', dir=self.temp_dir)
+            logger.debug(f"録音フレームの退避を開始しました: {self.temp_dir}")
+        end = self.spilled_bytes + len(data)
+        file.write(data)
+        self._ends.append(end)
+        self._recent_bytes -= len(data)
+
+    def _mapped(self) -> mmap.mmap:
+        # 退避ファイルが前回のマップより伸びていれば貼り直す（読み出しはコピーのためビューは残らない）
+        mapped = self._map
+        if mapped is None or len(mapped) < self.spilled_bytes:
+            file = self._file
+            assert file is not None, "退避ファイルがありません"
+            file.flush()
+            if mapped is not None:
+                mapped.close()
+            mapped = self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return mapped
+
+    def _get(self, index: int) -> bytes:
+        spilled = len(self._ends)
+        if index >= spilled:
+            return self._recent[index - spilled]
+        start = self._ends[index - 1] if index else 0
+        return self._mapped()[start:self._ends[index]]
+
+    @overload
+    def __getitem__(self, index: int) -> bytes: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[bytes]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, List[bytes]]:
+        with self._lock:
+            if isinstance(index, slice):
+                return [self._get(i) for i in range(*index.indices(len(self)))]
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("フレームの番号が範囲外です")
+            return self._get(index)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """フレームを1つずつ返す（退避分は mmap から読むため全体をメモリに載せない）"""
+        for index in range(len(self)):
+            with self._lock:
+                if index >= len(self):
+                    return
+                data = self._get(index)
+            yield data
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._ends = array('Q')
+            self._recent.clear()
+            self._recent_bytes = 0
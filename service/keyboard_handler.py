@@ -1,8 +1,14 @@
 import configparser
 import logging
 import tkinter as tk
-from typing import Callable
-import keyboard
+from typing import TYPE_CHECKING, Callable
+
+from utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import keyboard
+else:
+    keyboard = lazy_import('keyboard')
 
 
 class KeyboardHandler:
@@ -49,16 +55,16 @@ class KeyboardHandler:
             logging.error(f'キーボードリスナーの設定中にエラーが発生しました: {str(e)}')
             raise
 
-    def _handle_toggle_recording_key(self, _: keyboard.KeyboardEvent):
+    def _handle_toggle_recording_key(self, _: 'keyboard.KeyboardEvent'):
         self.master.after(0, self._toggle_recording)
 
-    def _handle_exit_key(self, _: keyboard.KeyboardEvent):
+    def _handle_exit_key(self, _: 'keyboard.KeyboardEvent'):
         self.master.after(0, self._close_application)
 
-    def _handle_toggle_punctuation_key(self, _: keyboard.KeyboardEvent):
+    def _handle_toggle_punctuation_key(self, _: 'keyboard.KeyboardEvent'):
         self.master.after(0, self._toggle_punctuation)
 
-    def _handle_reload_audio_key(self, _: keyboard.KeyboardEvent):
+    def _handle_reload_audio_key(self, _: 'keyboard.KeyboardEvent'):
         self.master.after(0, self._reload_audio)
 
     @staticmethod
@@ -0,0 +1,98 @@
+import configparser
+import ctypes
+import logging
+import sys
+import time
+from typing import List, Optional
+
+from utils.config_manager import get_config_value
+from utils.lazy_import import lazy_import
+
+keyboard = lazy_import('keyboard')
+
+logger = logging.getLogger(__name__)
+
+CLIPBOARD = 'clipboard'
+KEYSTROKE = 'keystroke'
+OUTPUT_MODES = (CLIPBOARD, KEYSTROKE)
+
+
+def get_foreground_window_title() -> str:
+    """前面ウィンドウのタイトルを取得（Windows以外や取得失敗時は空文字）"""
+    if sys.platform != 'win32':
+        return ''
+    try:
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        hwnd = user32.GetForegroundWindow()
+        length = user32.GetWindowTextLengthW(hwnd)
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(hwnd, buffer, length + 1)
+        return buffer.value
+    except Exception as e:
+        logger.debug(f"前面ウィンドウのタイトル取得に失敗: {str(e)}")
+        return ''
+
+
+def _parse_window_list(value: str) -> List[str]:
+    return [title.strip().lower() for title in value.split(',') if title.strip()]
+
+
+def select_output_mode(config: configparser.ConfigParser, window_title: Optional[str] = None) -> str:
+    """設定と前面ウィンドウから出力方式を決定
+
+    keystroke_windows / clipboard_windows に前面ウィンドウのタイトルの一部が含まれる場合はそちらを優先
+    """
+    mode = get_config_value(config, 'OUTPUT', 'mode', CLIPBOARD).strip().lower()
+    if mode not in OUTPUT_MODES:
+        logger.warning(f"不明な出力方式です: {mode}")
+        mode = CLIPBOARD
+
+    keystroke_windows = _parse_window_list(get_config_value(config, 'OUTPUT', 'keystroke_windows', ''))
+    clipboard_windows = _parse_window_list(get_config_value(config, 'OUTPUT', 'clipboard_windows', ''))
+    if not keystroke_windows and not clipboard_windows:
+        return mode
+
+    title = (get_foreground_window_title() if window_title is None else window_title).lower()
+    if not title:
+        return mode
+    if any(pattern in title for pattern in keystroke_windows):
+        return KEYSTROKE
+    if any(pattern in title for pattern in clipboard_windows):
+        return CLIPBOARD
+    return mode
+
+
+def split_chunks(text: str, chunk_size: int) -> List[str]:
+    if chunk_size <= 0:
+        return [text]
+    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+def type_text(text: str, chunk_size: int = 32, chunk_interval: float = 0.01, char_delay: float = 0.0) -> bool:
+    """クリップボードを使わずにキー入力でテキストを出力
+
+    入力先の取りこぼしを防ぐため、chunk_size文字ごとにchunk_interval秒待機する
+    """
+    if not text:
+        return False
+
+    try:
+        chunks = split_chunks(text, chunk_size)
+        for index, chunk in enumerate(chunks):
+            if index > 0 and chunk_interval > 0:
+                time.sleep(chunk_interval)
+            keyboard.write(chunk, delay=char_delay)
+        logger.info(f"キー入力で出力完了: {len(text)}文字")
+        return True
+    except Exception as e:
+        logger.error(f"キー入力での出力に失敗: {str(e)}")
+        return False
+
+
+def type_text_from_config(text: str, config: configparser.ConfigParser) -> bool:
+    return type_text(
+        text,
+        chunk_size=get_config_value(config, 'OUTPUT', 'keystroke_chunk_size', 32),
+        chunk_interval=get_config_value(config, 'OUTPUT', 'keystroke_chunk_interval', 0.01),
+        char_delay=get_config_value(config, 'OUTPUT', 'keystroke_char_delay', 0.0),
+    )
@@ -0,0 +1,118 @@
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class OutputWorker:
+    """クリップボード操作と貼り付けを1つの常駐スレッドで投入順に実行する
+
+    各ジョブはlockを保持したまま実行され、結果はFutureで返す。schedule で追加したジョブは
+    期限までワーカーのスレッド内で待ち（ジョブごとにタイマーのスレッドは作らない）、停止時に未実行なら取り消す
+    """
+
+    def __init__(self, lock: Optional[threading.Lock] = None, name: str = 'OutputWorker'):
+        self.lock = lock or threading.Lock()
+        self.name = name
+        self._queue: 'queue.Queue[Optional[tuple]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._state_lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._state_lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            logger.debug(f"{self.name} を開始しました")
+
+    def submit(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            callback: Optional[Callable[[Future], None]] = None
+    ) -> Future:
+        """ジョブを末尾に追加（callbackは完了時にワーカースレッドで呼ばれる）"""
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self.start()
+        self._queue.put((future, func, args, None))
+        return future
+
+    def schedule(self, delay: float, func: Callable[..., Any], *args: Any) -> Future:
+        """delay秒後に実行するジョブを追加（取り消しはFutureのcancel）"""
+        future: Future = Future()
+        self.start()
+        self._queue.put((future, func, args, time.monotonic() + delay))
+        return future
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        # 期限待ちのジョブ（期限, 追加順, ジョブ）
+        scheduled: List[Tuple[float, int, tuple]] = []
+        order = itertools.count()
+        while True:
+            while scheduled and scheduled[0][0] <= time.monotonic():
+                self._execute(heapq.heappop(scheduled)[2])
+            timeout = max(0.0, scheduled[0][0] - time.monotonic()) if scheduled else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            try:
+                if item is None:
+                    for _, _, (future, _, _, _) in scheduled:
+                        future.cancel()
+                    return
+                due = item[3]
+                if due is not None and due > time.monotonic():
+                    heapq.heappush(scheduled, (due, next(order), item))
+                    continue
+                self._execute(item)
+            finally:
+                self._queue.task_done()
+
+    def _execute(self, item: tuple):
+        future, func, args, _ = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            with self.lock:
+                result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """キュー内のジョブを処理してから停止し、停止できたかを返す（期限待ちのジョブは取り消す）"""
+        with self._state_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return True
+            self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"{self.name} の停止がタイムアウトしました")
+            return False
+        with self._state_lock:
+            if self._thread is thread:
+                self._thread = None
+        logger.debug(f"{self.name} を停止しました")
+        if not self._queue.empty():
+            # 停止中に追加されたジョブは新しいスレッドで処理する
+            self.start()
+        return True
@@ -1,17 +1,21 @@
 import configparser
-import glob
 import logging
 import os
 import queue
 import threading
 import time
 import tkinter as tk
-from datetime import datetime, timedelta
+from concurrent.futures import Future
 from typing import Any, Callable, Dict, List, Optional
 
 from external_service.groq_api import transcribe_audio
-from service.audio_recorder import save_audio
-from service.text_processing import copy_and_paste_transcription, process_punctuation
+from service.audio_recorder import Frames, measure_frames, release_frames, save_audio
+from service.output_worker import OutputWorker
+from service.replacement_rules import Replacements, compile_replacement_rules
+from service.temp_janitor import TempFileJanitor
+from service.text_pipeline import SegmentTextBuffer, build_text_pipeline
+from service.text_processing import copy_and_paste_transcription, get_output_worker
+from service.transcription_job import STAGE_POSTPROCESSING, STAGE_TRANSCRIBING, TranscriptionJob, transcription_key
 from utils.config_manager import get_config_value
 
 
@@ -22,7 +26,7 @@ class RecordingController:
             config: configparser.ConfigParser,
             recorder: Any,
             client: Any,
-            replacements: Dict[str, str],
+            replacements: Replacements,
             ui_callbacks: Dict[str, Callable],
             notification_callback: Callable
     ):
@@ -32,6 +36,7 @@ class RecordingController:
         self.recorder = recorder
         self.client = client
         self.replacements = replacements
+        self.text_pipeline = build_text_pipeline(config, replacements)
         self.ui_callbacks = ui_callbacks
         self.show_notification = notification_callback
 
@@ -40,11 +45,32 @@ class RecordingController:
         self.paste_timer = None
         self.five_second_notification_shown: bool = False
         self.processing_thread: Optional[threading.Thread] = None
+        self.current_job: Optional[TranscriptionJob] = None
 
         self.use_punctuation: bool = get_config_value(config, 'WHISPER', 'USE_PUNCTUATION', True)
 
+        # 録音中にセグメントごとに文字起こしして出力する
+        self.live_typing: bool = get_config_value(config, 'RECORDING', 'live_typing', False)
+        self._segment_worker: Optional[OutputWorker] = None
+        self._segment_buffer: Optional[SegmentTextBuffer] = None
+
+        # 録音側で逐次保存したファイルがあれば停止後に保存し直さない
+        self.stream_to_disk: bool = get_config_value(config, 'RECORDING', 'stream_to_disk', False)
+
+        # 短すぎる・無音の録音は送信しない（0で無効）。RMSとピークの両方が下回る場合を無音とみなす
+        self.skip_min_seconds: float = get_config_value(config, 'RECORDING', 'skip_min_seconds', 0.0)
+        self.skip_max_rms: float = get_config_value(config, 'RECORDING', 'skip_max_rms', 0.0)
+        self.skip_max_peak: float = get_config_value(config, 'RECORDING', 'skip_max_peak', 0.0)
+
         self.temp_dir = config['PATHS']['TEMP_DIR']
         self.cleanup_minutes = int(config['PATHS']['CLEANUP_MINUTES'])
+        self.temp_janitor = TempFileJanitor(
+            self.temp_dir,
+            self.cleanup_minutes,
+            max_total_bytes=get_config_value(config, 'PATHS', 'cleanup_max_mb', 500) * 1024 * 1024,
+            max_files=get_config_value(config, 'PATHS', 'cleanup_max_files', 300),
+            interval=get_config_value(config, 'PATHS', 'cleanup_interval_seconds', 600.0),
+        )
 
         # スレッドセーフなUI更新用キュー
         self._ui_queue: queue.Queue = queue.Queue()
@@ -115,18 +141,10 @@ class RecordingController:
             return False
 
     def _cleanup_temp_files(self):
+        # 一時ファイルの整理はバックグラウンドで行い、呼び出し元（UIスレッド）は待たない
         try:
-            current_time = datetime.now()
-            pattern = os.path.join(self.temp_dir, "*.wav")
-
-            for file_path in glob.glob(pattern):
-                file_modified = datetime.fromtimestamp(os.path.getmtime(file_path))
-                if current_time - file_modified > timedelta(minutes=self.cleanup_minutes):
-                    try:
-                        os.remove(file_path)
-                        logging.info(f"古い音声ファイルを削除しました: {file_path}")
-                    except Exception as e:
-                        logging.error(f"ファイル削除中にエラーが発生しました: {file_path}, {e}")
+            self.temp_janitor.start()
+            self.temp_janitor.request_sweep()
         except Exception as e:
             logging.error(f"クリーンアップ処理中にエラーが発生しました: {e}")
 
@@ -154,6 +172,8 @@ class RecordingController:
             raise RuntimeError("前回の処理が完了していません")
 
         self.cancel_processing = False
+        if self.live_typing:
+            self._start_live_typing()
         self.recorder.start_recording()
         self.ui_callbacks['update_record_button'](True)
         self.ui_callbacks['update_status_label'](
@@ -218,11 +238,22 @@ class RecordingController:
             self.ui_callbacks['update_record_button'](False)
             self.ui_callbacks['update_status_label']("テキスト出力中...")
 
-            self.processing_thread = threading.Thread(
-                target=self.transcribe_audio_frames,
-                args=(frames, sample_rate),
-                daemon=False
-            )
+            if self._segment_worker is not None:
+                self.processing_thread = threading.Thread(
+                    target=self._finish_live_typing,
+                    args=(sample_rate,),
+                    daemon=False
+                )
+            else:
+                args = (frames, sample_rate)
+                audio_file = self.recorder.take_saved_file() if self.stream_to_disk else None
+                if audio_file:
+                    args = (frames, sample_rate, audio_file)
+                self.processing_thread = threading.Thread(
+                    target=self.transcribe_audio_frames,
+                    args=args,
+                    daemon=False
+                )
             self.processing_thread.start()
 
             if self._is_ui_valid():
@@ -238,9 +269,16 @@ class RecordingController:
                     f"{self.config['KEYS']['TOGGLE_RECORDING']}キーで音声入力開始/停止"
                 )
                 self.processing_thread = None
+                self.current_job = None
                 return
 
-            self.ui_callbacks['update_status_label']("テキスト出力中...")
+            job = self.current_job
+            if job is not None:
+                self.ui_callbacks['update_status_label'](
+                    f"音声ファイル処理中... ({job.stage} {int(job.elapsed)}秒)"
+                )
+            else:
+                self.ui_callbacks['update_status_label']("テキスト出力中...")
             if self._is_ui_valid():
                 self.master.after(100, self._check_process_thread, thread)
         except Exception as e:
@@ -258,34 +296,103 @@ class RecordingController:
         except Exception as e:
             logging.error(f"通知表示中にエラー: {str(e)}")
 
-    def handle_audio_file(self, event):
+    def submit_file(self, file_path: str) -> TranscriptionJob:
+        """音声ファイルの文字起こしを投入し、ジョブを返す（UIスレッドから呼ぶ）"""
+        if not os.path.exists(file_path):
+            job = TranscriptionJob(file_path)
+            job.set_exception(FileNotFoundError(f"音声ファイルが見つかりません: {file_path}"))
+            self.show_notification('エラー', '音声ファイルが見つかりません')
+            return job
+        return self.transcribe_file(file_path)
+
+    def transcribe_file(self, file_path: str) -> TranscriptionJob:
+        """音声ファイルを処理スレッドで文字起こしする（UIスレッドは通信を待たない）
+
+        同じファイル・同じ設定の文字起こしが処理中なら、新しく送信せずそのジョブを返す
+        """
+        key = self._job_key(file_path)
+        current = self.current_job
+        if key is not None and current is not None and current.key == key and not current.done():
+            logging.info(f"同じ音声ファイルを処理中のため結果を共有します: {file_path}")
+            return current
+
+        job = TranscriptionJob(file_path, key)
+        if self.processing_thread and self.processing_thread.is_alive():
+            job.set_exception(RuntimeError("前回の処理が完了していません"))
+            self.show_notification('エラー', "前回の処理が完了していません")
+            return job
+
+        self.cancel_processing = False
+        self.current_job = job
+        self.ui_callbacks['update_status_label']('音声ファイル処理中...')
+        self.processing_thread = threading.Thread(
+            target=self._run_file_job,
+            args=(job,),
+            name='FileTranscription',
+            daemon=False
+        )
+        self.processing_thread.start()
+
+        if self._is_ui_valid():
+            self.master.after(100, self._check_process_thread, self.processing_thread)
+        return job
+
+    def _job_key(self, file_path: str):
+        return transcription_key(
+            file_path,
+            get_config_value(self.config, 'WHISPER', 'MODEL', ''),
+            get_config_value(self.config, 'WHISPER', 'LANGUAGE', ''),
+            get_config_value(self.config, 'WHISPER', 'PROMPT', ''),
+            self.use_punctuation,
+        )
+
+    def cancel_current_job(self) -> bool:
+        """実行中の文字起こし（音声ファイル・録音停止後の処理）をキャンセルし、結果を出力しない"""
+        job = self.current_job
+        if job is not None:
+            cancelled = job.cancel()
+        elif self.processing_thread is not None and self.processing_thread.is_alive():
+            self.cancel_processing = True
+            cancelled = True
+        else:
+            cancelled = False
+        if cancelled and not self._is_shutting_down:
+            logging.info("利用者の操作で文字起こしをキャンセルしました")
+            self.show_notification("キャンセル", "文字起こしをキャンセルしました")
+        return cancelled
+
+    def _run_file_job(self, job: TranscriptionJob):
         try:
-            file_path = self.master.clipboard_get()
-            if not os.path.exists(file_path):
-                self.show_notification('エラー', '音声ファイルが見つかりません')
+            logging.info(f"音声ファイル処理開始: {job.source}")
+            if job.cancelled() or self.cancel_processing:
                 return
 
-            self.ui_callbacks['update_status_label']('音声ファイル処理中...')
-
-            transcription = transcribe_audio(
-                file_path,
-                self.config,
-                self.client
-            )
-            if transcription:
-                transcription = process_punctuation(transcription, self.use_punctuation)
-                self._safe_ui_update(transcription)
-            else:
+            job.set_stage(STAGE_TRANSCRIBING)
+            transcription = transcribe_audio(job.source, self.config, self.client)
+            if job.cancelled() or self.cancel_processing:
+                logging.info("処理がキャンセルされました")
+                return
+            if not transcription:
                 raise ValueError('音声ファイルの処理に失敗しました')
 
+            job.set_stage(STAGE_POSTPROCESSING)
+            transcription = self.text_pipeline.process(transcription, self.use_punctuation)
+            if job.cancelled() or self.cancel_processing:
+                logging.info("処理がキャンセルされました")
+                return
+
+            self._schedule_ui_callback(self._safe_ui_update, transcription)
+            job.set_result(transcription)
+
         except Exception as e:
-            self.show_notification('エラー', str(e))
+            logging.error(f"音声ファイル処理中にエラー: {str(e)}")
+            job.set_exception(e)
+            self._schedule_ui_callback(self._safe_error_handler, str(e))
         finally:
-            self.ui_callbacks['update_status_label'](
-                f"{self.config['KEYS']['TOGGLE_RECORDING']}キーで音声入力開始/停止"
-            )
+            if self.cancel_processing:
+                job.cancel()
 
-    def transcribe_audio_frames(self, frames: List[bytes], sample_rate: int):
+    def transcribe_audio_frames(self, frames: Frames, sample_rate: int, audio_file: Optional[str] = None):
         try:
             logging.info("音声フレーム処理開始")
 
@@ -293,9 +400,16 @@ class RecordingController:
                 logging.info("処理がキャンセルされました")
                 return
 
-            temp_audio_file = save_audio(frames, sample_rate, self.config)
+            reason = self._skip_reason(frames, sample_rate)
+            if reason:
+                logging.info(f"文字起こしを送信しません: {reason}")
+                self._schedule_ui_callback(self.show_notification, "音声入力", f"{reason}ため送信しませんでした")
+                return
+
+            temp_audio_file = audio_file or save_audio(frames, sample_rate, self.config)
             if not temp_audio_file:
                 raise ValueError("音声ファイルの保存に失敗しました")
+            self.temp_janitor.add(temp_audio_file)
 
             if self.cancel_processing:
                 logging.info("処理がキャンセルされました")
@@ -311,9 +425,9 @@ class RecordingController:
             if not transcription:
                 raise ValueError("音声ファイルの文字起こしに失敗しました")
 
-            logging.debug(f"句読点処理開始: use_punctuation={self.use_punctuation}")
-            transcription = process_punctuation(transcription, self.use_punctuation)
-            logging.debug("句読点処理完了")
+            logging.debug(f"テキスト後処理開始: use_punctuation={self.use_punctuation}")
+            transcription = self.text_pipeline.process(transcription, self.use_punctuation)
+            logging.debug("テキスト後処理完了")
 
             if self.cancel_processing:
                 logging.info("処理がキャンセルされました")
@@ -328,6 +442,83 @@ class RecordingController:
             import traceback
             logging.debug(f"詳細: {traceback.format_exc()}")
             self._schedule_ui_callback(self._safe_error_handler, str(e))
+        finally:
+            release_frames(frames)
+
+    def _skip_reason(self, frames: Frames, sample_rate: int) -> Optional[str]:
+        """送信前の確認。短すぎる・無音の録音なら理由を返す"""
+        if not (self.skip_min_seconds or self.skip_max_rms or self.skip_max_peak):
+            return None
+        channels = get_config_value(self.config, 'AUDIO', 'CHANNELS', 1)
+        level = measure_frames(frames, sample_rate, channels)
+        logging.debug(f"録音の音量: 長さ={level.duration:.2f}秒, RMS={level.rms:.1f}, ピーク={level.peak}")
+        if level.duration < self.skip_min_seconds:
+            return f"録音が短い（{level.duration:.2f}秒）"
+        if level.rms <= self.skip_max_rms and level.peak <= self.skip_max_peak:
+            return "音声が検出されなかった"
+        return None
+
+    def _start_live_typing(self):
+        self._segment_buffer = SegmentTextBuffer(compile_replacement_rules(self.replacements))
+        self._segment_worker = OutputWorker(name='SegmentTranscriber')
+        self.recorder.set_segment_callback(self._on_segment)
+        logging.info("セグメントごとの出力を開始しました")
+
+    def _on_segment(self, frames: List[bytes], sample_rate: int):
+        # 録音スレッドから呼ばれるため、文字起こしは専用ワーカーで順番に実行する
+        if self._segment_worker is not None:
+            self._segment_worker.submit(self._transcribe_segment, frames, sample_rate)
+
+    def _transcribe_segment(self, frames: List[bytes], sample_rate: int):
+        try:
+            if self.cancel_processing:
+                return
+
+            temp_audio_file = save_audio(frames, sample_rate, self.config, segment=True)
+            if not temp_audio_file:
+                raise ValueError("音声ファイルの保存に失敗しました")
+            self.temp_janitor.add(temp_audio_file)
+
+            transcription = transcribe_audio(temp_audio_file, self.config, self.client)
+            if not transcription:
+                logging.warning("セグメントの文字起こし結果が空です")
+                return
+
+            if self._segment_buffer is not None:
+                self._output_segment_text(self._segment_buffer.feed(transcription))
+
+        except Exception as e:
+            logging.error(f"セグメントの文字起こし中にエラー: {str(e)}")
+            self._schedule_ui_callback(self._safe_error_handler, str(e))
+
+    def _output_segment_text(self, text: str):
+        if not text or self.cancel_processing:
+            return
+        text = self.text_pipeline.process(text, self.use_punctuation)
+        if text:
+            self._schedule_ui_callback(self._safe_ui_update, text)
+
+    def _finish_live_typing(self, sample_rate: int):
+        worker = self._segment_worker
+        buffer = self._segment_buffer
+        if worker is None or buffer is None:
+            return
+        try:
+            remaining = self.recorder.take_remaining_segment()
+            if remaining:
+                worker.submit(self._transcribe_segment, remaining, sample_rate)
+            # 最後のセグメントの後に保留中の末尾を出力する
+            worker.submit(lambda: self._output_segment_text(buffer.flush())).result()
+            logging.info("セグメントごとの出力を完了しました")
+        except Exception as e:
+            logging.error(f"セグメント出力の終了処理中にエラー: {str(e)}")
+            self._schedule_ui_callback(self._safe_error_handler, str(e))
+        finally:
+            worker.stop(timeout=1.0)
+            self.recorder.set_segment_callback(None)
+            release_frames(self.recorder.frames)
+            self._segment_worker = None
+            self._segment_buffer = None
 
     def _safe_ui_update(self, text: str):
         try:
@@ -365,30 +556,27 @@ class RecordingController:
     def copy_and_paste(self, text: str):
         try:
             logging.debug(f"copy_and_paste開始: text長={len(text)}")
-            threading.Thread(
-                target=self._safe_copy_and_paste,
-                args=(text,),
-                daemon=True
-            ).start()
+            # 置換はテキスト後処理パイプラインで適用済み
+            copy_and_paste_transcription(text, None, self.config, callback=self._on_output_done)
         except Exception as e:
             logging.error(f"コピー&ペースト開始中にエラー: {str(e)}")
-
-    def _safe_copy_and_paste(self, text: str):
-        try:
-            logging.debug("_safe_copy_and_paste開始")
-            copy_and_paste_transcription(text, self.replacements, self.config)
-            logging.debug("_safe_copy_and_paste完了")
-        except Exception as e:
-            logging.error(f"コピー&ペースト実行中にエラー: {str(e)}")
-            import traceback
-            logging.debug(f"詳細: {traceback.format_exc()}")
             self._schedule_ui_callback(self._safe_error_handler, f"コピー&ペースト中にエラー: {str(e)}")
 
+    def _on_output_done(self, future: Future):
+        # 出力ワーカーのスレッドから呼ばれる
+        error = future.exception()
+        if error is None:
+            logging.debug("コピー&ペースト完了")
+            return
+        logging.error(f"コピー&ペースト実行中にエラー: {str(error)}")
+        self._schedule_ui_callback(self._safe_error_handler, f"コピー&ペースト中にエラー: {str(error)}")
+
     def cleanup(self):
         try:
             logging.info("RecordingController クリーンアップ開始")
             self._is_shutting_down = True
             self.cancel_processing = True
+            self.cancel_current_job()
 
             if self.recorder.is_recording:
                 self.stop_recording()
@@ -414,7 +602,14 @@ class RecordingController:
                 except Exception:
                     pass
 
+            # プリロール用の待機入力を終了してマイクを解放する
+            self.recorder.close()
+
+            # 投入済みの貼り付けを完了させてから終了する
+            get_output_worker().stop(timeout=2.0)
+
             self._cleanup_temp_files()
+            self.temp_janitor.stop(timeout=1.0)
 
         except Exception as e:
             logging.error(f"クリーンアップ処理中にエラーが発生しました: {str(e)}")
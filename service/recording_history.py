@@ -0,0 +1,165 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'recordings.jsonl'
+DEFAULT_MAX_ENTRIES = 500
+
+
+class RecordingEntry(NamedTuple):
+    path: str
+    created: float
+    duration: float
+    size: int
+
+
+class RecordingHistory:
+    """保存した録音の履歴（最新・直近N件の参照はO(1)、時刻での検索は二分探索）
+
+    メモリ上のリストとTEMP_DIRの追記型マニフェスト（JSON Lines）を同期し、
+    再起動後もディレクトリを走査せずに復元する。削除済みのファイルは参照時に読み飛ばす
+    """
+
+    def __init__(self, temp_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.temp_dir = temp_dir
+        self.max_entries = max_entries
+        self.manifest_path = os.path.join(temp_dir, MANIFEST_NAME)
+        self._entries: List[RecordingEntry] = []
+        # _entries と同じ順の保存時刻（find_at で毎回作り直さずに二分探索する）
+        self._created: List[float] = []
+        self._manifest_lines = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"録音履歴の読み込みに失敗しました: {e}")
+            return
+
+        # 同じファイルの行は後の行（停止時の更新）で置き換え、順序は最初の行の位置のままにする
+        loaded: Dict[str, RecordingEntry] = {}
+        for line in lines:
+            try:
+                data = json.loads(line)
+                entry = RecordingEntry(
+                    data['path'], float(data['created']), float(data.get('duration', 0.0)), int(data.get('size', 0))
+                )
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"録音履歴の不正な行を読み飛ばしました: {line.strip()[:100]}")
+                continue
+            loaded[entry.path] = entry
+        self._add(list(loaded.values()))
+        self._manifest_lines = len(lines)
+        if self._manifest_lines > self.max_entries * 2:
+            self._compact()
+
+    def _compact(self):
+        """マニフェストを保持件数分に書き直す"""
+        temp_path = self.manifest_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry in self._entries:
+                    f.write(json.dumps(entry._asdict(), ensure_ascii=False) + '\n')
+            os.replace(temp_path, self.manifest_path)
+            self._manifest_lines = len(self._entries)
+        except OSError as e:
+            logger.error(f"録音履歴の整理に失敗しました: {e}")
+
+    def append(self, path: str, duration: float = 0.0, size: int = 0, created: Optional[float] = None) -> RecordingEntry:
+        entry = RecordingEntry(os.path.abspath(path), time.time() if created is None else created, duration, size)
+        with self._lock:
+            self._add([entry])
+            self._write(entry)
+        return entry
+
+    def _add(self, entries: List[RecordingEntry]):
+        """末尾に追加し、保持件数を超えた古い分を保存時刻と一緒に捨てる（ロックを取って呼ぶ）"""
+        self._entries.extend(entries)
+        self._created.extend(entry.created for entry in entries)
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            del self._entries[:overflow]
+            del self._created[:overflow]
+
+    def update(self, path: str, duration: float, size: int) -> Optional[RecordingEntry]:
+        """履歴にある録音の長さとサイズを更新する（録音開始時に追加した逐次保存のファイル用）"""
+        path = os.path.abspath(path)
+        with self._lock:
+            # 更新するのは直近に追加した録音のため末尾から探す
+            for index in range(len(self._entries) - 1, -1, -1):
+                entry = self._entries[index]
+                if entry.path == path:
+                    break
+            else:
+                return None
+            entry = entry._replace(duration=duration, size=size)
+            self._entries[index] = entry
+            self._write(entry)
+        return entry
+
+    def _write(self, entry: RecordingEntry):
+        """マニフェストへ1行追記する（ロックを取って呼ぶ）"""
+        try:
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry._asdict(), ensure_ascii=False) + '\n')
+            self._manifest_lines += 1
+        except OSError as e:
+            logger.error(f"録音履歴の保存に失敗しました: {e}")
+        if self._manifest_lines > self.max_entries * 2:
+            self._compact()
+
+    def latest(self) -> Optional[RecordingEntry]:
+        """存在する最新の録音"""
+        entries = self.previous(1)
+        return entries[0] if entries else None
+
+    def previous(self, count: int) -> List[RecordingEntry]:
+        """存在する録音を新しい順に最大count件"""
+        result = []
+        with self._lock:
+            for entry in reversed(self._entries):
+                if len(result) >= count:
+                    break
+                if os.path.exists(entry.path):
+                    result.append(entry)
+        return result
+
+    def find_at(self, timestamp: float) -> Optional[RecordingEntry]:
+        """timestamp以前に保存された存在する録音のうち最も新しいもの"""
+        with self._lock:
+            position = bisect.bisect_right(self._created, timestamp)
+            for index in range(position - 1, -1, -1):
+                entry = self._entries[index]
+                if os.path.exists(entry.path):
+                    return entry
+        return None
+
+
+_histories: Dict[str, RecordingHistory] = {}
+_histories_lock = threading.Lock()
+
+
+def get_recording_history(temp_dir: str) -> RecordingHistory:
+    """一時ディレクトリごとの録音履歴（プロセスで1つ）"""
+    key = os.path.abspath(temp_dir)
+    with _histories_lock:
+        history = _histories.get(key)
+        if history is None:
+            history = RecordingHistory(key)
+            _histories[key] = history
+        return history
@@ -0,0 +1,293 @@
+import functools
+import logging
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+LITERAL = 'literal'
+WORD = 'word'
+REGEX = 'regex'
+
+RULE_PREFIXES = {
+    're:': REGEX,
+    'word:': WORD,
+}
+
+# 結合パターンでは番号付き後方参照や名前付きグループが衝突するため単独で適用する
+_STANDALONE_REGEX = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?<[A-Za-z_]|\\g<')
+
+
+class ReplacementRule(NamedTuple):
+    kind: str
+    pattern: str
+    replacement: str
+    priority: int = 0
+
+
+Replacements = Union[Dict[str, str], Sequence[ReplacementRule]]
+
+
+def parse_replacement_line(line: str) -> Optional[ReplacementRule]:
+    """置換ファイルの1行を解析
+
+    形式: [re:|word:]置換前,置換後[,優先度]
+    空行とコメント行（#）はNoneを返し、無効な行はValueErrorを送出
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+
+    kind = LITERAL
+    for prefix, prefix_kind in RULE_PREFIXES.items():
+        if line.startswith(prefix):
+            kind = prefix_kind
+            line = line[len(prefix):]
+            break
+
+    if kind == REGEX:
+        # 正規表現にはカンマを含められるため右側から分割する
+        parts = line.rsplit(',', 2)
+        if len(parts) == 3 and _is_priority(parts[2]):
+            pattern, replacement, priority = parts[0], parts[1], int(parts[2])
+        else:
+            parts = line.rsplit(',', 1)
+            if len(parts) != 2:
+                raise ValueError(f"無効な正規表現ルール: {line}")
+            pattern, replacement, priority = parts[0], parts[1], 0
+        pattern = pattern.strip()
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"正規表現のコンパイルに失敗しました: {str(e)}")
+    else:
+        parts = line.split(',')
+        if len(parts) == 2:
+            pattern, replacement, priority = parts[0], parts[1], 0
+        elif len(parts) == 3 and _is_priority(parts[2]):
+            pattern, replacement, priority = parts[0], parts[1], int(parts[2])
+        else:
+            raise ValueError(f"無効な置換ルール: {line}")
+        pattern = pattern.strip()
+
+    if not pattern:
+        raise ValueError("置換前の文字列が空です")
+
+    return ReplacementRule(kind, pattern, replacement.strip(), priority)
+
+
+def _is_priority(value: str) -> bool:
+    return re.fullmatch(r'[+-]?[0-9]+', value.strip()) is not None
+
+
+def to_replacement_rules(replacements: Optional[Replacements]) -> List[ReplacementRule]:
+    """辞書形式の置換ルールをReplacementRuleのリストへ変換"""
+    if not replacements:
+        return []
+    if isinstance(replacements, dict):
+        rules = []
+        for old, new in replacements.items():
+            if not old:
+                continue
+            kind = LITERAL
+            for prefix, prefix_kind in RULE_PREFIXES.items():
+                if old.startswith(prefix):
+                    kind = prefix_kind
+                    old = old[len(prefix):]
+                    break
+            rules.append(ReplacementRule(kind, old, new))
+        return rules
+    return list(replacements)
+
+
+class _LiteralTier:
+    """同じ種類・優先度のリテラルルールを長さ別の辞書引きで照合する"""
+
+    def __init__(self, rules: Sequence[ReplacementRule], order: int):
+        self.mapping = {rule.pattern: rule.replacement for rule in rules}
+        self.lengths = sorted({len(pattern) for pattern in self.mapping}, reverse=True)
+        self.first_chars = {pattern[0] for pattern in self.mapping}
+        self.is_word = rules[0].kind == WORD
+        self.priority = rules[0].priority
+        self.order = order
+
+    def match_at(self, text: str, pos: int) -> Optional[Tuple[int, str]]:
+        if text[pos] not in self.first_chars:
+            return None
+        if self.is_word and pos > 0 and _is_word_char(text[pos - 1]):
+            return None
+
+        text_length = len(text)
+        for length in self.lengths:
+            end = pos + length
+            if end > text_length:
+                continue
+            replacement = self.mapping.get(text[pos:end])
+            if replacement is None:
+                continue
+            if self.is_word and end < text_length and _is_word_char(text[end]):
+                continue
+            return end, replacement
+        return None
+
+
+def _is_word_char(char: str) -> bool:
+    # 英数字の単語境界（日本語の文字は単語の一部とみなさない）
+    return char == '_' or char.isascii() and char.isalnum()
+
+
+class ReplacementMatcher:
+    """全置換ルールをまとめてコンパイルし、テキストを1回走査して置換する
+
+    リテラルは先頭文字の文字クラスで候補位置へ読み飛ばし、長さ別の辞書引きで照合するため
+    1回あたりの処理時間はルール数に依存しない。正規表現ルールは1つの結合パターンにまとめる。
+    同じ位置では優先度の高いルールが適用され、同じ優先度のリテラル同士は最長一致となる
+    """
+
+    def __init__(self, rules: Sequence[ReplacementRule]):
+        self.rule_count = len(rules)
+        self._tiers: List[_LiteralTier] = []
+        self._regex_rules: List[Tuple[re.Pattern, str, Tuple[int, int]]] = []
+        self._standalone: List[Tuple[re.Pattern, str]] = []
+        self._literal_start: Optional[re.Pattern] = None
+        self._regex: Optional[re.Pattern] = None
+        self._literal_prefixes: Optional[Set[str]] = None
+
+        ordered = sorted(rules, key=lambda rule: -rule.priority)
+        # 同じ種類・優先度のリテラルは1つの辞書にまとめる
+        literal_groups: Dict[Tuple[int, str], List[ReplacementRule]] = {}
+        literal_orders: Dict[Tuple[int, str], int] = {}
+        for order, rule in enumerate(ordered):
+            if rule.kind in (LITERAL, WORD):
+                key = (rule.priority, rule.kind)
+                literal_groups.setdefault(key, []).append(rule)
+                literal_orders.setdefault(key, order)
+            else:
+                self._add_regex_rule(rule, order)
+
+        self._tiers = [_LiteralTier(group, literal_orders[key]) for key, group in literal_groups.items()]
+        self._tiers.sort(key=lambda tier: (-tier.priority, tier.order))
+
+        if self._tiers:
+            first_chars = set().union(*(tier.first_chars for tier in self._tiers))
+            self._literal_start = re.compile(f"[{''.join(re.escape(char) for char in sorted(first_chars))}]")
+        if self._regex_rules:
+            # 捕捉グループを含めると先頭文字による読み飛ばしが無効になるため非捕捉グループで結合する
+            self._regex = re.compile('|'.join(f"(?:{compiled.pattern})" for compiled, _, _ in self._regex_rules))
+
+    def _add_regex_rule(self, rule: ReplacementRule, order: int):
+        try:
+            compiled = re.compile(rule.pattern)
+        except re.error as e:
+            logging.error(f"正規表現ルールのコンパイルに失敗しました: '{rule.pattern}': {str(e)}")
+            return
+
+        if _STANDALONE_REGEX.search(rule.pattern) or compiled.flags & ~re.UNICODE:
+            self._standalone.append((compiled, rule.replacement))
+            return
+
+        self._regex_rules.append((compiled, rule.replacement, (rule.priority, -order)))
+
+    def _resolve_regex(self, match: re.Match) -> Tuple[str, Tuple[int, int]]:
+        """結合パターンの一致がどのルールによるものかを特定し、置換後の文字列を返す"""
+        for compiled, replacement, rank in self._regex_rules:
+            rule_match = compiled.match(match.string, match.start())
+            if rule_match is not None:
+                if '\\' in replacement:
+                    replacement = rule_match.expand(replacement)
+                return replacement, rank
+        return match.group(), (0, 0)
+
+    def _next_literal(self, text: str, pos: int, limit: int) -> Optional[Tuple[int, int, str, _LiteralTier]]:
+        """pos以降limit以前で最初にリテラルが一致する位置を探す"""
+        assert self._literal_start is not None
+        while True:
+            candidate = self._literal_start.search(text, pos, limit + 1)
+            if candidate is None:
+                return None
+            start = candidate.start()
+            for tier in self._tiers:
+                found = tier.match_at(text, start)
+                if found is not None:
+                    return start, found[0], found[1], tier
+            pos = start + 1
+
+    def pending_prefix_length(self, text: str) -> int:
+        """末尾が続くテキストと連結するとリテラルルールに一致し得る場合、その末尾の長さを返す
+
+        分割して届くテキストを置換する際、ルールの途中で区切らないために使用する
+        （正規表現ルールは対象外）
+        """
+        if not self._tiers or not text:
+            return 0
+        if self._literal_prefixes is None:
+            # 必要になるまで構築しない
+            self._literal_prefixes = {
+                pattern[:length]
+                for tier in self._tiers
+                for pattern in tier.mapping
+                for length in range(1, len(pattern))
+            }
+        max_length = max(tier.lengths[0] for tier in self._tiers) - 1
+        for length in range(min(len(text), max_length), 0, -1):
+            if text[-length:] in self._literal_prefixes:
+                return length
+        return 0
+
+    def replace(self, text: str) -> str:
+        if not text:
+            return text
+        if self._tiers or self._regex is not None:
+            text = self._scan(text)
+        for compiled, replacement in self._standalone:
+            text = compiled.sub(replacement, text)
+        return text
+
+    def _scan(self, text: str) -> str:
+        text_length = len(text)
+        pieces: List[str] = []
+        pos = 0
+        regex_match = self._regex.search(text) if self._regex is not None else None
+
+        while pos < text_length:
+            if regex_match is not None and regex_match.start() < pos:
+                regex_match = self._regex.search(text, pos)  # type: ignore[union-attr]
+
+            limit = regex_match.start() if regex_match is not None else text_length - 1
+            literal = self._next_literal(text, pos, limit) if self._tiers else None
+
+            regex_replacement = None
+            if regex_match is not None:
+                if literal is None or literal[0] == regex_match.start():
+                    regex_replacement, rank = self._resolve_regex(regex_match)
+                    if literal is not None and rank < (literal[3].priority, -literal[3].order):
+                        regex_replacement = None
+
+            if regex_replacement is not None:
+                assert regex_match is not None
+                start, end = regex_match.span()
+                pieces.append(text[pos:start])
+                pieces.append(regex_replacement)
+                if end == start:
+                    # 空一致では1文字進めて無限ループを防ぐ
+                    pieces.append(text[start:start + 1])
+                    end += 1
+                pos = end
+            elif literal is not None:
+                start, end, replacement, _ = literal
+                pieces.append(text[pos:start])
+                pieces.append(replacement)
+                pos = end
+            else:
+                break
+
+        pieces.append(text[pos:])
+        return ''.join(pieces)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_cached(rules: Tuple[ReplacementRule, ...]) -> ReplacementMatcher:
+    return ReplacementMatcher(rules)
+
+
+def compile_replacement_rules(replacements: Optional[Replacements]) -> ReplacementMatcher:
+    """置換ルールをマッチャーへコンパイル（同一ルールセットはキャッシュを再利用）"""
+    return _compile_cached(tuple(to_replacement_rules(replacements)))
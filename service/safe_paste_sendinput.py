@@ -1,54 +1,77 @@
 import logging
 import time
+from typing import Optional
 
-import keyboard
-import pyperclip
+from service.clipboard_backend import AdaptiveDelay, ClipboardBackend, get_clipboard_backend, wait_for_clipboard
 
 logger = logging.getLogger(__name__)
 
+CLIPBOARD_VERIFY_TIMEOUT = 0.3
+# 貼り付け直後に次のコピーでクリップボードを上書きしないための最小間隔
+PASTE_SETTLE_SECONDS = 0.1
 
-def safe_clipboard_copy(text: str) -> bool:
+# コピーから読み戻しで一致するまでの実測時間
+clipboard_latency = AdaptiveDelay(initial=0.0, maximum=CLIPBOARD_VERIFY_TIMEOUT)
+_last_paste_at: Optional[float] = None
+
+
+def safe_clipboard_copy(text: str, backend: Optional[ClipboardBackend] = None) -> bool:
     """テキストを安全にクリップボードへコピー"""
     if not text:
         return False
 
+    backend = backend or get_clipboard_backend()
     max_retries = 2
     for attempt in range(max_retries):
         try:
-            pyperclip.copy(text)
-            time.sleep(0.05)
-            copied_text = pyperclip.paste()
-            if copied_text == text:
-                logger.info("クリップボードコピー完了")
+            wait_for_paste_settle()
+            backend.copy(text)
+            elapsed = wait_for_clipboard(backend, text, CLIPBOARD_VERIFY_TIMEOUT)
+            if elapsed is not None:
+                clipboard_latency.record(elapsed)
+                logger.info(f"クリップボードコピー完了 ({elapsed * 1000:.1f}ms)")
                 return True
             else:
                 logger.warning(f"クリップボードコピー検証失敗 (試行 {attempt + 1}/{max_retries})")
         except Exception as e:
             logger.error(f"クリップボードコピー中にエラー (試行 {attempt + 1}/{max_retries}): {str(e)}")
 
-        if attempt < max_retries - 1:
-            time.sleep(0.1 * (attempt + 1))
-
     logger.error("クリップボードコピーが最大試行回数後に失敗しました")
     return False
 
 
-def safe_paste_text() -> bool:
+def safe_paste_text(backend: Optional[ClipboardBackend] = None) -> bool:
     """クリップボードの内容を貼り付け"""
+    global _last_paste_at
+    backend = backend or get_clipboard_backend()
     try:
-        current_text = pyperclip.paste()
+        current_text = backend.paste()
         if not current_text:
             logger.warning("クリップボードが空です")
             return False
 
-        keyboard.send('ctrl+v')
-        time.sleep(0.1)
+        backend.send_paste()
+        _last_paste_at = time.monotonic()
         return True
     except Exception as e:
         logger.error(f"貼り付け操作に失敗: {e}")
         return False
 
 
+def wait_for_paste_settle():
+    """直前の貼り付けから最小間隔が経過していなければ残り時間だけ待機"""
+    if _last_paste_at is None:
+        return
+    remaining = PASTE_SETTLE_SECONDS - (time.monotonic() - _last_paste_at)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def get_paste_delay(max_delay: float) -> float:
+    """実測したクリップボード反映時間に基づく貼り付け前の待ち時間（max_delayが上限）"""
+    return min(clipboard_latency.value, max_delay)
+
+
 def is_paste_available() -> bool:
     """貼り付け可能かどうかをチェック"""
     try:
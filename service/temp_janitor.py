@@ -0,0 +1,197 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TempFileEntry(NamedTuple):
+    path: str
+    size: int
+    mtime: float
+
+
+class TempFileJanitor:
+    """一時音声ファイルの索引を持ち、経過時間・合計サイズ・ファイル数の上限をバックグラウンドで適用
+
+    索引は起動時と rescan_seconds ごとに os.scandir で作り直し、保存したファイルは add() で追加する
+    容量・件数の上限では最新のファイルと min_age_seconds 未満のファイル（処理中の可能性がある）は削除しない
+    """
+
+    def __init__(
+            self,
+            temp_dir: str,
+            max_age_minutes: float,
+            max_total_bytes: int = 0,
+            max_files: int = 0,
+            interval: float = 600.0,
+            rescan_seconds: float = 3600.0,
+            min_age_seconds: float = 60.0,
+            suffix: str = '.wav'
+    ):
+        self.temp_dir = temp_dir
+        self.max_age_seconds = max_age_minutes * 60
+        self.max_total_bytes = max_total_bytes
+        self.max_files = max_files
+        self.interval = interval
+        self.rescan_seconds = rescan_seconds
+        self.min_age_seconds = min_age_seconds
+        self.suffix = suffix
+
+        self._index: Dict[str, TempFileEntry] = {}
+        self._total_bytes = 0
+        self._last_scan: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_requested = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def file_count(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_requested = False
+        self._thread = threading.Thread(target=self._run, name='TempFileJanitor', daemon=True)
+        self._thread.start()
+
+    def request_sweep(self):
+        """次の整理を待たずに実行する（呼び出し元は待たない）"""
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """要求済みの整理を済ませてから停止し、停止できたかを返す"""
+        thread = self._thread
+        if thread is None:
+            return True
+        self._stop_requested = True
+        self._wake.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("一時ファイル整理の停止がタイムアウトしました")
+            return False
+        self._thread = None
+        return True
+
+    def _run(self):
+        self._wake.set()
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"クリーンアップ処理中にエラーが発生しました: {e}")
+            if self._stop_requested:
+                return
+
+    def add(self, path: str):
+        """保存したファイルを索引へ追加し、上限を超えたら整理を要求"""
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.debug(f"一時ファイルの情報を取得できません: {path}, {e}")
+            return
+        with self._lock:
+            self._put(TempFileEntry(path, stat.st_size, stat.st_mtime))
+            over_quota = self._over_quota(len(self._index), self._total_bytes)
+        if over_quota:
+            self.request_sweep()
+
+    def _put(self, entry: TempFileEntry):
+        previous = self._index.get(entry.path)
+        if previous is not None:
+            self._total_bytes -= previous.size
+        self._index[entry.path] = entry
+        self._total_bytes += entry.size
+
+    def _discard(self, path: str):
+        entry = self._index.pop(path, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def _over_quota(self, count: int, total_bytes: int) -> bool:
+        return bool(
+            (self.max_files and count > self.max_files) or
+            (self.max_total_bytes and total_bytes > self.max_total_bytes)
+        )
+
+    def rescan(self):
+        """一時ディレクトリを1回走査して索引を作り直す"""
+        index: Dict[str, TempFileEntry] = {}
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(self.suffix):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    index[entry.path] = TempFileEntry(entry.path, stat.st_size, stat.st_mtime)
+        except FileNotFoundError:
+            logger.debug(f"一時ディレクトリが存在しません: {self.temp_dir}")
+        with self._lock:
+            self._index = index
+            self._total_bytes = sum(entry.size for entry in index.values())
+            self._last_scan = time.monotonic()
+
+    def select_victims(self, now: Optional[float] = None) -> List[TempFileEntry]:
+        """古い順に、期限切れのファイルと上限を超えた分のファイルを選ぶ"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = sorted(self._index.values(), key=lambda entry: entry.mtime)
+            count = len(entries)
+            total_bytes = self._total_bytes
+
+        victims = []
+        for position, entry in enumerate(entries):
+            age = now - entry.mtime
+            expired = age > self.max_age_seconds
+            removable = position < len(entries) - 1 and age >= self.min_age_seconds
+            if not expired and not (removable and self._over_quota(count, total_bytes)):
+                break
+            victims.append(entry)
+            count -= 1
+            total_bytes -= entry.size
+        return victims
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """上限を適用して削除したファイル数を返す"""
+        if self._last_scan is None or time.monotonic() - self._last_scan >= self.rescan_seconds:
+            self.rescan()
+
+        now = time.time() if now is None else now
+        deleted = 0
+        for entry in self.select_victims(now):
+            try:
+                os.remove(entry.path)
+                deleted += 1
+                if now - entry.mtime > self.max_age_seconds:
+                    logger.info(f"古い音声ファイルを削除しました: {entry.path}")
+                else:
+                    logger.info(f"容量・件数の上限のため音声ファイルを削除しました: {entry.path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"ファイル削除中にエラーが発生しました: {entry.path}, {e}")
+                continue
+            with self._lock:
+                self._discard(entry.path)
+        return deleted
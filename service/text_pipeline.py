@@ -0,0 +1,207 @@
+import configparser
+import logging
+import time
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional
+
+from service.replacement_rules import (
+    ReplacementMatcher,
+    Replacements,
+    ReplacementRule,
+    compile_replacement_rules,
+    to_replacement_rules
+)
+from utils.config_manager import get_config_value
+
+DEFAULT_STAGES = 'punctuation,normalize,replacements,casing'
+
+# 句読点削除の変換テーブル
+PUNCTUATION_TABLE = str.maketrans('', '', '。、')
+
+
+class PipelineStage:
+    def __init__(
+            self,
+            name: str,
+            func: Callable[[str], str],
+            cost: int,
+            table: Optional[Dict[int, Any]] = None
+    ):
+        self.name = name
+        self.func = func
+        self.cost = cost
+        # 文字単位の削除フィルタは変換テーブルを持ち、隣接するもの同士で融合できる
+        self.table = table
+
+
+class TextPipeline:
+    def __init__(self, stages: List[PipelineStage]):
+        self.stages = stages
+        self._compiled: Dict[bool, List[PipelineStage]] = {
+            use_punctuation: _compile_stages(stages, use_punctuation)
+            for use_punctuation in (True, False)
+        }
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    def compiled_stage_names(self, use_punctuation: bool) -> List[str]:
+        return [stage.name for stage in self._compiled[use_punctuation]]
+
+    def process(self, text: str, use_punctuation: bool = True) -> str:
+        if not text:
+            return text
+
+        result = text
+        for stage in self._compiled[use_punctuation]:
+            try:
+                result = stage.func(result)
+            except Exception as e:
+                logging.error(f"テキスト後処理 '{stage.name}' でエラー: {str(e)}", exc_info=True)
+        return result
+
+    def profile(self, text: str, use_punctuation: bool = True, iterations: int = 100) -> Dict[str, float]:
+        """ステージごとの1回あたりの平均処理時間（秒）を計測"""
+        timings: Dict[str, float] = {}
+        for stage in self._compiled[use_punctuation]:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                stage.func(text)
+            timings[stage.name] = (time.perf_counter() - start) / iterations
+            text = stage.func(text)
+        return timings
+
+
+class SegmentTextBuffer:
+    """セグメントごとに届く文字起こしを連結し、置換ルールの途中で切れている可能性のある末尾を保留する"""
+
+    def __init__(self, matcher: ReplacementMatcher):
+        self.matcher = matcher
+        self.pending = ''
+
+    def feed(self, text: str) -> str:
+        """確定した部分を返し、次のセグメントと連結して判定する末尾を保留"""
+        combined = self.pending + (text or '')
+        hold = self.matcher.pending_prefix_length(combined)
+        split = len(combined) - hold
+        self.pending = combined[split:]
+        return combined[:split]
+
+    def flush(self) -> str:
+        pending, self.pending = self.pending, ''
+        return pending
+
+
+def _compile_stages(stages: List[PipelineStage], use_punctuation: bool) -> List[PipelineStage]:
+    active = [stage for stage in stages if use_punctuation is False or stage.name != 'punctuation']
+
+    # 削除フィルタは後続ステージの入力を縮めるだけなので先頭へ移動する
+    filters = [stage for stage in active if stage.table is not None]
+    others = [stage for stage in active if stage.table is None]
+    filters.sort(key=lambda stage: stage.cost)
+
+    if len(filters) > 1:
+        table: Dict[int, Any] = {}
+        for stage in filters:
+            assert stage.table is not None
+            table.update(stage.table)
+        fused_name = '+'.join(stage.name for stage in filters)
+        filters = [PipelineStage(fused_name, lambda text, t=table: text.translate(t), 0, table)]
+
+    return filters + others
+
+
+def _build_punctuation_stage(
+        config: configparser.ConfigParser,
+        rules: List[ReplacementRule]
+) -> Optional[PipelineStage]:
+    return PipelineStage(
+        'punctuation',
+        lambda text: text.translate(PUNCTUATION_TABLE),
+        0,
+        PUNCTUATION_TABLE
+    )
+
+
+def _build_normalize_stage(
+        config: configparser.ConfigParser,
+        rules: List[ReplacementRule]
+) -> Optional[PipelineStage]:
+    form = get_config_value(config, 'PIPELINE', 'normalize', '').strip().upper()
+    if not form or form == 'NONE':
+        return None
+    if form not in ('NFC', 'NFKC', 'NFD', 'NFKD'):
+        logging.warning(f"無効な正規化形式 '{form}' が指定されました。正規化をスキップします")
+        return None
+    return PipelineStage('normalize', lambda text: unicodedata.normalize(form, text), 1)  # type: ignore[arg-type]
+
+
+def _build_replacements_stage(
+        config: configparser.ConfigParser,
+        rules: List[ReplacementRule]
+) -> Optional[PipelineStage]:
+    if not rules:
+        return None
+
+    # リテラル・単語境界・正規表現ルールを1つのマッチャーで1回の走査として適用
+    matcher = compile_replacement_rules(rules)
+    return PipelineStage('replacements', matcher.replace, 2)
+
+
+def _build_regex_stage(
+        config: configparser.ConfigParser,
+        rules: List[ReplacementRule]
+) -> Optional[PipelineStage]:
+    # 正規表現ルールは置換ステージのマッチャーに統合済み（旧設定との互換用）
+    return None
+
+
+def _build_casing_stage(
+        config: configparser.ConfigParser,
+        rules: List[ReplacementRule]
+) -> Optional[PipelineStage]:
+    casing = get_config_value(config, 'PIPELINE', 'casing', 'none').strip().lower()
+    if casing == 'lower':
+        return PipelineStage('casing', str.lower, 1)
+    if casing == 'upper':
+        return PipelineStage('casing', str.upper, 1)
+    if casing != 'none':
+        logging.warning(f"無効な大文字小文字設定 '{casing}' が指定されました。変換をスキップします")
+    return None
+
+
+STAGE_BUILDERS: Dict[
+    str,
+    Callable[[configparser.ConfigParser, List[ReplacementRule]], Optional[PipelineStage]]
+] = {
+    'punctuation': _build_punctuation_stage,
+    'normalize': _build_normalize_stage,
+    'replacements': _build_replacements_stage,
+    'regex': _build_regex_stage,
+    'casing': _build_casing_stage,
+}
+
+
+def build_text_pipeline(
+        config: configparser.ConfigParser,
+        replacements: Optional[Replacements]
+) -> TextPipeline:
+    stage_names = get_config_value(config, 'PIPELINE', 'stages', DEFAULT_STAGES)
+    rules = to_replacement_rules(replacements)
+    stages: List[PipelineStage] = []
+
+    for name in (part.strip().lower() for part in stage_names.split(',')):
+        if not name:
+            continue
+        builder = STAGE_BUILDERS.get(name)
+        if builder is None:
+            logging.warning(f"不明なテキスト後処理ステージ '{name}' をスキップします")
+            continue
+        stage = builder(config, rules)
+        if stage is not None:
+            stages.append(stage)
+
+    pipeline = TextPipeline(stages)
+    logging.info(f"テキスト後処理パイプライン: {' → '.join(pipeline.stage_names) or 'なし'}")
+    return pipeline
@@ -4,16 +4,29 @@ import os
 import sys
 import threading
 import time
-from typing import Dict
-
-import pyperclip
-
-from service.safe_paste_sendinput import safe_paste_text, safe_clipboard_copy, is_paste_available
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from service.clipboard_backend import get_clipboard_backend
+from service.keystroke_output import KEYSTROKE, select_output_mode, type_text_from_config
+from service.output_worker import OutputWorker
+from service.replacement_rules import LITERAL, ReplacementRule, parse_replacement_line
+from service.safe_paste_sendinput import get_paste_delay, safe_paste_text, safe_clipboard_copy, is_paste_available
 from utils.config_manager import get_config_value
+from utils.lazy_import import lazy_import
+
+pyperclip = lazy_import('pyperclip')
 
 logger = logging.getLogger(__name__)
 
 _clipboard_lock = threading.Lock()
+# クリップボード操作と貼り付けはこのワーカーで投入順に実行する
+_output_worker = OutputWorker(_clipboard_lock)
+
+_restore_lock = threading.Lock()
+_restore_token: Optional[object] = None
+_restore_future: Optional[Future] = None
+_restore_snapshot: Optional[str] = None
 
 
 def process_punctuation(text: str, use_punctuation: bool) -> str:
@@ -40,9 +53,9 @@ def get_replacements_path():
     return os.path.join(base_path, 'replacements.txt')
 
 
-def load_replacements() -> Dict[str, str]:
-    replacements = {}
-    file_path = get_replacements_path()
+def load_replacement_rules(file_path: Optional[str] = None) -> List[ReplacementRule]:
+    rules: List[ReplacementRule] = []
+    file_path = file_path or get_replacements_path()
     logging.info(f"置換ルールファイルのパス: {file_path}")
 
     try:
@@ -50,31 +63,34 @@ def load_replacements() -> Dict[str, str]:
             lines = f.readlines()
 
             for line_number, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
                 try:
-                    old, new = line.split(',')
-                    replacements[old.strip()] = new.strip()
-                    logging.debug(f"置換ルール読み込み - {line_number}行目: '{old.strip()}' → '{new.strip()}'")
-                except ValueError:
-                    logging.error(f"置換ファイルの{line_number}行目に無効な行があります: {line}")
+                    rule = parse_replacement_line(line)
+                except ValueError as e:
+                    logging.error(f"置換ファイルの{line_number}行目に無効な行があります: {line.strip()} ({str(e)})")
+                    continue
+                if rule is None:
                     continue
+                rules.append(rule)
+                logging.debug(
+                    f"置換ルール読み込み - {line_number}行目: [{rule.kind}] '{rule.pattern}' → '{rule.replacement}'"
+                    f" (優先度: {rule.priority})"
+                )
 
-            logging.info(f"置換ルールの総数: {len(replacements)}")
-            if len(replacements) > 0:
-                logging.debug("読み込んだ置換ルール:")
-                for old, new in replacements.items():
-                    logging.debug(f"  '{old}' → '{new}'")
+            logging.info(f"置換ルールの総数: {len(rules)}")
 
     except IOError as e:
         logging.error(f"置換ファイルの読み込み中にエラーが発生しました: {e}")
-        return {}
+        return []
     except Exception as e:
         logging.error(f"予期せぬエラーが発生しました: {e}", exc_info=True)
-        return {}
+        return []
 
-    return replacements
+    return rules
+
+
+def load_replacements() -> Dict[str, str]:
+    """リテラルの置換ルールのみを辞書として返す（replace_text用）"""
+    return {rule.pattern: rule.replacement for rule in load_replacement_rules() if rule.kind == LITERAL}
 
 
 def replace_text(text: str, replacements: Dict[str, str]) -> str:
@@ -107,40 +123,121 @@ def replace_text(text: str, replacements: Dict[str, str]) -> str:
 
 def copy_and_paste_transcription(
         text: str,
-        replacements: Dict[str, str],
-        config: configparser.ConfigParser
-):
+        replacements: Optional[Dict[str, str]],
+        config: configparser.ConfigParser,
+        callback: Optional[Callable[[Future], None]] = None
+) -> Optional[Future]:
+    """出力ワーカーへテキストを投入し、出力の完了を通知するFutureを返す"""
     if not text:
         logging.warning("空のテキスト")
-        return
+        return None
 
     try:
-        replaced_text = replace_text(text, replacements)
+        replaced_text = text if replacements is None else replace_text(text, replacements)
         if not replaced_text:
             logging.error("テキスト置換結果が空です")
-            return
+            return None
+
+        return _output_worker.submit(_output_text, replaced_text, config, callback=callback)
+
+    except Exception as e:
+        logging.error(f"コピー&ペースト処理でエラー: {str(e)}", exc_info=True)
+        raise
+
 
-        if not safe_clipboard_copy(replaced_text):
+def _output_text(text: str, config: configparser.ConfigParser) -> bool:
+    # 出力ワーカーのスレッドで_clipboard_lockを保持したまま実行される
+    try:
+        if select_output_mode(config) == KEYSTROKE:
+            if not type_text_from_config(text, config):
+                raise Exception("キー入力での出力に失敗しました")
+            return True
+
+        restore = get_config_value(config, 'CLIPBOARD', 'restore_clipboard', False)
+        snapshot = snapshot_clipboard() if restore else None
+
+        if not safe_clipboard_copy(text):
             raise Exception("クリップボードへのコピーに失敗しました")
 
-        paste_delay = get_config_value(config, 'CLIPBOARD', 'paste_delay', 0.2)
+        # 実測したクリップボード反映時間だけ待つ（paste_delayは上限）
+        delay = get_paste_delay(get_config_value(config, 'CLIPBOARD', 'paste_delay', 0.2))
+        if delay > 0:
+            time.sleep(delay)
 
-        def delayed_paste():
-            try:
-                time.sleep(paste_delay)
-                if not safe_paste_text():
-                    logging.error("貼り付け実行に失敗しました")
-            except Exception as paste_error:
-                logging.error(f"遅延ペースト中にエラー: {str(paste_error)}", exc_info=True)
+        if not safe_paste_text():
+            logging.error("貼り付け実行に失敗しました")
+            return False
 
-        paste_thread = threading.Thread(target=delayed_paste, daemon=True)
-        paste_thread.start()
+        if restore:
+            schedule_clipboard_restore(
+                snapshot, text, get_config_value(config, 'CLIPBOARD', 'restore_delay', 0.5)
+            )
+        return True
 
     except Exception as e:
         logging.error(f"コピー&ペースト処理でエラー: {str(e)}", exc_info=True)
         raise
 
 
+def get_output_worker() -> OutputWorker:
+    return _output_worker
+
+
+def snapshot_clipboard() -> Optional[str]:
+    """貼り付け前のクリップボード内容を取得（復元待ちがあればその内容を引き継ぐ）"""
+    global _restore_token, _restore_snapshot, _restore_future
+    with _restore_lock:
+        if _restore_token is not None:
+            # 連続して貼り付けた場合も最初の内容を復元する
+            if _restore_future is not None:
+                _restore_future.cancel()
+                _restore_future = None
+            _restore_token = None
+            return _restore_snapshot
+
+    try:
+        return get_clipboard_backend().paste()
+    except Exception as e:
+        logging.warning(f"クリップボード内容の保存に失敗しました: {str(e)}")
+        return None
+
+
+def schedule_clipboard_restore(snapshot: Optional[str], pasted_text: str, delay: float) -> Optional[Future]:
+    """貼り付け先の読み取りを待ってから出力ワーカーでクリップボードを復元（ワーカーの停止時は復元しない）"""
+    global _restore_token, _restore_snapshot, _restore_future
+    if not snapshot:
+        # 空またはテキスト以外の内容は復元できない
+        return None
+
+    token = object()
+    with _restore_lock:
+        _restore_token = token
+        _restore_snapshot = snapshot
+        _restore_future = _output_worker.schedule(delay, _restore_clipboard, token, snapshot, pasted_text)
+        return _restore_future
+
+
+def _restore_clipboard(token: object, snapshot: str, pasted_text: str):
+    global _restore_token, _restore_snapshot, _restore_future
+    with _restore_lock:
+        if _restore_token is not token:
+            # 次の貼り付けに引き継がれた
+            return
+        _restore_token = None
+        _restore_snapshot = None
+        _restore_future = None
+
+    try:
+        backend = get_clipboard_backend()
+        if backend.paste() != pasted_text:
+            logging.info("クリップボードが変更されたため復元をスキップしました")
+            return
+        backend.copy(snapshot)
+        logging.info("クリップボードを復元しました")
+    except Exception as e:
+        logging.error(f"クリップボード復元中にエラー: {str(e)}")
+
+
 def emergency_clipboard_recovery():
     try:
         with _clipboard_lock:
@@ -164,14 +261,9 @@ def emergency_clipboard_recovery():
 
 def initialize_text_processing():
     try:
-        if is_paste_available():
-            pass
-        else:
+        # 起動時はクリップボードを読み書きしない（ユーザーの内容を保持し、起動を待たせない）
+        if not is_paste_available():
             logging.error("貼り付け機能初期化失敗")
 
-        test_result = emergency_clipboard_recovery()
-        if not test_result:
-            logging.warning("クリップボード初期化テストに失敗しました")
-
     except Exception as e:
         logging.error(f"モジュール初期化中にエラー: {str(e)}")
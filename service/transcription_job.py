@@ -0,0 +1,104 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STAGE_QUEUED = '待機中'
+STAGE_TRANSCRIBING = '文字起こし中'
+STAGE_POSTPROCESSING = '後処理中'
+STAGE_DONE = '完了'
+STAGE_CANCELLED = 'キャンセル'
+STAGE_FAILED = 'エラー'
+
+ProgressCallback = Callable[['TranscriptionJob'], None]
+
+
+def transcription_key(path: str, *params: Hashable) -> Optional[Tuple]:
+    """同じ文字起こしの要求かを判定するキー（ファイルの実体と更新状態、文字起こしのパラメーター）"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.normcase(os.path.realpath(path)), stat.st_size, stat.st_mtime_ns) + params
+
+
+class TranscriptionJob:
+    """バックグラウンドで実行する1件の文字起こしのハンドル
+
+    進捗（段階と経過時間）の参照とキャンセルができ、結果（後処理済みのテキスト）はFutureで受け取る
+    APIへの送信中はキャンセルしても通信は止まらず、結果を出力せずに破棄する
+    """
+
+    def __init__(self, source: str, key: Optional[Tuple] = None):
+        self.source = source
+        self.key = key
+        self.future: Future = Future()
+        self.created_at = time.monotonic()
+        self._stage = STAGE_QUEUED
+        self._cancel_requested = threading.Event()
+        self._callbacks: List[ProgressCallback] = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"TranscriptionJob({self.source!r}, stage={self._stage!r})"
+
+    @property
+    def stage(self) -> str:
+        return self._stage
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def add_progress_callback(self, callback: ProgressCallback):
+        """段階が変わるたびに呼ばれる（処理スレッドから呼ばれる）"""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def set_stage(self, stage: str):
+        with self._lock:
+            self._stage = stage
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"進捗の通知中にエラー: {str(e)}")
+
+    def cancel(self) -> bool:
+        """キャンセルを要求し、完了前に取り消せたかを返す"""
+        if self.future.done():
+            return False
+        self._cancel_requested.set()
+        if not self.future.cancel():
+            return False
+        self.set_stage(STAGE_CANCELLED)
+        logger.info(f"文字起こしをキャンセルしました: {self.source}")
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancel_requested.is_set() or self.future.cancelled()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    def set_result(self, text: str):
+        try:
+            self.future.set_result(text)
+        except InvalidStateError:
+            return
+        self.set_stage(STAGE_DONE)
+
+    def set_exception(self, error: BaseException):
+        try:
+            self.future.set_exception(error)
+        except InvalidStateError:
+            return
+        self.set_stage(STAGE_FAILED)
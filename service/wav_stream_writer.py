@@ -0,0 +1,87 @@
+import logging
+import queue
+import threading
+import time
+import wave
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingWavWriter:
+    """録音中のチャンクをバックグラウンドスレッドでWAVファイルへ追記する
+
+    書き込みのたびにヘッダーの長さを更新し、flush_interval ごとにファイルをフラッシュするため、
+    異常終了しても直前のフラッシュまでの音声は再生可能なWAVとして残る
+    """
+
+    def __init__(self, path: str, sample_rate: int, channels: int, flush_interval: float = 1.0):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.flush_interval = flush_interval
+        self.bytes_written = 0
+        self.error: Optional[BaseException] = None
+
+        self._file = open(path, 'wb')
+        self._wave = wave.open(self._file, 'wb')
+        self._wave.setnchannels(channels)
+        self._wave.setsampwidth(2)
+        self._wave.setframerate(sample_rate)
+        # 空でもヘッダーを書いておく
+        self._wave.writeframes(b'')
+        self._file.flush()
+
+        self._queue: 'queue.Queue[Optional[bytes]]' = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='WavStreamWriter', daemon=True)
+        self._thread.start()
+
+    @property
+    def duration(self) -> float:
+        return self.bytes_written / (self.sample_rate * self.channels * 2)
+
+    def write(self, data: bytes):
+        """チャンクを追記キューに入れる（呼び出し元は書き込みを待たない）"""
+        self._queue.put(data)
+
+    def _run(self):
+        last_flush = time.monotonic()
+        finished = False
+        while not finished:
+            batch: List[bytes] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch and self.error is None:
+                try:
+                    data = b''.join(batch)
+                    self._wave.writeframes(data)
+                    if time.monotonic() - last_flush >= self.flush_interval:
+                        self._file.flush()
+                        last_flush = time.monotonic()
+                    self.bytes_written += len(data)
+                except Exception as e:
+                    self.error = e
+                    logger.error(f"録音の逐次保存中にエラー: {self.path}, {e}")
+
+    def close(self, timeout: Optional[float] = None) -> Optional[str]:
+        """残りを書き込んでヘッダーを確定し、保存できたファイルのパスを返す"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"録音の逐次保存の終了がタイムアウトしました: {self.path}")
+            return None
+        try:
+            self._wave.close()
+            self._file.close()
+        except Exception as e:
+            self.error = self.error or e
+            logger.error(f"録音ファイルのクローズ中にエラー: {self.path}, {e}")
+        return self.path if self.error is None else None
@@ -0,0 +1,25 @@
+from typing import Callable
+
+import pytest
+
+from tests.synthetic_audio import SyntheticAudio
+
+
+@pytest.fixture
+def synthetic_audio() -> Callable[..., SyntheticAudio]:
+    """シード固定の合成音声ジェネレーターを作るファクトリ"""
+    def factory(sample_rate: int = 16000, channels: int = 1, seed: int = 0, **kwargs) -> SyntheticAudio:
+        return SyntheticAudio(sample_rate=sample_rate, channels=channels, seed=seed, **kwargs)
+    return factory
+
+
+@pytest.fixture
+def speech_frames(synthetic_audio):
+    """16kHzモノラル・1024フレーム単位の発話らしい音声10秒"""
+    return synthetic_audio().frames(10.0, 1024)
+
+
+@pytest.fixture
+def silence_frames(synthetic_audio):
+    """16kHzモノラル・1024フレーム単位の背景雑音のみの音声3秒"""
+    return synthetic_audio().frames(3.0, 1024, kind='noise')
@@ -0,0 +1,146 @@
+import math
+import random
+import wave
+from array import array
+from typing import Iterator, List, Tuple
+
+# 各信号は1秒分のタイルを一度だけ作り、以降は切り出して並べるため長時間でも高速に生成できる
+TILE_SECONDS = 1.0
+SPEECH = 'speech'
+SILENCE = 'silence'
+NOISE = 'noise'
+TONE = 'tone'
+KINDS = (SPEECH, SILENCE, NOISE, TONE)
+
+
+def _clip(value: float) -> int:
+    return max(-32768, min(32767, int(value)))
+
+
+class SyntheticAudio:
+    """決定的な16bit PCM（発話のような断続音・無音・雑音・正弦波）を任意の長さで生成
+
+    speechは発話区間（burst_seconds）と間（pause_seconds）を乱数で交互に並べ、
+    間は雑音レベルnoise_levelの背景雑音になる（0で完全な無音）
+    """
+
+    def __init__(
+            self,
+            sample_rate: int = 16000,
+            channels: int = 1,
+            seed: int = 0,
+            amplitude: int = 6000,
+            noise_level: int = 100,
+            burst_seconds: Tuple[float, float] = (0.4, 2.5),
+            pause_seconds: Tuple[float, float] = (0.2, 1.2)
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.seed = seed
+        self.amplitude = amplitude
+        self.noise_level = noise_level
+        self.burst_seconds = burst_seconds
+        self.pause_seconds = pause_seconds
+        self._tiles = {}
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.sample_rate * self.channels * 2
+
+    def _tile(self, name: str) -> array:
+        if name not in self._tiles:
+            self._tiles[name] = self._build_tile(name)
+        return self._tiles[name]
+
+    def _build_tile(self, name: str) -> array:
+        rng = random.Random(f"{self.seed}:{name}")
+        rate = self.sample_rate
+        count = int(rate * TILE_SECONDS)
+        if name == SILENCE:
+            mono = [0] * count
+        elif name == NOISE:
+            mono = [_clip(rng.gauss(0, self.noise_level)) for _ in range(count)]
+        elif name == TONE:
+            mono = [_clip(self.amplitude * math.sin(2 * math.pi * 440 * i / rate)) for i in range(count)]
+        elif name.startswith(SPEECH):
+            # 基本周波数と倍音に音節程度（4〜6Hz）の振幅変調をかけた発話らしい信号
+            f0 = rng.uniform(110, 220)
+            syllable_hz = rng.uniform(4, 6)
+            harmonics = [(k, 1 / k) for k in range(1, 6)]
+            mono = []
+            for i in range(count):
+                t = i / rate
+                envelope = 0.55 + 0.45 * math.sin(2 * math.pi * syllable_hz * t)
+                voiced = sum(weight * math.sin(2 * math.pi * f0 * k * t) for k, weight in harmonics) / 2.3
+                mono.append(_clip(self.amplitude * envelope * voiced + rng.gauss(0, self.noise_level)))
+        else:
+            raise ValueError(f"未知の信号の種類です: {name}")
+
+        samples = array('h')
+        for value in mono:
+            samples.extend([value] * self.channels)
+        return samples
+
+    def _fill(self, name: str, frame_count: int, offset: int) -> bytes:
+        tile = self._tile(name)
+        tile_frames = len(tile) // self.channels
+        out = array('h')
+        position = offset % tile_frames
+        while frame_count > 0:
+            take = min(frame_count, tile_frames - position)
+            out.extend(tile[position * self.channels:(position + take) * self.channels])
+            frame_count -= take
+            position = 0
+        return out.tobytes()
+
+    def _timeline(self, kind: str) -> Iterator[Tuple[str, int, int]]:
+        """(タイル名, フレーム数, 切り出し位置) を無限に返す"""
+        rng = random.Random(self.seed)
+        if kind != SPEECH:
+            name = SILENCE if kind == SILENCE or (kind == NOISE and self.noise_level == 0) else kind
+            while True:
+                yield name, self.sample_rate, 0
+        silent = NOISE if self.noise_level > 0 else SILENCE
+        while True:
+            burst = int(rng.uniform(*self.burst_seconds) * self.sample_rate)
+            yield f"{SPEECH}{rng.randrange(3)}", burst, rng.randrange(self.sample_rate)
+            pause = int(rng.uniform(*self.pause_seconds) * self.sample_rate)
+            yield silent, pause, rng.randrange(self.sample_rate)
+
+    def chunks(self, seconds: float, chunk: int = 1024, kind: str = SPEECH) -> Iterator[bytes]:
+        """chunkフレームごとのPCMを順に返す（全体をメモリに保持しない）"""
+        if kind not in KINDS:
+            raise ValueError(f"未知の信号の種類です: {kind}")
+        remaining = int(seconds * self.sample_rate)
+        pending = bytearray()
+        chunk_bytes = chunk * self.channels * 2
+        for name, frame_count, offset in self._timeline(kind):
+            if remaining <= 0:
+                break
+            frame_count = min(frame_count, remaining)
+            remaining -= frame_count
+            pending += self._fill(name, frame_count, offset)
+            start = 0
+            while len(pending) - start >= chunk_bytes:
+                yield bytes(pending[start:start + chunk_bytes])
+                start += chunk_bytes
+            del pending[:start]
+        if pending:
+            yield bytes(pending)
+
+    def frames(self, seconds: float, chunk: int = 1024, kind: str = SPEECH) -> List[bytes]:
+        """AudioRecorder.framesと同じ形式のチャンクのリスト"""
+        return list(self.chunks(seconds, chunk, kind))
+
+    def pcm(self, seconds: float, kind: str = SPEECH) -> bytes:
+        return b''.join(self.chunks(seconds, self.sample_rate, kind))
+
+    def write_wav(self, path: str, seconds: float, kind: str = SPEECH) -> str:
+        """WAVファイルへ逐次書き込む"""
+        with wave.open(path, 'wb') as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            for data in self.chunks(seconds, self.sample_rate, kind):
+                wf.writeframes(data)
+        return path
@@ -1,13 +1,17 @@
 import logging
+import math
 import os
 import threading
 import time
+import wave
+from array import array
 from unittest.mock import Mock, patch
 
 import pyaudio
 import pytest
 
-from service.audio_recorder import AudioRecorder, save_audio
+from service.audio_recorder import AudioRecorder, chunk_rms, measure_frames, save_audio
+from service.recording_history import get_recording_history
 
 
 class TestAudioRecorderInit:
@@ -650,6 +654,38 @@ class TestSaveAudio:
             assert result is not None
             assert "音声ファイル保存完了" in caplog.text
 
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_save_audio_appends_history(self, mock_pyaudio_class, tmp_path):
+        """正常系: 保存した音声ファイルを録音履歴へ追加"""
+        # Arrange
+        mock_pyaudio_class.return_value.get_sample_size.return_value = 2
+        config = {'PATHS': {'TEMP_DIR': str(tmp_path)}, 'AUDIO': {'CHANNELS': '1'}}
+
+        # Act
+        result = save_audio([b'\x00\x00' * 8000], self.sample_rate, config)
+
+        # Assert
+        latest = get_recording_history(str(tmp_path)).latest()
+        assert latest.path == os.path.abspath(result)
+        assert latest.duration == 0.5
+        assert latest.size == 16000
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_save_segment_not_in_history(self, mock_pyaudio_class, tmp_path):
+        """正常系: 録音途中のセグメントは別名で保存し、録音履歴に追加しない"""
+        # Arrange
+        mock_pyaudio_class.return_value.get_sample_size.return_value = 2
+        config = {'PATHS': {'TEMP_DIR': str(tmp_path)}, 'AUDIO': {'CHANNELS': '1'}}
+        full_take = save_audio([b'\x00\x00' * 8000], self.sample_rate, config)
+
+        # Act
+        result = save_audio([b'\x00\x00' * 1600], self.sample_rate, config, segment=True)
+
+        # Assert
+        assert os.path.basename(result).startswith('segment_')
+        assert os.path.exists(result)
+        assert get_recording_history(str(tmp_path)).latest().path == os.path.abspath(full_take)
+
 
 class TestIntegrationScenarios:
     """統合シナリオテスト"""
@@ -862,3 +898,664 @@ class TestErrorHandling:
         # Assert
         assert recorder.is_recording is False
         assert "音声入力中に予期せぬエラーが発生しました" in caplog.text
+
+
+class TestAudioRecorderSegments:
+    """区切り録音のテストクラス"""
+
+    LOUD = array('h', [3000] * 1024).tobytes()
+    SILENT = bytes(2048)
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される設定"""
+        self.mock_config = {
+            'AUDIO': {
+                'SAMPLE_RATE': '16000',
+                'CHANNELS': '1',
+                'CHUNK': '1024'
+            },
+            'PATHS': {
+                'TEMP_DIR': '/test/temp'
+            },
+            'RECORDING': {
+                'segment_min_seconds': '0.1',
+                'segment_max_seconds': '0.5',
+                'segment_silence_ms': '150',
+                'silence_threshold': '500'
+            }
+        }
+
+    def _record(self, recorder, chunks):
+        mock_stream = Mock()
+        mock_stream.read.side_effect = list(chunks) + [Exception("Stop recording")]
+        recorder.stream = mock_stream
+        recorder.is_recording = True
+        recorder.record()
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_segment_emitted_after_silence(self, mock_makedirs):
+        """正常系: 無音が続いたところで区切る"""
+        # Arrange
+        recorder = AudioRecorder(self.mock_config)
+        callback = Mock()
+        recorder.set_segment_callback(callback)
+
+        # Act
+        self._record(recorder, [self.LOUD] * 3 + [self.SILENT] * 3 + [self.LOUD] * 2)
+
+        # Assert
+        callback.assert_called_once()
+        segment, sample_rate = callback.call_args[0]
+        assert len(segment) == 6
+        assert sample_rate == 16000
+        assert recorder.take_remaining_segment() == [self.LOUD] * 2
+        assert len(recorder.frames) == 8
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_segment_emitted_at_max_length(self, mock_makedirs):
+        """正常系: 無音がなくても最大長で区切る"""
+        # Arrange
+        recorder = AudioRecorder(self.mock_config)
+        callback = Mock()
+        recorder.set_segment_callback(callback)
+
+        # Act
+        self._record(recorder, [self.LOUD] * 20)
+
+        # Assert
+        # 0.5秒 = 約7.8チャンク
+        assert [len(c[0][0]) for c in callback.call_args_list] == [8, 8]
+        assert len(recorder.take_remaining_segment()) == 4
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_silence_only_not_emitted(self, mock_makedirs):
+        """境界値: 無音のみの区間は送らない"""
+        # Arrange
+        recorder = AudioRecorder(self.mock_config)
+        callback = Mock()
+        recorder.set_segment_callback(callback)
+
+        # Act
+        self._record(recorder, [self.SILENT] * 10)
+
+        # Assert
+        callback.assert_not_called()
+        assert len(recorder.take_remaining_segment()) < 10
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_no_segments_without_callback(self, mock_makedirs):
+        """正常系: コールバック未設定時は区切らない"""
+        # Arrange
+        recorder = AudioRecorder(self.mock_config)
+
+        # Act
+        self._record(recorder, [self.LOUD] * 3 + [self.SILENT] * 3)
+
+        # Assert
+        assert recorder.segment_start == 0
+        assert len(recorder.take_remaining_segment()) == 6
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_callback_error_does_not_stop_recording(self, mock_makedirs, caplog):
+        """異常系: コールバックの例外で録音を止めない"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+        recorder = AudioRecorder(self.mock_config)
+        recorder.set_segment_callback(Mock(side_effect=Exception("セグメントエラー")))
+
+        # Act
+        self._record(recorder, [self.LOUD] * 3 + [self.SILENT] * 3 + [self.LOUD] * 2)
+
+        # Assert
+        assert len(recorder.frames) == 8
+        assert "セグメント処理中にエラーが発生しました" in caplog.text
+
+    @pytest.mark.parametrize("data,expected", [
+        (bytes(2048), 0.0),
+        (array('h', [1000, -1000]).tobytes(), 1000.0),
+        (b'', 0.0),
+        (b'\x01', 0.0),
+    ])
+    def test_chunk_rms(self, data, expected):
+        """正常系: 16bit PCMの二乗平均平方根"""
+        # Act & Assert
+        assert chunk_rms(data) == pytest.approx(expected)
+
+
+class TestAudioRecorderCallbackCapture:
+    """コールバック方式の録音のテストクラス"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される設定"""
+        self.mock_config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4', 'capture_mode': 'callback'},
+            'PATHS': {'TEMP_DIR': '/test/temp'},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+
+    def _start(self, mock_pyaudio_class):
+        mock_pyaudio_instance = Mock()
+        mock_pyaudio_class.return_value = mock_pyaudio_instance
+        with patch('service.audio_recorder.os.makedirs'):
+            recorder = AudioRecorder(self.mock_config)
+        recorder.start_recording()
+        callback = mock_pyaudio_instance.open.call_args[1]['stream_callback']
+        return recorder, callback
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_start_recording_uses_stream_callback(self, mock_pyaudio_class):
+        """正常系: コールバックを指定してストリームを開く"""
+        # Act
+        recorder, callback = self._start(mock_pyaudio_class)
+
+        # Assert
+        assert recorder.capture_mode == 'callback'
+        assert callback == recorder._on_audio
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_frames_returned_on_stop(self, mock_pyaudio_class):
+        """正常系: コールバックで受け取った音声をチャンク単位のフレームで返す"""
+        # Arrange
+        recorder, callback = self._start(mock_pyaudio_class)
+
+        # Act
+        first = callback(b'\x01\x00' * 4, 4, {}, 0)
+        callback(b'\x02\x00' * 4, 4, {}, 0)
+        frames, sample_rate = recorder.stop_recording()
+
+        # Assert
+        assert first == (None, pyaudio.paContinue)
+        assert frames == [b'\x01\x00' * 4, b'\x02\x00' * 4]
+        assert sample_rate == 16000
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_buffer_grows(self, mock_pyaudio_class):
+        """境界値: 確保した容量を超えても録音を続ける"""
+        # Arrange
+        recorder, callback = self._start(mock_pyaudio_class)
+        chunk = b'\x03\x00' * 4
+        count = recorder._buffer_bytes // len(chunk) + 3
+
+        # Act
+        for _ in range(count):
+            callback(chunk, 4, {}, 0)
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert len(frames) == count
+        assert frames[-1] == chunk
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_completes_after_stop(self, mock_pyaudio_class):
+        """正常系: 停止後のコールバックはストリームを終了させる"""
+        # Arrange
+        recorder, callback = self._start(mock_pyaudio_class)
+        recorder.is_recording = False
+
+        # Act
+        result = callback(b'\x00\x00' * 4, 4, {}, 0)
+
+        # Assert
+        assert result == (None, pyaudio.paComplete)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_record_thread_emits_segments(self, mock_pyaudio_class):
+        """正常系: 録音スレッドが取り出したフレームで区切り録音を行う"""
+        # Arrange
+        self.mock_config['RECORDING'].update({'segment_min_seconds': '0', 'segment_silence_ms': '0'})
+        recorder, callback = self._start(mock_pyaudio_class)
+        segments = []
+        recorder.set_segment_callback(lambda frames, rate: segments.append(frames))
+        thread = threading.Thread(target=recorder.record)
+        thread.start()
+
+        # Act
+        callback(b'\xff\x7f' * 4, 4, {}, 0)
+        callback(b'\x00\x00' * 4, 4, {}, 0)
+        deadline = time.time() + 2.0
+        while len(segments) < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        recorder.stop_recording()
+        thread.join(2.0)
+
+        # Assert
+        assert not thread.is_alive()
+        assert segments[0][0] == b'\xff\x7f' * 4
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_record_raises_when_stream_open_failed(self, mock_pyaudio_class):
+        """異常系: ストリームを開けなかった録音は待たずにエラーになる"""
+        # Arrange
+        mock_pyaudio_instance = Mock()
+        mock_pyaudio_class.return_value = mock_pyaudio_instance
+        mock_pyaudio_instance.open.side_effect = OSError("Invalid input device")
+        with patch('service.audio_recorder.os.makedirs'):
+            recorder = AudioRecorder(self.mock_config)
+        recorder.start_recording()
+        errors = []
+
+        def run():
+            try:
+                recorder.record()
+            except Exception as e:
+                errors.append(e)
+
+        # Act
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(2.0)
+
+        # Assert
+        assert not thread.is_alive()
+        assert isinstance(errors[0], AttributeError)
+        assert recorder.stream is None
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_unknown_capture_mode(self, mock_makedirs):
+        """異常系: 不明な録音方式は blocking を使用"""
+        # Arrange
+        self.mock_config['AUDIO']['capture_mode'] = 'asio'
+
+        # Act
+        recorder = AudioRecorder(self.mock_config)
+
+        # Assert
+        assert recorder.capture_mode == 'blocking'
+
+
+class TestAudioRecorderOverflow:
+    """入力のオーバーフローと欠落フレームのテストクラス"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される設定"""
+        self.mock_config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4'},
+            'PATHS': {'TEMP_DIR': '/test/temp'}
+        }
+        with patch('service.audio_recorder.os.makedirs'):
+            self.recorder = AudioRecorder(self.mock_config)
+
+    def test_blocking_overflow_filled_with_silence(self):
+        """正常系: オーバーフローでも録音を続け、失ったチャンクを無音で補完"""
+        # Arrange
+        chunk = b'\x01\x00' * 4
+        overflow = OSError(pyaudio.paInputOverflowed, "Input overflowed")
+        self.recorder.stream = Mock()
+        self.recorder.stream.read.side_effect = [chunk, overflow, chunk, Exception("Stop recording")]
+        self.recorder.is_recording = True
+
+        # Act
+        self.recorder.record()
+
+        # Assert
+        assert self.recorder.frames == [chunk, bytes(8), chunk]
+        assert self.recorder.metrics.overflows == 1
+        assert self.recorder.metrics.dropped_frames == 4
+        assert self.recorder.metrics.chunks == 4
+
+    def test_other_os_error_stops_recording(self):
+        """異常系: オーバーフロー以外の入力エラーでは録音を停止"""
+        # Arrange
+        self.recorder.stream = Mock()
+        self.recorder.stream.read.side_effect = OSError(-9999, "Unanticipated host error")
+        self.recorder.is_recording = True
+
+        # Act
+        self.recorder.record()
+
+        # Assert
+        assert self.recorder.is_recording is False
+        assert self.recorder.metrics.overflows == 0
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_overflow_and_gap(self, mock_pyaudio_class):
+        """正常系: コールバックの状態と入力時刻からオーバーフローと欠落を数え、欠落を無音で補完"""
+        # Arrange
+        self.mock_config['AUDIO']['capture_mode'] = 'callback'
+        with patch('service.audio_recorder.os.makedirs'):
+            recorder = AudioRecorder(self.mock_config)
+        recorder.start_recording()
+        callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+        chunk = b'\x01\x00' * 4
+        chunk_seconds = 4 / 16000
+
+        # Act
+        callback(chunk, 4, {'input_buffer_adc_time': 1.0}, 0)
+        callback(chunk, 4, {'input_buffer_adc_time': 1.0 + chunk_seconds * 3}, pyaudio.paInputOverflow)
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert b''.join(frames) == chunk + bytes(16) + chunk
+        assert recorder.metrics.overflows == 1
+        assert recorder.metrics.dropped_frames == 8
+        assert recorder.metrics.as_dict()['dropped_seconds'] == 8 / 16000
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_metrics_logged_and_reset(self, mock_pyaudio_class, caplog):
+        """正常系: 停止時に統計を記録し、次の録音でリセット"""
+        # Arrange
+        caplog.set_level(logging.INFO)
+        self.recorder.metrics.overflows = 2
+
+        # Act
+        self.recorder.stop_recording()
+        self.recorder.start_recording()
+
+        # Assert
+        assert "録音中に入力のオーバーフローが発生しました" in caplog.text
+        assert self.recorder.metrics.overflows == 0
+
+
+class TestAudioRecorderPreroll:
+    """プリロール（録音開始前の音声）のテストクラス"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される設定"""
+        # 1ms = 16フレーム = 32バイト
+        self.mock_config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '8',
+                      'capture_mode': 'callback', 'preroll_ms': '1'},
+            'PATHS': {'TEMP_DIR': '/test/temp'},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+
+    def _standby(self, mock_pyaudio_class):
+        with patch('service.audio_recorder.os.makedirs'):
+            recorder = AudioRecorder(self.mock_config)
+        assert recorder.start_standby() is True
+        callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+        return recorder, callback
+
+    @staticmethod
+    def _chunk(value):
+        return array('h', [value] * 8).tobytes()
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_preroll_prepended(self, mock_pyaudio_class):
+        """正常系: 録音開始前の直近の音声を先頭に加える"""
+        # Arrange
+        recorder, callback = self._standby(mock_pyaudio_class)
+        for value in (1, 2, 3):
+            assert callback(self._chunk(value), 8, {}, 0) == (None, pyaudio.paContinue)
+
+        # Act
+        recorder.start_recording()
+        callback(self._chunk(4), 8, {}, 0)
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert b''.join(frames) == self._chunk(2) + self._chunk(3) + self._chunk(4)
+        assert mock_pyaudio_class.call_count == 1  # 録音開始時にデバイスを開き直さない
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_preroll_shorter_than_buffer(self, mock_pyaudio_class):
+        """境界値: 待機が短い場合は待機中の音声のみ加える"""
+        # Arrange
+        recorder, callback = self._standby(mock_pyaudio_class)
+        callback(self._chunk(1), 8, {}, 0)
+
+        # Act
+        recorder.start_recording()
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert b''.join(frames) == self._chunk(1)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_stop_returns_to_standby(self, mock_pyaudio_class):
+        """正常系: 停止後はストリームを閉じずに待機へ戻り、前回の録音は先頭に混ざらない"""
+        # Arrange
+        recorder, callback = self._standby(mock_pyaudio_class)
+        recorder.start_recording()
+        callback(self._chunk(5), 8, {}, 0)
+        recorder.stop_recording()
+
+        # Act
+        callback(self._chunk(6), 8, {}, 0)
+        recorder.start_recording()
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        mock_pyaudio_class.return_value.open.return_value.close.assert_not_called()
+        assert b''.join(frames) == self._chunk(6)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_preroll_handed_over_without_copy(self, mock_pyaudio_class):
+        """正常系: 待機中の音声は録音バッファ上にあり、録音開始時は読み込み位置だけを戻す"""
+        # Arrange
+        recorder, callback = self._standby(mock_pyaudio_class)
+        buffer = recorder._capture_view
+        for value in (1, 2, 3):
+            callback(self._chunk(value), 8, {}, 0)
+
+        # Act
+        with patch.object(recorder, '_write_capture', wraps=recorder._write_capture) as mock_write:
+            recorder.start_recording()
+
+        # Assert
+        mock_write.assert_not_called()
+        assert recorder._capture_view is buffer
+        assert recorder._read_pos == 16 and recorder._write_pos == 48
+        assert b''.join(recorder.stop_recording()[0]) == self._chunk(2) + self._chunk(3)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_long_standby_keeps_buffer_size(self, mock_pyaudio_class):
+        """境界値: 待機が長くなっても録音バッファを拡張せず、直近の音声だけを残す"""
+        # Arrange
+        recorder, callback = self._standby(mock_pyaudio_class)
+        size = len(recorder._capture_view)
+        chunks = [array('h', [value % 100] * 800).tobytes() for value in range(size // 1600 * 3)]
+
+        # Act
+        for data in chunks:
+            callback(data, 800, {}, 0)
+        recorder.start_recording()
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert len(recorder._capture_view) == size
+        assert b''.join(frames) == chunks[-1][-32:]
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_close_releases_device(self, mock_pyaudio_class):
+        """正常系: 終了時に待機入力を止めてデバイスを解放"""
+        # Arrange
+        recorder, _ = self._standby(mock_pyaudio_class)
+
+        # Act
+        recorder.close()
+
+        # Assert
+        assert recorder.is_standby is False
+        mock_pyaudio_class.return_value.open.return_value.close.assert_called_once()
+        mock_pyaudio_class.return_value.terminate.assert_called_once()
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_preroll_disabled(self, mock_makedirs):
+        """正常系: 既定では待機入力を行わない"""
+        # Arrange
+        del self.mock_config['AUDIO']['preroll_ms']
+        recorder = AudioRecorder(self.mock_config)
+
+        # Act & Assert
+        assert recorder.start_standby() is False
+        assert recorder.p is None
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_preroll_requires_callback_mode(self, mock_makedirs, caplog):
+        """異常系: blocking 方式ではプリロールを無効にする"""
+        # Arrange
+        self.mock_config['AUDIO']['capture_mode'] = 'blocking'
+
+        # Act
+        recorder = AudioRecorder(self.mock_config)
+
+        # Assert
+        assert recorder.preroll_ms == 0
+        assert "プリロールは capture_mode = callback の場合のみ有効です" in caplog.text
+
+
+class TestAudioRecorderStreamToDisk:
+    """録音中の逐次保存のテストクラス"""
+
+    def _recorder(self, tmp_path, capture_mode):
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4', 'capture_mode': capture_mode},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '1', 'stream_to_disk': 'True'}
+        }
+        return AudioRecorder(config)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_blocking_capture_streams_to_file(self, mock_pyaudio_class, tmp_path):
+        """正常系: 録音中に書き込み、停止時には保存済みのファイルを返す"""
+        # Arrange
+        recorder = self._recorder(tmp_path, 'blocking')
+        chunks = [b'\x01\x00' * 4, b'\x02\x00' * 4]
+        mock_pyaudio_class.return_value.open.return_value.read.side_effect = chunks + [Exception("Stop recording")]
+        recorder.start_recording()
+
+        # Act
+        recorder.record()
+        frames, _ = recorder.stop_recording()
+        saved = recorder.take_saved_file()
+
+        # Assert
+        with wave.open(saved, 'rb') as wf:
+            assert wf.readframes(wf.getnframes()) == b''.join(frames)
+        assert get_recording_history(str(tmp_path)).latest().path == os.path.abspath(saved)
+        assert recorder.take_saved_file() is None
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_file_in_history_while_recording(self, mock_pyaudio_class, tmp_path):
+        """正常系: 録音中のファイルも履歴に載り、停止時に長さとサイズを更新する"""
+        # Arrange
+        recorder = self._recorder(tmp_path, 'callback')
+        history = get_recording_history(str(tmp_path))
+
+        # Act
+        recorder.start_recording()
+        recording = history.latest()
+        callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+        callback(b'\x04\x00' * 4, 4, {}, 0)
+        recorder.stop_recording()
+
+        # Assert
+        assert recording.size == 0
+        assert history.latest().path == recording.path
+        assert history.latest().size == 8
+        assert len(history) == 1
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_capture_streams_to_file(self, mock_pyaudio_class, tmp_path):
+        """正常系: コールバック方式でも取り出したフレームを書き込む"""
+        # Arrange
+        recorder = self._recorder(tmp_path, 'callback')
+        recorder.start_recording()
+        callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+
+        # Act
+        callback(b'\x03\x00' * 4, 4, {}, 0)
+        recorder.stop_recording()
+
+        # Assert
+        with wave.open(recorder.take_saved_file(), 'rb') as wf:
+            assert wf.readframes(wf.getnframes()) == b'\x03\x00' * 4
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_disabled_by_default(self, mock_pyaudio_class, tmp_path):
+        """正常系: 既定では逐次保存しない"""
+        # Arrange
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4'},
+            'PATHS': {'TEMP_DIR': str(tmp_path)}
+        }
+        recorder = AudioRecorder(config)
+
+        # Act
+        recorder.start_recording()
+        recorder.stop_recording()
+
+        # Assert
+        assert recorder.take_saved_file() is None
+        assert list(tmp_path.glob('*.wav')) == []
+
+
+class TestAudioRecorderSpill:
+    """長時間録音のフレーム退避のテストクラス"""
+
+    def _recorder(self, tmp_path, capture_mode):
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16', 'CHANNELS': '1', 'CHUNK': '4', 'capture_mode': capture_mode},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '0', 'frame_storage': 'spill', 'spill_memory_seconds': '0.5'}
+        }
+        return AudioRecorder(config)
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_blocking_capture_spills_frames(self, mock_pyaudio_class, tmp_path):
+        """正常系: 直近の分だけをメモリに置き、保存時は退避分も順番どおりに書き込む"""
+        # Arrange
+        recorder = self._recorder(tmp_path, 'blocking')
+        chunks = [bytes([value, 0]) * 4 for value in range(10)]
+        mock_pyaudio_class.return_value.open.return_value.read.side_effect = chunks + [Exception("Stop recording")]
+        mock_pyaudio_class.return_value.get_sample_size.return_value = 2
+        recorder.start_recording()
+
+        # Act
+        recorder.record()
+        frames, sample_rate = recorder.stop_recording()
+        path = save_audio(frames, sample_rate, {'PATHS': {'TEMP_DIR': str(tmp_path)}, 'AUDIO': {'CHANNELS': '1'}})
+
+        # Assert
+        assert frames.spilled_bytes == 64
+        with wave.open(path, 'rb') as wf:
+            assert wf.getnframes() == 40
+            assert wf.readframes(40) == b''.join(chunks)
+        frames.close()
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_callback_buffer_is_reused_as_ring(self, mock_pyaudio_class, tmp_path):
+        """正常系: 録音バッファを拡張せずリングとして使い、取り出したフレームは欠けない"""
+        # Arrange
+        recorder = self._recorder(tmp_path, 'callback')
+        recorder.start_recording()
+        callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+        size = len(recorder._capture_view)
+        chunks = [bytes([value, 0]) * 4 for value in range(size // 8 * 3)]
+
+        # Act
+        for data in chunks:
+            callback(data, 4, {}, 0)
+            recorder._drain()
+        frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert len(recorder._capture_view) == size
+        assert list(frames) == chunks
+        frames.close()
+
+
+class TestMeasureFrames:
+    """送信前の音量測定のテストクラス"""
+
+    def test_measure_frames(self):
+        """正常系: フレーム全体の長さ・RMS・ピークを求める"""
+        # Arrange
+        frames = [array('h', [3, -4]).tobytes(), array('h', [0, 0, -7, 0, 0, 0]).tobytes()]
+
+        # Act
+        level = measure_frames(frames, 8, channels=1)
+
+        # Assert
+        assert level.duration == 1.0
+        assert level.rms == pytest.approx(math.sqrt(74 / 8))
+        assert level.peak == 7
+
+    def test_measure_empty(self):
+        """境界値: フレームがなければ長さ0"""
+        # Act
+        level = measure_frames([], 16000)
+
+        # Assert
+        assert level == (0.0, 0.0, 0)
@@ -0,0 +1,296 @@
+import time
+from functools import partial
+from unittest.mock import Mock, patch
+
+import pytest
+
+from service.audio_recorder import AudioRecorder
+from service.capture_process import CaptureProcess, SharedAudioRing
+
+
+class CountingSource:
+    """チャンクごとに値が1ずつ増える音声を実時間で返す入力（録音プロセス内で使用）"""
+
+    def __init__(self, sample_rate, channels, chunk, overflow_every=0):
+        self.sample_rate = sample_rate
+        self.chunk = chunk
+        self.count = 0
+        self.overflow_every = overflow_every
+
+    def read(self):
+        time.sleep(self.chunk / self.sample_rate)
+        self.count += 1
+        if self.overflow_every and self.count % self.overflow_every == 0:
+            return None
+        return bytes([self.count % 256, 0]) * self.chunk
+
+    def close(self):
+        pass
+
+
+def counting_source(sample_rate, channels, chunk):
+    return CountingSource(sample_rate, channels, chunk)
+
+
+def overflowing_source(sample_rate, channels, chunk):
+    return CountingSource(sample_rate, channels, chunk, overflow_every=2)
+
+
+def failing_source(sample_rate, channels, chunk):
+    raise OSError("入力デバイスを開けません")
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSharedAudioRing:
+    """共有メモリのリングバッファのテストクラス"""
+
+    def setup_method(self):
+        self.ring = SharedAudioRing(8)
+
+    def teardown_method(self):
+        self.ring.close()
+
+    def test_read_without_copy(self):
+        """正常系: 書き込んだ分を共有メモリ上のビューで読む"""
+        # Arrange
+        self.ring.write(b'abcd')
+
+        # Act
+        position, views, lost = self.ring.read(0)
+
+        # Assert
+        assert position == 4
+        assert [type(view) for view in views] == [memoryview]
+        assert b''.join(views) == b'abcd'
+        assert lost == 0
+        del views
+
+    def test_wrap_around(self):
+        """境界値: 末尾で折り返したデータを2つのビューで返す"""
+        # Arrange
+        self.ring.write(b'abcdef')
+        position, _, _ = self.ring.read(0)
+        self.ring.write(b'ghij')
+
+        # Act
+        position, views, lost = self.ring.read(position)
+
+        # Assert
+        assert position == 10
+        assert len(views) == 2
+        assert b''.join(views) == b'ghij'
+        del views
+
+    def test_overrun_reports_lost_bytes(self):
+        """異常系: 読み込みが一周以上遅れた分は失ったバイト数として返す"""
+        # Arrange
+        self.ring.write(b'0123456789AB')
+
+        # Act
+        position, views, lost = self.ring.read(0)
+
+        # Assert
+        assert lost == 4
+        assert b''.join(views) == b'456789AB'
+        del views
+
+
+class TestCaptureProcess:
+    """録音プロセスのテストクラス"""
+
+    def test_capture_in_subprocess(self):
+        """正常系: 別プロセスで入力した音声を共有メモリから受け取る"""
+        # Arrange
+        capture = CaptureProcess(16000, 1, 160, ring_seconds=1.0, source_factory=counting_source)
+
+        try:
+            # Act
+            start = capture.begin()
+            assert _wait_for(lambda: capture.ring.total - start >= 320 * 5)
+            assert capture.pause() is True
+            position, views, lost = capture.ring.read(start)
+            data = b''.join(views)
+            del views
+
+            # Assert
+            assert capture.is_alive
+            assert data[:320] == bytes([1, 0]) * 160
+            assert len(data) % 320 == 0
+            assert lost == 0
+            time.sleep(0.05)
+            assert capture.ring.total == position  # 停止後は書き込まない
+        finally:
+            capture.stop()
+
+        assert not capture.is_alive
+
+    def test_overflow_counted_in_subprocess(self):
+        """異常系: 録音プロセスでのオーバーフローを数え、無音で補完"""
+        # Arrange
+        capture = CaptureProcess(16000, 1, 160, ring_seconds=1.0, source_factory=overflowing_source)
+
+        try:
+            # Act
+            start = capture.begin()
+            assert _wait_for(lambda: capture.ring.overflows >= 2)
+            capture.pause()
+            _, views, _ = capture.ring.read(start)
+            data = b''.join(views)
+            del views
+
+            # Assert
+            assert data[320:640] == bytes(320)
+            assert capture.ring.dropped_frames == capture.ring.overflows * 160
+        finally:
+            capture.stop()
+
+    def test_open_failure_reported(self):
+        """異常系: 録音プロセスで入力を開けなければ共有メモリのカウンターで親へ伝える"""
+        # Arrange
+        capture = CaptureProcess(16000, 1, 160, ring_seconds=1.0, source_factory=failing_source)
+
+        try:
+            # Act
+            capture.begin()
+
+            # Assert
+            assert _wait_for(lambda: capture.ring.failures == 1)
+            assert capture.ring.total == 0
+            assert capture.pause() is True
+        finally:
+            capture.stop()
+
+
+class TestAudioRecorderProcessCapture:
+    """録音プロセスを使うAudioRecorderのテストクラス"""
+
+    @pytest.fixture
+    def recorder(self, tmp_path):
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '160', 'capture_mode': 'process'},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+        factory = partial(CaptureProcess, ring_seconds=1.0, source_factory=counting_source)
+        with patch('service.audio_recorder.CaptureProcess', factory):
+            recorder = AudioRecorder(config)
+            yield recorder
+            recorder.close()
+
+    def test_frames_from_subprocess(self, recorder):
+        """正常系: 録音プロセスの音声をチャンク単位のフレームとして返す"""
+        # Act
+        recorder.start_recording()
+        assert _wait_for(lambda: recorder._capture_process.ring.total >= 320 * 5)
+        frames, sample_rate = recorder.stop_recording()
+
+        # Assert
+        assert sample_rate == 16000
+        assert len(frames) >= 5
+        assert frames[0] == bytes([1, 0]) * 160
+        assert recorder.metrics.overflows == 0
+
+    def test_process_reused_between_recordings(self, recorder):
+        """正常系: 2回目の録音ではプロセスを再利用し、前回の音声を含めない"""
+        # Arrange
+        recorder.start_recording()
+        assert _wait_for(lambda: recorder._capture_process.ring.total >= 320 * 3)
+        first, _ = recorder.stop_recording()
+        process = recorder._capture_process
+
+        # Act
+        recorder.start_recording()
+        assert _wait_for(lambda: recorder._capture_process.ring.total >= len(b''.join(first)) + 320 * 3)
+        second, _ = recorder.stop_recording()
+
+        # Assert
+        assert recorder._capture_process is process
+        assert second[0] == bytes([1, 0]) * 160  # 入力は録音ごとに開き直す
+
+    def test_close_stops_subprocess(self, recorder):
+        """正常系: 終了時に録音プロセスを止める"""
+        # Arrange
+        recorder.start_recording()
+        recorder.stop_recording()
+        process = recorder._capture_process
+
+        # Act
+        recorder.close()
+
+        # Assert
+        assert not process.is_alive
+        assert recorder._capture_process is None
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_falls_back_to_stream_when_process_fails(self, mock_pyaudio_class, tmp_path):
+        """異常系: 録音プロセスを作れなければ録音中と表示せず、コールバック方式で入力する"""
+        # Arrange
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4', 'capture_mode': 'process'},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+        with patch('service.audio_recorder.CaptureProcess', side_effect=OSError("共有メモリを確保できません")):
+            recorder = AudioRecorder(config)
+
+            # Act
+            recorder.start_recording()
+            callback = mock_pyaudio_class.return_value.open.call_args[1]['stream_callback']
+            callback(b'\x07\x00' * 4, 4, {}, 0)
+            frames, _ = recorder.stop_recording()
+
+        # Assert
+        assert recorder._capture_process is None
+        assert b''.join(frames) == b'\x07\x00' * 4
+        mock_pyaudio_class.return_value.open.return_value.close.assert_called_once()
+
+    @patch('service.audio_recorder.pyaudio.PyAudio')
+    def test_failed_begin_stops_process(self, mock_pyaudio_class, tmp_path):
+        """異常系: 録音プロセスの開始に失敗したら作りかけのプロセスを止める"""
+        # Arrange
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '4', 'capture_mode': 'process'},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+        process = Mock()
+        process.begin.side_effect = RuntimeError("起動に失敗")
+        with patch('service.audio_recorder.CaptureProcess', return_value=process):
+            recorder = AudioRecorder(config)
+
+            # Act
+            started = recorder._start_process_capture()
+
+        # Assert
+        assert started is False
+        assert recorder.is_recording is False
+        assert recorder._capture_process is None
+        process.stop.assert_called_once()
+
+    def test_record_raises_when_subprocess_fails(self, tmp_path):
+        """異常系: 録音プロセスが入力に失敗したら無音のまま録音を続けずエラーにする"""
+        # Arrange
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '160', 'capture_mode': 'process'},
+            'PATHS': {'TEMP_DIR': str(tmp_path)},
+            'RECORDING': {'auto_stop_timer': '1'}
+        }
+        factory = partial(CaptureProcess, ring_seconds=1.0, source_factory=failing_source)
+        with patch('service.audio_recorder.CaptureProcess', factory):
+            recorder = AudioRecorder(config)
+        recorder.start_recording()
+
+        try:
+            # Act & Assert
+            with pytest.raises(RuntimeError):
+                recorder.record()
+            assert recorder.is_recording is True  # 停止と通知は呼び出し元のエラー処理で行う
+        finally:
+            recorder.stop_recording()
+            recorder.close()
@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pytest
+
+from service.clipboard_backend import (
+    AdaptiveDelay,
+    InMemoryClipboardBackend,
+    SystemClipboardBackend,
+    get_clipboard_backend,
+    set_clipboard_backend,
+    wait_for_clipboard
+)
+
+
+class TestInMemoryClipboardBackend:
+    """メモリ上のクリップボードのテストクラス"""
+
+    def test_copy_and_paste_immediately_visible(self):
+        """正常系: コピー内容がすぐに読み取れる"""
+        # Arrange
+        backend = InMemoryClipboardBackend()
+
+        # Act
+        backend.copy("テキスト")
+
+        # Assert
+        assert backend.paste() == "テキスト"
+        assert backend.copy_count == 1
+
+    def test_copy_visible_after_reads(self):
+        """正常系: 指定回数の読み取り後に反映"""
+        # Arrange
+        backend = InMemoryClipboardBackend("古い", visible_after_reads=2)
+
+        # Act
+        backend.copy("新しい")
+        reads = [backend.paste() for _ in range(3)]
+
+        # Assert
+        assert reads == ["古い", "古い", "新しい"]
+
+    def test_send_paste_records_current_text(self):
+        """正常系: 貼り付け時点の内容を記録"""
+        # Arrange
+        backend = InMemoryClipboardBackend("貼り付け")
+
+        # Act
+        backend.send_paste()
+
+        # Assert
+        assert backend.pasted_texts == ["貼り付け"]
+
+
+class TestSystemClipboardBackend:
+    """OSクリップボードのテストクラス"""
+
+    @patch('service.clipboard_backend.keyboard.send')
+    @patch('service.clipboard_backend.pyperclip.paste', return_value="テキスト")
+    @patch('service.clipboard_backend.pyperclip.copy')
+    def test_delegates_to_pyperclip_and_keyboard(self, mock_copy, mock_paste, mock_send):
+        """正常系: pyperclipとkeyboardを呼び出す"""
+        # Arrange
+        backend = SystemClipboardBackend()
+
+        # Act
+        backend.copy("テキスト")
+        text = backend.paste()
+        backend.send_paste()
+
+        # Assert
+        mock_copy.assert_called_once_with("テキスト")
+        assert text == "テキスト"
+        mock_send.assert_called_once_with('ctrl+v')
+
+
+class TestWaitForClipboard:
+    """クリップボード反映待ちのテストクラス"""
+
+    def test_returns_immediately_when_matched(self):
+        """正常系: 一致していれば待機せずに返す"""
+        # Arrange
+        backend = InMemoryClipboardBackend("一致")
+
+        # Act
+        with patch('service.clipboard_backend.time.sleep') as mock_sleep:
+            elapsed = wait_for_clipboard(backend, "一致", timeout=1.0)
+
+        # Assert
+        assert elapsed is not None
+        mock_sleep.assert_not_called()
+
+    def test_polls_until_matched(self):
+        """正常系: 反映されるまでポーリング"""
+        # Arrange
+        backend = InMemoryClipboardBackend(visible_after_reads=3)
+        backend.copy("新しい")
+
+        # Act
+        elapsed = wait_for_clipboard(backend, "新しい", timeout=1.0, poll_interval=0.001)
+
+        # Assert
+        assert elapsed is not None
+        assert backend.read_count == 4
+
+    def test_returns_none_on_timeout(self):
+        """異常系: タイムアウト時はNone"""
+        # Arrange
+        backend = InMemoryClipboardBackend("違う")
+
+        # Act
+        elapsed = wait_for_clipboard(backend, "期待", timeout=0.01, poll_interval=0.001)
+
+        # Assert
+        assert elapsed is None
+
+
+class TestAdaptiveDelay:
+    """適応的な待ち時間のテストクラス"""
+
+    def test_initial_value(self):
+        """正常系: 計測前は初期値に余裕係数を掛けた値"""
+        # Act
+        delay = AdaptiveDelay(initial=0.1, margin=2.0)
+
+        # Assert
+        assert delay.value == pytest.approx(0.2)
+
+    def test_first_sample_replaces_initial(self):
+        """正常系: 最初の計測値で初期値を置き換える"""
+        # Arrange
+        delay = AdaptiveDelay(initial=0.5, margin=1.0)
+
+        # Act
+        delay.record(0.01)
+
+        # Assert
+        assert delay.value == pytest.approx(0.01)
+
+    def test_moving_average(self):
+        """正常系: 指数移動平均で更新"""
+        # Arrange
+        delay = AdaptiveDelay(initial=0.0, margin=1.0, smoothing=0.5)
+
+        # Act
+        delay.record(0.1)
+        delay.record(0.3)
+
+        # Assert
+        assert delay.value == pytest.approx(0.2)
+
+    @pytest.mark.parametrize("observed,expected", [
+        (0.0, 0.01),
+        (10.0, 0.5),
+    ])
+    def test_value_clamped(self, observed, expected):
+        """境界値: 最小値と最大値の範囲に収める"""
+        # Arrange
+        delay = AdaptiveDelay(initial=0.0, minimum=0.01, maximum=0.5)
+
+        # Act
+        delay.record(observed)
+
+        # Assert
+        assert delay.value == pytest.approx(expected)
+
+
+class TestBackendRegistry:
+    """バックエンド差し替えのテストクラス"""
+
+    def test_set_clipboard_backend_returns_previous(self):
+        """正常系: 差し替え前のバックエンドを返す"""
+        # Arrange
+        backend = InMemoryClipboardBackend()
+
+        # Act
+        previous = set_clipboard_backend(backend)
+        try:
+            current = get_clipboard_backend()
+        finally:
+            set_clipboard_backend(previous)
+
+        # Assert
+        assert current is backend
+        assert get_clipboard_backend() is previous
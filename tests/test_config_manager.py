@@ -0,0 +1,65 @@
+import configparser
+
+import pytest
+
+from utils.config_manager import get_config_value
+
+
+class TestGetConfigValue:
+    """設定値の取得のテストクラス"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ('true', True),
+        ('True', True),
+        ('False', False),
+        (' false ', False),
+        ('0', False),
+        ('1', True),
+        ('yes', True),
+        ('off', False),
+    ])
+    def test_boolean_values(self, value, expected):
+        """パラメータ化テスト: 真偽値は設定ファイルの表記で解釈する（'False' を True にしない）"""
+        # Arrange
+        config = {'CLIPBOARD': {'restore_clipboard': value}}
+
+        # Act & Assert
+        assert get_config_value(config, 'CLIPBOARD', 'restore_clipboard', True) is expected
+
+    @pytest.mark.parametrize("default", [True, False])
+    def test_invalid_boolean_returns_default(self, default):
+        """異常系: 解釈できない真偽値は既定値"""
+        # Arrange
+        config = {'CLIPBOARD': {'restore_clipboard': 'maybe'}}
+
+        # Act & Assert
+        assert get_config_value(config, 'CLIPBOARD', 'restore_clipboard', default) is default
+
+    def test_boolean_from_config_parser(self):
+        """正常系: ConfigParserから読んだ真偽値も同じように解釈する"""
+        # Arrange
+        config = configparser.ConfigParser()
+        config.read_string("[RECORDING]\nlive_typing = False\n")
+
+        # Act & Assert
+        assert get_config_value(config, 'RECORDING', 'live_typing', True) is False
+
+    def test_missing_key_returns_default(self):
+        """境界値: セクションやキーがなければ既定値"""
+        # Act & Assert
+        assert get_config_value({}, 'RECORDING', 'live_typing', False) is False
+        assert get_config_value({'RECORDING': {}}, 'RECORDING', 'live_typing', True) is True
+
+    @pytest.mark.parametrize("value,default,expected", [
+        ('2.5', 1.0, 2.5),
+        ('30', 0, 30),
+        ('abc', 7, 7),
+        ('callback', 'blocking', 'callback'),
+    ])
+    def test_other_types_converted_by_default_type(self, value, default, expected):
+        """パラメータ化テスト: 真偽値以外は既定値の型へ変換し、失敗すれば既定値"""
+        # Arrange
+        config = {'AUDIO': {'key': value}}
+
+        # Act & Assert
+        assert get_config_value(config, 'AUDIO', 'key', default) == expected
@@ -0,0 +1,83 @@
+import pytest
+
+from service.frame_store import SpillingFrameStore
+
+
+class TestSpillingFrameStore:
+    """録音フレームの退避ストアのテストクラス"""
+
+    def test_spills_old_frames(self, tmp_path):
+        """正常系: メモリの上限を超えた古いフレームを退避し、順番どおりに読める"""
+        # Arrange
+        store = SpillingFrameStore(str(tmp_path), memory_bytes=8)
+        frames = [bytes([value]) * 4 for value in range(6)]
+
+        # Act
+        for data in frames:
+            store.append(data)
+
+        # Assert
+        assert len(store) == 6
+        assert store.spilled_bytes == 16
+        assert store.nbytes == 24
+        assert list(store) == frames
+        assert store[0] == frames[0]
+        assert store[-1] == frames[-1]
+        assert store[2:5] == frames[2:5]
+        store.close()
+
+    def test_variable_length_frames(self, tmp_path):
+        """正常系: 長さの異なるフレームも境界を保って読める"""
+        # Arrange
+        store = SpillingFrameStore(str(tmp_path), memory_bytes=0)
+        frames = [b'a', b'bcd', b'', b'efghij', b'k']
+
+        # Act
+        for data in frames:
+            store.append(data)
+
+        # Assert
+        assert list(store) == frames
+        assert b''.join(store) == b'abcdefghijk'
+        store.close()
+
+    def test_append_after_read(self, tmp_path):
+        """正常系: 読み込み後に退避が進んでも新しいフレームを読める"""
+        # Arrange
+        store = SpillingFrameStore(str(tmp_path), memory_bytes=2)
+        store.append(b'12')
+        store.append(b'34')
+        assert store[0] == b'12'
+
+        # Act
+        store.append(b'56')
+        store.append(b'78')
+
+        # Assert
+        assert store[:] == [b'12', b'34', b'56', b'78']
+        store.close()
+
+    def test_index_out_of_range(self, tmp_path):
+        """異常系: 範囲外の番号は IndexError"""
+        # Arrange
+        store = SpillingFrameStore(str(tmp_path), memory_bytes=8)
+        store.append(b'ab')
+
+        # Act & Assert
+        with pytest.raises(IndexError):
+            store[1]
+        store.close()
+
+    def test_close_removes_spill_file(self, tmp_path):
+        """正常系: 閉じると退避ファイルは残らない"""
+        # Arrange
+        store = SpillingFrameStore(str(tmp_path), memory_bytes=0)
+        store.append(b'abcd')
+        list(store)
+
+        # Act
+        store.close()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+        assert len(store) == 0
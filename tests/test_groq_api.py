@@ -58,6 +58,32 @@ class TestSetupGroqClient:
         with pytest.raises(ValueError, match="GROQ_API_KEYが未設定です"):
             setup_groq_client()
 
+    @patch('external_service.groq_api.load_env_variables')
+    @patch('external_service.groq_api.Groq')
+    def test_setup_groq_client_base_url_argument(self, mock_groq, mock_load_env):
+        """正常系: 引数のbase_urlで接続先を変更"""
+        # Arrange
+        mock_load_env.return_value = {"GROQ_API_KEY": "test-api-key", "GROQ_BASE_URL": "http://env:1"}
+
+        # Act
+        setup_groq_client(base_url="http://127.0.0.1:8765")
+
+        # Assert
+        mock_groq.assert_called_once_with(api_key="test-api-key", base_url="http://127.0.0.1:8765")
+
+    @patch('external_service.groq_api.load_env_variables')
+    @patch('external_service.groq_api.Groq')
+    def test_setup_groq_client_base_url_from_env(self, mock_groq, mock_load_env):
+        """正常系: .envのGROQ_BASE_URLで接続先を変更"""
+        # Arrange
+        mock_load_env.return_value = {"GROQ_API_KEY": "test-api-key", "GROQ_BASE_URL": "http://127.0.0.1:8765"}
+
+        # Act
+        setup_groq_client()
+
+        # Assert
+        mock_groq.assert_called_once_with(api_key="test-api-key", base_url="http://127.0.0.1:8765")
+
 
 class TestTranscribeAudio:
     """音声文字起こし機能のテストクラス"""
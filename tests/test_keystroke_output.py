@@ -0,0 +1,164 @@
+import logging
+from unittest.mock import call, patch
+
+import pytest
+
+from service.keystroke_output import (
+    CLIPBOARD,
+    KEYSTROKE,
+    get_foreground_window_title,
+    select_output_mode,
+    split_chunks,
+    type_text,
+    type_text_from_config
+)
+
+
+class TestSelectOutputMode:
+    """出力方式選択のテストクラス"""
+
+    def test_default_is_clipboard(self):
+        """正常系: 設定がなければクリップボード"""
+        # Act & Assert
+        assert select_output_mode({}, window_title='') == CLIPBOARD
+
+    def test_keystroke_from_config(self):
+        """正常系: 設定でキー入力を選択"""
+        # Arrange
+        config = {'OUTPUT': {'mode': 'Keystroke'}}
+
+        # Act & Assert
+        assert select_output_mode(config, window_title='') == KEYSTROKE
+
+    def test_unknown_mode_falls_back_to_clipboard(self, caplog):
+        """異常系: 不明な出力方式はクリップボード"""
+        # Arrange
+        caplog.set_level(logging.WARNING)
+        config = {'OUTPUT': {'mode': 'unknown'}}
+
+        # Act
+        mode = select_output_mode(config, window_title='')
+
+        # Assert
+        assert mode == CLIPBOARD
+        assert "不明な出力方式です" in caplog.text
+
+    @pytest.mark.parametrize("title,expected", [
+        ("リモートデスクトップ接続 - Server", KEYSTROKE),
+        ("電子カルテ", CLIPBOARD),
+        ("メモ帳", KEYSTROKE),
+        ("", KEYSTROKE),
+    ])
+    def test_window_overrides(self, title, expected):
+        """正常系: 前面ウィンドウのタイトルで出力方式を切り替え"""
+        # Arrange
+        config = {'OUTPUT': {
+            'mode': 'keystroke',
+            'keystroke_windows': 'リモートデスクトップ',
+            'clipboard_windows': '電子カルテ, Word',
+        }}
+
+        # Act & Assert
+        assert select_output_mode(config, window_title=title) == expected
+
+    @patch('service.keystroke_output.get_foreground_window_title', return_value='Remote Desktop')
+    def test_uses_foreground_window_title(self, mock_title):
+        """正常系: タイトル未指定時は前面ウィンドウから取得"""
+        # Arrange
+        config = {'OUTPUT': {'keystroke_windows': 'remote desktop'}}
+
+        # Act & Assert
+        assert select_output_mode(config) == KEYSTROKE
+        mock_title.assert_called_once()
+
+    @patch('service.keystroke_output.get_foreground_window_title')
+    def test_title_not_queried_without_window_rules(self, mock_title):
+        """正常系: ウィンドウ指定がなければタイトルを取得しない"""
+        # Act
+        select_output_mode({'OUTPUT': {'mode': 'clipboard'}})
+
+        # Assert
+        mock_title.assert_not_called()
+
+    @patch('service.keystroke_output.sys.platform', 'linux')
+    def test_window_title_empty_on_non_windows(self):
+        """境界値: Windows以外では空文字"""
+        # Act & Assert
+        assert get_foreground_window_title() == ''
+
+
+class TestTypeText:
+    """キー入力出力のテストクラス"""
+
+    @pytest.mark.parametrize("text,chunk_size,expected", [
+        ("abcdef", 4, ["abcd", "ef"]),
+        ("abc", 3, ["abc"]),
+        ("abc", 0, ["abc"]),
+    ])
+    def test_split_chunks(self, text, chunk_size, expected):
+        """正常系: 指定文字数ごとに分割"""
+        # Act & Assert
+        assert split_chunks(text, chunk_size) == expected
+
+    @patch('service.keystroke_output.time.sleep')
+    @patch('service.keystroke_output.keyboard.write')
+    def test_type_text_in_chunks(self, mock_write, mock_sleep):
+        """正常系: 分割して入力し、分割の間だけ待機"""
+        # Act
+        result = type_text("あいうえおかき", chunk_size=3, chunk_interval=0.02)
+
+        # Assert
+        assert result is True
+        assert mock_write.call_args_list == [
+            call("あいう", delay=0.0), call("えおか", delay=0.0), call("き", delay=0.0)
+        ]
+        assert mock_sleep.call_args_list == [call(0.02), call(0.02)]
+
+    @patch('service.keystroke_output.time.sleep')
+    @patch('service.keystroke_output.keyboard.write')
+    def test_short_text_does_not_wait(self, mock_write, mock_sleep):
+        """正常系: 1回で入力できる場合は待機しない"""
+        # Act
+        result = type_text("短い", chunk_size=32)
+
+        # Assert
+        assert result is True
+        mock_write.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('service.keystroke_output.keyboard.write')
+    def test_empty_text(self, mock_write):
+        """境界値: 空文字は入力しない"""
+        # Act & Assert
+        assert type_text("") is False
+        mock_write.assert_not_called()
+
+    @patch('service.keystroke_output.keyboard.write')
+    def test_write_exception(self, mock_write, caplog):
+        """異常系: keyboard.writeで例外発生"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+        mock_write.side_effect = Exception("入力エラー")
+
+        # Act
+        result = type_text("テキスト")
+
+        # Assert
+        assert result is False
+        assert "キー入力での出力に失敗" in caplog.text
+
+    @patch('service.keystroke_output.type_text', return_value=True)
+    def test_type_text_from_config(self, mock_type):
+        """正常系: 設定値で入力"""
+        # Arrange
+        config = {'OUTPUT': {
+            'keystroke_chunk_size': '8',
+            'keystroke_chunk_interval': '0.05',
+            'keystroke_char_delay': '0.001',
+        }}
+
+        # Act
+        type_text_from_config("テキスト", config)
+
+        # Assert
+        mock_type.assert_called_once_with("テキスト", chunk_size=8, chunk_interval=0.05, char_delay=0.001)
@@ -0,0 +1,153 @@
+import importlib.util
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from scripts.startup_report import format_report, package_totals, parse_importtime, run_importtime
+from utils.lazy_import import lazy_import, preload_modules
+
+MODULE_SOURCE = '''
+import sys
+sys.modules[__name__ + '_loaded'] = True
+VALUE = 1
+
+def get_value():
+    return VALUE
+'''
+
+
+@pytest.fixture
+def lazy_module_name(tmp_path):
+    name = f"lazy_target_{tmp_path.name.replace('-', '_')}"
+    (tmp_path / f"{name}.py").write_text(MODULE_SOURCE, encoding='utf-8')
+    sys.path.insert(0, str(tmp_path))
+    yield name
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop(name, None)
+    sys.modules.pop(name + '_loaded', None)
+
+
+class TestLazyImport:
+    """遅延読み込みのテストクラス"""
+
+    def test_module_executed_on_first_attribute_access(self, lazy_module_name):
+        """正常系: 属性に初めてアクセスした時点で読み込む"""
+        # Act
+        module = lazy_import(lazy_module_name)
+
+        # Assert
+        assert lazy_module_name + '_loaded' not in sys.modules
+        assert module.VALUE == 1
+        assert lazy_module_name + '_loaded' in sys.modules
+
+    def test_returns_already_imported_module(self):
+        """正常系: 読み込み済みのモジュールはそのまま返す"""
+        # Arrange
+        import json
+
+        # Act & Assert
+        assert lazy_import('json') is json
+
+    def test_missing_module_raises(self):
+        """異常系: 存在しないモジュールはModuleNotFoundError"""
+        # Act & Assert
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import('no_such_module_for_lazy_import')
+
+    def test_attributes_patchable(self, lazy_module_name):
+        """正常系: 遅延モジュールの属性をpatchで差し替えられる"""
+        # Arrange
+        module = lazy_import(lazy_module_name)
+
+        # Act & Assert
+        with patch(f"{lazy_module_name}.VALUE", 5):
+            assert module.get_value() == 5
+        assert module.get_value() == 1
+
+    def test_preload_modules(self, lazy_module_name):
+        """正常系: 遅延モジュールの読み込みを完了させる"""
+        # Arrange
+        lazy_import(lazy_module_name)
+
+        # Act
+        preload_modules([lazy_module_name])
+
+        # Assert
+        assert lazy_module_name + '_loaded' in sys.modules
+
+    def test_concurrent_calls_share_module(self, lazy_module_name):
+        """境界値: 複数スレッドから同時に呼んでも同じモジュールを返す"""
+        # Arrange
+        find_spec = importlib.util.find_spec
+        barrier = threading.Barrier(4)
+        results = []
+
+        def find_spec_together(name, *args):
+            # 全スレッドが読み込み済みの確認を通過してから登録へ進むようにする
+            barrier.wait(2.0)
+            return find_spec(name, *args)
+
+        def worker():
+            results.append(lazy_import(lazy_module_name))
+
+        # Act
+        with patch('importlib.util.find_spec', side_effect=find_spec_together):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5.0)
+
+        # Assert
+        assert len(results) == 4
+        assert all(module is results[0] for module in results)
+        assert sys.modules[lazy_module_name] is results[0]
+
+
+class TestStartupReport:
+    """起動時の読み込み時間レポートのテストクラス"""
+
+    OUTPUT = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |     groq._types',
+        'import time:       300 |        400 |   groq',
+        'import time:        50 |         50 | json',
+        'その他の出力',
+    ])
+
+    def test_parse_importtime(self):
+        """正常系: -X importtimeの出力を解析"""
+        # Act
+        records = parse_importtime(self.OUTPUT)
+
+        # Assert
+        assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+            ('groq._types', 100, 100, 2),
+            ('groq', 300, 400, 1),
+            ('json', 50, 50, 0),
+        ]
+
+    def test_package_totals_and_report(self):
+        """正常系: パッケージごとに集計して表示"""
+        # Arrange
+        records = parse_importtime(self.OUTPUT)
+
+        # Act
+        totals = package_totals(records)
+        report = format_report({'テスト': records}, top=1)
+
+        # Assert
+        assert totals == {'groq': 400, 'json': 50}
+        assert 'groq' in report
+        assert 'json' not in report
+
+    def test_main_defers_heavy_imports(self):
+        """性能: main.pyの読み込みではgroqと音声・キーボード関連を読み込まない"""
+        # Act
+        modules = {record.module for record in run_importtime(['main'])}
+
+        # Assert
+        assert 'main' in modules
+        assert not modules & {'groq', 'httpx', 'pydantic', 'pyaudio', 'keyboard', 'pyperclip'}
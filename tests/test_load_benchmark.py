@@ -0,0 +1,149 @@
+import os
+import tempfile
+import threading
+import wave
+
+import pytest
+
+from scripts.benchmark_load import (
+    FakeMaster,
+    format_report,
+    load_wav_frames,
+    percentile,
+    run_load_test,
+    synthetic_frames,
+)
+from scripts.mock_groq_server import MockGroqServer
+from service.clipboard_backend import get_clipboard_backend
+
+
+@pytest.fixture
+def master():
+    master = FakeMaster().start()
+    yield master
+    master.destroy()
+
+
+class TestFakeMaster:
+    """Tkの代わりのイベントループのテストクラス"""
+
+    def test_after_runs_in_time_order(self, master):
+        """正常系: 予定時刻の順に実行"""
+        # Arrange
+        calls = []
+        done = threading.Event()
+
+        # Act
+        master.after(30, lambda: (calls.append('late'), done.set()))
+        master.after(0, calls.append, 'early')
+        done.wait(1.0)
+
+        # Assert
+        assert calls == ['early', 'late']
+
+    def test_after_cancel(self, master):
+        """正常系: 取り消したコールバックは実行しない"""
+        # Arrange
+        calls = []
+        done = threading.Event()
+
+        # Act
+        after_id = master.after(10, calls.append, 'cancelled')
+        master.after_cancel(after_id)
+        master.after(20, done.set)
+        done.wait(1.0)
+
+        # Assert
+        assert calls == []
+
+    def test_winfo_exists_false_after_destroy(self):
+        """正常系: 破棄後はUI無効として扱われる"""
+        # Arrange
+        master = FakeMaster().start()
+
+        # Act
+        master.destroy()
+
+        # Assert
+        assert master.winfo_exists() is False
+
+
+class TestLoadTestHelpers:
+    """音声フレームと集計のテストクラス"""
+
+    def test_synthetic_frames_chunked(self):
+        """正常系: 指定した長さの16bit PCMをチャンクに分割"""
+        # Act
+        frames, sample_rate = synthetic_frames(1.0, 16000, 1024)
+
+        # Assert
+        assert sample_rate == 16000
+        assert sum(len(frame) for frame in frames) == 32000
+        assert len(frames[0]) == 2048
+
+    def test_load_wav_frames_roundtrip(self):
+        """正常系: 録音済みWAVを読み込んでチャンクに分割"""
+        # Arrange
+        frames, _ = synthetic_frames(0.5, 8000, 256)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'session.wav')
+            with wave.open(path, 'wb') as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(8000)
+                wf.writeframes(b''.join(frames))
+
+            # Act
+            loaded, sample_rate = load_wav_frames(path, 256)
+
+        # Assert
+        assert sample_rate == 8000
+        assert b''.join(loaded) == b''.join(frames)
+
+    def test_percentile_nearest_rank(self):
+        """正常系: 最近傍順位法の百分位数"""
+        # Arrange
+        values = [float(i) for i in range(1, 101)]
+
+        # Act & Assert
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+
+class TestRunLoadTest:
+    """模擬サーバーを使った負荷試験のテストクラス"""
+
+    def test_concurrent_users_complete_all_jobs(self):
+        """正常系: 全利用者のジョブが貼り付けまで完了"""
+        # Arrange
+        previous_backend = get_clipboard_backend()
+        sessions = [synthetic_frames(0.5)]
+
+        # Act
+        with MockGroqServer(latency='fixed:0.01', text='負荷試験') as server:
+            result = run_load_test(3, 2, sessions, server.base_url, job_timeout=10.0)
+
+        # Assert
+        assert result['completed'] == 6
+        assert result['errors'] == 0
+        assert result['pasted'] == 6
+        assert result['jobs_per_second'] > 0
+        assert 0 < result['p50'] <= result['p99'] <= result['max']
+        assert server.stats()['status_counts'] == {200: 6}
+        assert get_clipboard_backend() is previous_backend
+
+    def test_server_errors_reported(self):
+        """異常系: 文字起こしの失敗を件数として集計"""
+        # Arrange
+        sessions = [synthetic_frames(0.2)]
+
+        # Act
+        with MockGroqServer(error_500_rate=1.0) as server:
+            result = run_load_test(2, 1, sessions, server.base_url, job_timeout=10.0, max_retries=0)
+
+        # Assert
+        assert result['completed'] == 0
+        assert result['errors'] == 2
+        assert '失敗: 2' in format_report(result)
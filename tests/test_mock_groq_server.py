@@ -0,0 +1,205 @@
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import groq
+import pytest
+from groq import Groq
+
+from external_service.groq_api import setup_groq_client, transcribe_audio
+from scripts.mock_groq_server import MockGroqServer, parse_latency
+
+CONFIG = {
+    'WHISPER': {
+        'MODEL': 'whisper-large-v3',
+        'PROMPT': 'テスト',
+        'LANGUAGE': 'ja'
+    }
+}
+
+
+def _client(server: MockGroqServer, timeout: float = 5.0) -> Groq:
+    return Groq(api_key='test-key', base_url=server.base_url, max_retries=0, timeout=timeout)
+
+
+def _transcribe(client: Groq, response_format: str = 'text'):
+    return client.audio.transcriptions.create(
+        file=('test.wav', b'RIFF0000WAVE'),
+        model='whisper-large-v3',
+        response_format=response_format,
+        language='ja'
+    )
+
+
+@pytest.fixture
+def audio_file():
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+        f.write(b'RIFF0000WAVEfmt ')
+        path = f.name
+    yield path
+    os.unlink(path)
+
+
+class TestParseLatency:
+    """遅延分布の指定解析のテストクラス"""
+
+    def test_fixed_and_uniform(self):
+        """正常系: 固定値と一様分布"""
+        # Arrange
+        import random
+        rng = random.Random(0)
+
+        # Act & Assert
+        assert parse_latency('fixed:0.25')(rng) == 0.25
+        assert all(0.1 <= parse_latency('uniform:0.1,0.2')(rng) <= 0.2 for _ in range(20))
+        assert parse_latency('normal:0,1')(rng) >= 0
+
+    def test_invalid_spec(self):
+        """異常系: 不正な指定はValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            parse_latency('gamma:1')
+
+
+class TestMockGroqServer:
+    """模擬Groqサーバーと実際のGroqクライアントの結合テストクラス"""
+
+    def test_text_response(self):
+        """正常系: response_format=textで文字列を返す"""
+        # Arrange
+        with MockGroqServer(text='模擬結果') as server:
+            # Act
+            result = _transcribe(_client(server))
+
+        # Assert
+        assert result == '模擬結果'
+        assert server.stats()['status_counts'] == {200: 1}
+
+    def test_json_response(self):
+        """正常系: response_format=jsonでtext属性を返す"""
+        # Arrange
+        with MockGroqServer(text='模擬結果') as server:
+            # Act
+            result = _transcribe(_client(server), 'json')
+
+        # Assert
+        assert result.text == '模擬結果'
+
+    def test_transcribe_audio_through_setup_client(self, audio_file):
+        """正常系: setup_groq_clientのbase_url指定で文字起こし全体を実行"""
+        # Arrange
+        with MockGroqServer(text='パイプライン結果') as server:
+            with patch('external_service.groq_api.load_env_variables', return_value={'GROQ_API_KEY': 'test-key'}):
+                client = setup_groq_client(base_url=server.base_url)
+
+            # Act
+            result = transcribe_audio(audio_file, CONFIG, client)
+
+        # Assert
+        assert result == 'パイプライン結果'
+
+    def test_error_429_injected(self):
+        """異常系: 429を注入するとRateLimitError"""
+        # Arrange
+        with MockGroqServer(error_429_rate=1.0) as server:
+            # Act & Assert
+            with pytest.raises(groq.RateLimitError):
+                _transcribe(_client(server))
+
+    def test_error_500_injected(self):
+        """異常系: 500を注入するとInternalServerError"""
+        # Arrange
+        with MockGroqServer(error_500_rate=1.0) as server:
+            # Act & Assert
+            with pytest.raises(groq.InternalServerError):
+                _transcribe(_client(server))
+
+    def test_client_retries_injected_errors(self):
+        """正常系: クライアントの再試行で一部のエラーから回復"""
+        # Arrange
+        with MockGroqServer(error_500_rate=0.5, seed=1) as server:
+            client = Groq(api_key='test-key', base_url=server.base_url, max_retries=5)
+
+            # Act
+            with patch('groq._base_client.BaseClient._calculate_retry_timeout', return_value=0.0):
+                results = [_transcribe(client) for _ in range(4)]
+
+        # Assert
+        assert len(results) == 4
+        assert server.stats()['requests'] > 4
+
+    def test_timeout_injected(self):
+        """異常系: 応答しない場合はクライアント側でタイムアウト"""
+        # Arrange
+        with MockGroqServer(timeout_rate=1.0, hang_seconds=5.0) as server:
+            # Act & Assert
+            start = time.perf_counter()
+            with pytest.raises(groq.APITimeoutError):
+                _transcribe(_client(server, timeout=0.2))
+            assert time.perf_counter() - start < 2.0
+
+    def test_latency_applied(self):
+        """正常系: 設定した遅延の後に応答"""
+        # Arrange
+        with MockGroqServer(latency='fixed:0.1') as server:
+            client = _client(server)
+
+            # Act
+            start = time.perf_counter()
+            _transcribe(client)
+            elapsed = time.perf_counter() - start
+
+        # Assert
+        assert elapsed >= 0.1
+
+    def test_max_concurrent_caps_parallel_requests(self):
+        """正常系: 同時処理数の上限を超えた分は待たされる"""
+        # Arrange
+        with MockGroqServer(latency='fixed:0.05', max_concurrent=2) as server:
+            errors = []
+
+            def worker():
+                try:
+                    _transcribe(_client(server))
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=worker) for _ in range(6)]
+
+            # Act
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5.0)
+
+        # Assert
+        assert errors == []
+        assert server.stats()['max_active'] == 2
+        assert server.stats()['status_counts'] == {200: 6}
+
+    def test_requests_per_second_rejects_excess(self):
+        """異常系: 毎秒リクエスト数の上限を超えると429"""
+        # Arrange
+        with MockGroqServer(requests_per_second=2) as server:
+            client = _client(server)
+
+            # Act
+            _transcribe(client)
+            _transcribe(client)
+            with pytest.raises(groq.RateLimitError):
+                _transcribe(client)
+
+        # Assert
+        assert server.stats()['status_counts'] == {200: 2, 429: 1}
+
+    def test_unknown_path_returns_404(self):
+        """異常系: 文字起こし以外のパスは404"""
+        # Arrange
+        with MockGroqServer() as server:
+            client = _client(server)
+
+            # Act & Assert
+            with pytest.raises(groq.NotFoundError):
+                client.audio.translations.create(file=('test.wav', b'RIFF'), model='whisper-large-v3')
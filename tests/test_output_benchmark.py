@@ -0,0 +1,44 @@
+from scripts.benchmark_output import format_report, main, measure_output
+from service.keystroke_output import CLIPBOARD, KEYSTROKE
+
+
+class TestOutputBenchmark:
+    """出力方式のベンチマークのテストクラス"""
+
+    def test_measure_output_reports_both_modes(self):
+        """正常系: 両方の出力方式の時間を計測"""
+        # Act
+        result = measure_output(20, iterations=2)
+
+        # Assert
+        assert result['length'] == 20
+        assert result[CLIPBOARD] > 0
+        assert result[KEYSTROKE] > 0
+
+    def test_short_text_keystroke_faster_than_clipboard(self):
+        """性能: 短い文字起こしはキー入力の方が速い"""
+        # Act
+        result = measure_output(20, iterations=3, clipboard_reads=2)
+
+        # Assert
+        assert result[KEYSTROKE] < result[CLIPBOARD]
+
+    def test_long_text_keystroke_scales_with_chunks(self):
+        """性能: キー入力は分割数に応じて待機が増える"""
+        # Act
+        short = measure_output(32, iterations=1, chunk_interval=0.005)
+        long = measure_output(320, iterations=1, chunk_interval=0.005)
+
+        # Assert
+        assert long[KEYSTROKE] >= 0.045
+        assert long[KEYSTROKE] > short[KEYSTROKE]
+
+    def test_main_prints_report(self, capsys):
+        """正常系: 計測結果を表示"""
+        # Act
+        exit_code = main(['--lengths', '10', '--iterations', '1'])
+
+        # Assert
+        assert exit_code == 0
+        assert "キー入力" in capsys.readouterr().out
+        assert "文字数" in format_report([])
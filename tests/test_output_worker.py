@@ -0,0 +1,150 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from service.output_worker import OutputWorker
+
+
+class TestOutputWorker:
+    """出力ワーカーのテストクラス"""
+
+    def setup_method(self):
+        self.worker = OutputWorker()
+
+    def teardown_method(self):
+        self.worker.stop(timeout=1.0)
+
+    def test_submit_returns_result(self):
+        """正常系: ジョブの結果をFutureで返す"""
+        # Act
+        future = self.worker.submit(lambda a, b: a + b, 1, 2)
+
+        # Assert
+        assert future.result(timeout=1) == 3
+
+    def test_jobs_run_in_fifo_order_on_single_thread(self):
+        """正常系: 投入順に同じスレッドで実行"""
+        # Arrange
+        results = []
+
+        def job(index):
+            results.append((index, threading.current_thread().name))
+
+        # Act
+        futures = [self.worker.submit(job, i) for i in range(20)]
+        for future in futures:
+            future.result(timeout=1)
+
+        # Assert
+        assert [index for index, _ in results] == list(range(20))
+        assert {name for _, name in results} == {'OutputWorker'}
+
+    def test_job_runs_under_lock(self):
+        """正常系: ジョブ実行中はlockを保持"""
+        # Arrange
+        lock = threading.Lock()
+        worker = OutputWorker(lock)
+
+        # Act
+        try:
+            locked = worker.submit(lock.locked).result(timeout=1)
+        finally:
+            worker.stop(timeout=1.0)
+
+        # Assert
+        assert locked is True
+        assert not lock.locked()
+
+    def test_exception_reported_and_worker_continues(self):
+        """異常系: ジョブの例外はFutureへ渡し、後続のジョブは実行される"""
+        # Arrange
+        def failing():
+            raise ValueError("出力エラー")
+
+        # Act
+        failed = self.worker.submit(failing)
+        succeeded = self.worker.submit(lambda: "完了")
+
+        # Assert
+        with pytest.raises(ValueError, match="出力エラー"):
+            failed.result(timeout=1)
+        assert succeeded.result(timeout=1) == "完了"
+
+    def test_callback_called_on_completion(self):
+        """正常系: 完了時にコールバックを呼ぶ"""
+        # Arrange
+        done = threading.Event()
+        received = []
+
+        def callback(future: Future):
+            received.append(future.result())
+            done.set()
+
+        # Act
+        self.worker.submit(lambda: "結果", callback=callback)
+
+        # Assert
+        assert done.wait(1)
+        assert received == ["結果"]
+
+    def test_stop_drains_queue(self):
+        """正常系: 停止前に投入済みのジョブを処理"""
+        # Arrange
+        gate = threading.Event()
+        self.worker.submit(gate.wait, 1)
+        futures = [self.worker.submit(lambda i=i: i) for i in range(3)]
+
+        # Act
+        gate.set()
+        stopped = self.worker.stop(timeout=1.0)
+
+        # Assert
+        assert stopped is True
+        assert [future.result(timeout=0) for future in futures] == [0, 1, 2]
+        assert not self.worker.is_running
+
+    def test_submit_after_stop_restarts(self):
+        """正常系: 停止後の投入でスレッドを再開"""
+        # Arrange
+        self.worker.submit(lambda: None).result(timeout=1)
+        self.worker.stop(timeout=1.0)
+
+        # Act
+        result = self.worker.submit(lambda: "再開").result(timeout=1)
+
+        # Assert
+        assert result == "再開"
+
+    def test_scheduled_job_waits_without_blocking_queue(self):
+        """正常系: 期限付きのジョブは期限まで待ち、その間に投入したジョブを先に実行"""
+        # Arrange
+        results = []
+        self.worker.submit(lambda: None).result(timeout=1)
+        threads = threading.active_count()
+
+        # Act
+        scheduled = self.worker.schedule(0.2, results.append, "予約")
+        waiting_threads = threading.active_count()
+        self.worker.submit(results.append, "即時").result(timeout=1)
+        scheduled.result(timeout=1)
+
+        # Assert
+        assert results == ["即時", "予約"]
+        assert waiting_threads == threads  # 期限待ちのためのスレッドを作らない
+
+    def test_stop_cancels_scheduled_jobs(self):
+        """境界値: 停止時に期限待ちのジョブは実行せず取り消す"""
+        # Arrange
+        results = []
+        scheduled = self.worker.schedule(10, results.append, "予約")
+        self.worker.submit(lambda: None).result(timeout=1)
+
+        # Act
+        stopped = self.worker.stop(timeout=1.0)
+
+        # Assert
+        assert stopped is True
+        assert scheduled.cancelled()
+        assert results == []
+        assert not self.worker.is_running
@@ -1,11 +1,16 @@
+import os
+import threading
 import time
 import tkinter as tk
-from datetime import datetime, timedelta
+from array import array
+from concurrent.futures import Future
 from unittest.mock import Mock, patch, call
 
 import pytest
 
+from service.frame_store import SpillingFrameStore
 from service.recording_controller import RecordingController
+from service.transcription_job import TranscriptionJob
 
 
 class TestRecordingControllerInit:
@@ -461,7 +466,7 @@ class TestRecordingControllerAudioProcessing:
 
     @patch('service.recording_controller.save_audio')
     @patch('service.recording_controller.transcribe_audio')
-    @patch('service.recording_controller.process_punctuation')
+    @patch('service.text_pipeline.TextPipeline.process')
     def test_transcribe_audio_frames_success(self, mock_process_punct, mock_transcribe, mock_save_audio):
         """正常系: 音声フレーム文字起こし成功"""
         # Arrange
@@ -537,6 +542,104 @@ class TestRecordingControllerAudioProcessing:
         # Assert
         mock_save_audio.assert_not_called()
 
+    @patch('service.recording_controller.save_audio')
+    @patch('service.recording_controller.transcribe_audio')
+    def test_transcribe_audio_frames_uses_streamed_file(self, mock_transcribe, mock_save_audio):
+        """正常系: 録音中に保存済みのファイルがあれば保存し直さない"""
+        # Arrange
+        mock_transcribe.return_value = 'テスト'
+
+        # Act
+        self.controller.transcribe_audio_frames([b'frame1'], 16000, '/test/temp/streamed.wav')
+
+        # Assert
+        mock_save_audio.assert_not_called()
+        assert mock_transcribe.call_args[0][0] == '/test/temp/streamed.wav'
+
+    @patch('service.recording_controller.save_audio')
+    @patch('service.recording_controller.transcribe_audio')
+    def test_transcribe_audio_frames_closes_spilled_frames(self, mock_transcribe, mock_save_audio, tmp_path):
+        """正常系: 文字起こし後に退避したフレームの一時ファイルを閉じる"""
+        # Arrange
+        frames = SpillingFrameStore(str(tmp_path), 4)
+        for _ in range(3):
+            frames.append(b'\x01\x00' * 4)
+        assert frames.spilled_bytes > 0
+        mock_save_audio.return_value = '/test/temp/audio.wav'
+        mock_transcribe.return_value = None
+
+        # Act
+        self.controller.transcribe_audio_frames(frames, 16000)
+
+        # Assert
+        assert frames._file is None
+        assert len(frames) == 0
+
+    @patch('service.recording_controller.threading.Thread')
+    def test_stop_recording_passes_streamed_file(self, mock_thread_class):
+        """正常系: 逐次保存が有効なら停止時に保存済みのファイルを処理スレッドへ渡す"""
+        # Arrange
+        self.controller.stream_to_disk = True
+        self.controller.recorder.stop_recording.return_value = ([b'frame'], 16000)
+        self.controller.recorder.take_saved_file.return_value = '/test/temp/streamed.wav'
+
+        # Act
+        self.controller._stop_recording_process()
+
+        # Assert
+        assert mock_thread_class.call_args[1]['args'] == ([b'frame'], 16000, '/test/temp/streamed.wav')
+
+    @patch('service.recording_controller.save_audio')
+    @patch('service.recording_controller.transcribe_audio')
+    def test_skips_short_recording(self, mock_transcribe, mock_save_audio):
+        """正常系: 短すぎる録音は保存・送信しない"""
+        # Arrange
+        self.controller.skip_min_seconds = 0.5
+        frames = [array('h', [3000, -3000] * 800).tobytes()]
+
+        # Act
+        self.controller.transcribe_audio_frames(frames, 16000)
+
+        # Assert
+        mock_save_audio.assert_not_called()
+        mock_transcribe.assert_not_called()
+        self.mock_master.after.assert_called_once()
+
+    @patch('service.recording_controller.save_audio')
+    @patch('service.recording_controller.transcribe_audio')
+    def test_skips_silent_recording(self, mock_transcribe, mock_save_audio):
+        """正常系: RMSとピークがしきい値以下の録音は送信しない"""
+        # Arrange
+        self.controller.skip_max_rms = 100.0
+        self.controller.skip_max_peak = 1000.0
+        frames = [array('h', [50, -50, 100] * 5000).tobytes()]
+
+        # Act
+        self.controller.transcribe_audio_frames(frames, 16000)
+
+        # Assert
+        mock_save_audio.assert_not_called()
+        mock_transcribe.assert_not_called()
+
+    @patch('service.recording_controller.save_audio')
+    @patch('service.recording_controller.transcribe_audio')
+    def test_sends_recording_above_thresholds(self, mock_transcribe, mock_save_audio):
+        """正常系: 音量が小さくてもピークがしきい値を超えれば送信する"""
+        # Arrange
+        self.controller.skip_min_seconds = 0.5
+        self.controller.skip_max_rms = 100.0
+        self.controller.skip_max_peak = 1000.0
+        frames = [array('h', [0] * 16000).tobytes(), array('h', [5000, -5000]).tobytes()]
+        mock_save_audio.return_value = '/test/temp/audio.wav'
+        mock_transcribe.return_value = 'テスト'
+
+        # Act
+        self.controller.transcribe_audio_frames(frames, 16000)
+
+        # Assert
+        mock_save_audio.assert_called_once()
+        mock_transcribe.assert_called_once()
+
 
 class TestRecordingControllerTextProcessing:
     """テキスト処理のテストクラス"""
@@ -576,55 +679,460 @@ class TestRecordingControllerTextProcessing:
         self.mock_master.after.assert_called_once_with(100, self.controller.copy_and_paste, test_text)
 
     @patch('service.recording_controller.threading.Thread')
-    def test_copy_and_paste_success(self, mock_thread_class):
-        """正常系: コピー&ペースト処理"""
+    @patch('service.recording_controller.copy_and_paste_transcription')
+    def test_copy_and_paste_success(self, mock_copy_paste, mock_thread_class):
+        """正常系: 出力ワーカーへ投入し、スレッドを作成しない"""
         # Arrange
         test_text = "テスト結果"
-        mock_thread = Mock()
-        mock_thread_class.return_value = mock_thread
 
         # Act
         self.controller.copy_and_paste(test_text)
 
         # Assert
-        mock_thread_class.assert_called_once()
-        thread_call_args = mock_thread_class.call_args
-        assert thread_call_args[1]['target'] == self.controller._safe_copy_and_paste
-        assert thread_call_args[1]['args'] == (test_text,)
-        assert thread_call_args[1]['daemon'] is True
-        mock_thread.start.assert_called_once()
+        mock_copy_paste.assert_called_once_with(
+            test_text,
+            None,
+            self.mock_config,
+            callback=self.controller._on_output_done
+        )
+        mock_thread_class.assert_not_called()
 
     @patch('service.recording_controller.copy_and_paste_transcription')
-    def test_safe_copy_and_paste_success(self, mock_copy_paste):
-        """正常系: 安全なコピー&ペースト処理"""
+    def test_copy_and_paste_submit_error(self, mock_copy_paste):
+        """異常系: 投入時のエラーをUIへ通知"""
         # Arrange
-        test_text = "テスト結果"
+        mock_copy_paste.side_effect = Exception("Paste error")
 
         # Act
-        self.controller._safe_copy_and_paste(test_text)
+        self.controller.copy_and_paste("テスト結果")
 
         # Assert
-        mock_copy_paste.assert_called_once_with(
-            test_text,
-            self.controller.replacements,
-            self.mock_config
+        callback, args = self.controller._ui_queue.get_nowait()
+        assert callback == self.controller._safe_error_handler
+        assert "Paste error" in args[0]
+
+    def test_on_output_done_success(self):
+        """正常系: 出力完了時はUIへ通知しない"""
+        # Arrange
+        future = Future()
+        future.set_result(True)
+
+        # Act
+        self.controller._on_output_done(future)
+
+        # Assert
+        assert self.controller._ui_queue.empty()
+
+    def test_on_output_done_error(self):
+        """異常系: 出力ジョブのエラーをUIへ通知"""
+        # Arrange
+        future = Future()
+        future.set_exception(Exception("Paste error"))
+
+        # Act
+        self.controller._on_output_done(future)
+
+        # Assert
+        callback, args = self.controller._ui_queue.get_nowait()
+        assert callback == self.controller._safe_error_handler
+        assert "Paste error" in args[0]
+
+
+class TestRecordingControllerLiveTyping:
+    """セグメントごとの出力のテストクラス"""
+
+    def setup_method(self):
+        """テスト用のRecordingControllerを準備"""
+        self.mock_master = Mock(spec=tk.Tk)
+        self.mock_master.winfo_exists.return_value = True
+        self.mock_recorder = Mock()
+        self.mock_recorder.is_recording = False
+        self.mock_recorder.take_remaining_segment.return_value = []
+
+        self.mock_config = {
+            'WHISPER': {'USE_PUNCTUATION': 'True'},
+            'PATHS': {'TEMP_DIR': '/test/temp', 'CLEANUP_MINUTES': '240'},
+            'RECORDING': {'AUTO_STOP_TIMER': '60', 'live_typing': 'True'},
+            'KEYS': {'TOGGLE_RECORDING': 'F1'}
+        }
+
+        with patch('service.recording_controller.os.makedirs'), \
+             patch('service.recording_controller.RecordingController._cleanup_temp_files'):
+            self.controller = RecordingController(
+                self.mock_master,
+                self.mock_config,
+                self.mock_recorder,
+                Mock(),
+                {'白内障手術': '水晶体再建術'},
+                {'update_record_button': Mock(), 'update_status_label': Mock()},
+                Mock()
+            )
+
+    def teardown_method(self):
+        if self.controller._segment_worker is not None:
+            self.controller._segment_worker.stop(timeout=1.0)
+
+    def _queued_texts(self):
+        texts = []
+        while not self.controller._ui_queue.empty():
+            callback, args = self.controller._ui_queue.get_nowait()
+            if callback == self.controller._safe_ui_update:
+                texts.append(args[0])
+        return texts
+
+    def test_live_typing_disabled_by_default(self):
+        """正常系: 既定では無効"""
+        # Arrange
+        config = dict(self.mock_config, RECORDING={'AUTO_STOP_TIMER': '60'})
+
+        with patch('service.recording_controller.os.makedirs'), \
+             patch('service.recording_controller.RecordingController._cleanup_temp_files'):
+            # Act
+            controller = RecordingController(
+                self.mock_master, config, self.mock_recorder, Mock(), {}, {}, Mock()
+            )
+
+        # Assert
+        assert controller.live_typing is False
+
+    @patch('service.recording_controller.threading.Timer')
+    @patch('service.recording_controller.threading.Thread')
+    def test_start_recording_sets_segment_callback(self, mock_thread, mock_timer):
+        """正常系: 録音開始時にセグメントのコールバックを設定"""
+        # Act
+        self.controller.start_recording()
+
+        # Assert
+        self.mock_recorder.set_segment_callback.assert_called_once_with(self.controller._on_segment)
+        assert self.controller._segment_worker is not None
+
+    @patch('service.recording_controller.transcribe_audio')
+    @patch('service.recording_controller.save_audio')
+    def test_segments_output_in_order_with_boundary_rules(self, mock_save_audio, mock_transcribe):
+        """正常系: セグメントを順番に出力し、境界をまたぐ置換も適用"""
+        # Arrange
+        mock_save_audio.return_value = '/test/temp/segment.wav'
+        mock_transcribe.side_effect = ["本日は白内", "障手術を", "行います"]
+        self.controller._start_live_typing()
+
+        # Act
+        self.controller._on_segment([b'segment1'], 16000)
+        self.controller._on_segment([b'segment2'], 16000)
+        self.mock_recorder.take_remaining_segment.return_value = [b'segment3']
+        self.controller._finish_live_typing(16000)
+
+        # Assert
+        assert ''.join(self._queued_texts()) == "本日は水晶体再建術を行います"
+        assert mock_transcribe.call_count == 3
+        assert all(call.kwargs == {'segment': True} for call in mock_save_audio.call_args_list)
+        self.mock_recorder.set_segment_callback.assert_called_with(None)
+        assert self.controller._segment_worker is None
+
+    @patch('service.recording_controller.transcribe_audio')
+    @patch('service.recording_controller.save_audio')
+    def test_segment_error_continues(self, mock_save_audio, mock_transcribe):
+        """異常系: セグメントのエラーを通知し、後続のセグメントは出力"""
+        # Arrange
+        mock_save_audio.return_value = '/test/temp/segment.wav'
+        mock_transcribe.side_effect = [Exception("API error"), "続きです"]
+        self.controller._start_live_typing()
+
+        # Act
+        self.controller._on_segment([b'segment1'], 16000)
+        self.mock_recorder.take_remaining_segment.return_value = [b'segment2']
+        self.controller._finish_live_typing(16000)
+
+        # Assert
+        queued = []
+        while not self.controller._ui_queue.empty():
+            queued.append(self.controller._ui_queue.get_nowait())
+        assert queued[0][0] == self.controller._safe_error_handler
+        assert queued[1] == (self.controller._safe_ui_update, ("続きです",))
+
+    @patch('service.recording_controller.transcribe_audio')
+    @patch('service.recording_controller.save_audio')
+    def test_cancelled_segments_not_output(self, mock_save_audio, mock_transcribe):
+        """境界値: キャンセル後のセグメントは文字起こししない"""
+        # Arrange
+        self.controller._start_live_typing()
+        self.controller.cancel_processing = True
+
+        # Act
+        self.controller._on_segment([b'segment1'], 16000)
+        self.controller._finish_live_typing(16000)
+
+        # Assert
+        mock_save_audio.assert_not_called()
+        assert self._queued_texts() == []
+
+    @patch('service.recording_controller.threading.Thread')
+    def test_stop_recording_finishes_live_typing(self, mock_thread_class):
+        """正常系: 停止時は残りのセグメントを処理するスレッドを開始"""
+        # Arrange
+        self.controller._start_live_typing()
+        self.mock_recorder.stop_recording.return_value = ([b'frame'], 16000)
+
+        # Act
+        self.controller._stop_recording_process()
+
+        # Assert
+        call_kwargs = mock_thread_class.call_args[1]
+        assert call_kwargs['target'] == self.controller._finish_live_typing
+        assert call_kwargs['args'] == (16000,)
+
+
+class TestRecordingControllerFileTranscription:
+    """音声ファイルの文字起こしのテストクラス"""
+
+    def setup_method(self):
+        """テスト用のRecordingControllerを準備"""
+        self.mock_master = Mock(spec=tk.Tk)
+        self.mock_master.winfo_exists.return_value = True
+        self.mock_recorder = Mock()
+        self.mock_recorder.is_recording = False
+        self.mock_ui_callbacks = {'update_record_button': Mock(), 'update_status_label': Mock()}
+
+        self.mock_config = {
+            'WHISPER': {'USE_PUNCTUATION': 'True'},
+            'PATHS': {'TEMP_DIR': '/test/temp', 'CLEANUP_MINUTES': '240'},
+            'RECORDING': {'AUTO_STOP_TIMER': '60'},
+            'KEYS': {'TOGGLE_RECORDING': 'F1'}
+        }
+
+        with patch('service.recording_controller.os.makedirs'), \
+             patch('service.recording_controller.RecordingController._cleanup_temp_files'):
+            self.controller = RecordingController(
+                self.mock_master,
+                self.mock_config,
+                self.mock_recorder,
+                Mock(),
+                {'白内障': '水晶体混濁'},
+                self.mock_ui_callbacks,
+                Mock()
+            )
+
+    def _queued(self):
+        queued = []
+        while not self.controller._ui_queue.empty():
+            queued.append(self.controller._ui_queue.get_nowait())
+        return queued
+
+    @patch('service.recording_controller.transcribe_audio')
+    def test_transcribe_file_runs_in_background(self, mock_transcribe):
+        """正常系: 呼び出し元は通信を待たず、結果をジョブで受け取る"""
+        # Arrange
+        release = threading.Event()
+
+        def slow_transcribe(file_path, config, client):
+            release.wait(2.0)
+            return "白内障の手術です"
+
+        mock_transcribe.side_effect = slow_transcribe
+
+        # Act
+        start = time.perf_counter()
+        job = self.controller.transcribe_file('/test/temp/audio.wav')
+        elapsed = time.perf_counter() - start
+        stage_while_running = job.stage
+        release.set()
+        result = job.result(timeout=2.0)
+
+        # Assert
+        assert elapsed < 0.5
+        assert stage_while_running in ('待機中', '文字起こし中')
+        assert result == "水晶体混濁の手術です"
+        assert job.stage == '完了'
+        assert (self.controller._safe_ui_update, (result,)) in self._queued()
+        self.mock_master.after.assert_called_with(
+            100, self.controller._check_process_thread, self.controller.processing_thread
         )
 
-    @patch('service.recording_controller.copy_and_paste_transcription')
-    def test_safe_copy_and_paste_error(self, mock_copy_paste):
-        """異常系: コピー&ペースト処理エラー"""
+    @patch('service.recording_controller.transcribe_audio')
+    def test_cancel_discards_result(self, mock_transcribe):
+        """正常系: 送信中にキャンセルすると結果を出力しない"""
         # Arrange
-        test_text = "テスト結果"
-        mock_copy_paste.side_effect = Exception("Paste error")
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_transcribe(file_path, config, client):
+            started.set()
+            release.wait(2.0)
+            return "出力されない"
+
+        mock_transcribe.side_effect = slow_transcribe
+        job = self.controller.transcribe_file('/test/temp/audio.wav')
+        started.wait(2.0)
 
         # Act
-        self.controller._safe_copy_and_paste(test_text)
+        cancelled = self.controller.cancel_current_job()
+        release.set()
+        self.controller.processing_thread.join(2.0)
 
         # Assert
-        # エラーハンドラーが呼ばれることを確認
-        self.mock_master.after.assert_called_once()
-        call_args = self.mock_master.after.call_args
-        assert call_args[0][0] == 0  # delay
+        assert cancelled is True
+        assert job.cancelled() is True
+        assert job.stage == 'キャンセル'
+        assert self._queued() == []
+
+    @patch('service.recording_controller.transcribe_audio')
+    @patch('service.recording_controller.save_audio')
+    def test_user_cancels_after_recording_stop(self, mock_save_audio, mock_transcribe):
+        """正常系: 録音停止後の文字起こし中に利用者がキャンセルすると結果を出力せず通知する"""
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_transcribe(file_path, config, client):
+            started.set()
+            release.wait(2.0)
+            return "出力されない"
+
+        mock_save_audio.return_value = '/test/temp/audio.wav'
+        mock_transcribe.side_effect = slow_transcribe
+        self.controller.processing_thread = threading.Thread(
+            target=self.controller.transcribe_audio_frames, args=([b'frame'], 16000)
+        )
+        self.controller.processing_thread.start()
+        started.wait(2.0)
+
+        # Act
+        cancelled = self.controller.cancel_current_job()
+        release.set()
+        self.controller.processing_thread.join(2.0)
+
+        # Assert
+        assert cancelled is True
+        assert self._queued() == []
+        self.controller.show_notification.assert_called_once_with("キャンセル", "文字起こしをキャンセルしました")
+
+    def test_cancel_without_processing(self):
+        """境界値: 処理中でなければ何もキャンセルせず通知もしない"""
+        # Act
+        cancelled = self.controller.cancel_current_job()
+
+        # Assert
+        assert cancelled is False
+        assert self.controller.cancel_processing is False
+        self.controller.show_notification.assert_not_called()
+
+    @patch('service.recording_controller.transcribe_audio')
+    def test_transcribe_error_reported(self, mock_transcribe):
+        """異常系: 文字起こしの失敗をジョブとエラー通知で返す"""
+        # Arrange
+        mock_transcribe.return_value = None
+
+        # Act
+        job = self.controller.transcribe_file('/test/temp/audio.wav')
+        self.controller.processing_thread.join(2.0)
+
+        # Assert
+        with pytest.raises(ValueError):
+            job.result(timeout=0)
+        assert job.stage == 'エラー'
+        assert self._queued()[0][0] == self.controller._safe_error_handler
+
+    def test_transcribe_file_while_processing(self):
+        """異常系: 前回の処理中は新しいジョブを開始しない"""
+        # Arrange
+        busy_thread = Mock()
+        busy_thread.is_alive.return_value = True
+        self.controller.processing_thread = busy_thread
+
+        # Act
+        job = self.controller.transcribe_file('/test/temp/audio.wav')
+
+        # Assert
+        assert isinstance(job.future.exception(timeout=0), RuntimeError)
+        assert self.controller.processing_thread is busy_thread
+        self.controller.show_notification.assert_called_once_with('エラー', "前回の処理が完了していません")
+
+    @patch('service.recording_controller.transcribe_audio')
+    def test_submit_file_returns_job(self, mock_transcribe, tmp_path):
+        """正常系: パスを直接受け取り、クリップボードを使わずにジョブを返す"""
+        # Arrange
+        audio_file = tmp_path / 'audio.wav'
+        audio_file.write_bytes(b'RIFF')
+        mock_transcribe.return_value = "再読み込みです"
+
+        # Act
+        job = self.controller.submit_file(str(audio_file))
+
+        # Assert
+        assert job.result(timeout=2.0) == "再読み込みです"
+        assert job.source == str(audio_file)
+        assert mock_transcribe.call_args[0][0] == str(audio_file)
+        self.mock_master.clipboard_get.assert_not_called()
+        self.mock_master.clipboard_append.assert_not_called()
+
+    @patch('service.recording_controller.transcribe_audio')
+    def test_repeated_submit_shares_job(self, mock_transcribe, tmp_path):
+        """正常系: 同じファイルを処理中に繰り返し投入しても送信は1回で、全員が同じ結果を受け取る"""
+        # Arrange
+        audio_file = tmp_path / 'audio.wav'
+        audio_file.write_bytes(b'RIFF')
+        release = threading.Event()
+
+        def slow_transcribe(file_path, config, client):
+            release.wait(2.0)
+            return "再読み込みです"
+
+        mock_transcribe.side_effect = slow_transcribe
+
+        # Act
+        jobs = [self.controller.submit_file(str(audio_file)) for _ in range(5)]
+        release.set()
+        results = [job.result(timeout=2.0) for job in jobs]
+
+        # Assert
+        assert all(job is jobs[0] for job in jobs)
+        assert results == ["再読み込みです"] * 5
+        assert mock_transcribe.call_count == 1
+        self.controller.show_notification.assert_not_called()
+
+    @patch('service.recording_controller.transcribe_audio')
+    def test_submit_after_completion_sends_again(self, mock_transcribe, tmp_path):
+        """正常系: 前回のジョブが完了していれば同じファイルでも送信し直す"""
+        # Arrange
+        audio_file = tmp_path / 'audio.wav'
+        audio_file.write_bytes(b'RIFF')
+        mock_transcribe.return_value = "再読み込みです"
+        first = self.controller.submit_file(str(audio_file))
+        first.result(timeout=2.0)
+        self.controller.processing_thread.join(2.0)
+
+        # Act
+        second = self.controller.submit_file(str(audio_file))
+        second.result(timeout=2.0)
+
+        # Assert
+        assert second is not first
+        assert mock_transcribe.call_count == 2
+
+    def test_submit_missing_file(self, tmp_path):
+        """異常系: 存在しないファイルは処理せず、失敗したジョブを返す"""
+        # Act
+        job = self.controller.submit_file(str(tmp_path / 'missing.wav'))
+
+        # Assert
+        assert isinstance(job.future.exception(timeout=0), FileNotFoundError)
+        assert self.controller.processing_thread is None
+        self.controller.show_notification.assert_called_once_with('エラー', '音声ファイルが見つかりません')
+
+    def test_check_process_thread_shows_progress(self):
+        """正常系: 処理中はジョブの段階と経過時間を表示"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+        job.set_stage('文字起こし中')
+        self.controller.current_job = job
+        mock_thread = Mock()
+        mock_thread.is_alive.return_value = True
+
+        # Act
+        self.controller._check_process_thread(mock_thread)
+
+        # Assert
+        label = self.mock_ui_callbacks['update_status_label'].call_args[0][0]
+        assert label.startswith("音声ファイル処理中... (文字起こし中")
 
 
 class TestRecordingControllerCleanup:
@@ -653,60 +1161,49 @@ class TestRecordingControllerCleanup:
                 Mock()
             )
 
-    @patch('service.recording_controller.glob.glob')
-    @patch('service.recording_controller.os.path.getmtime')
-    @patch('service.recording_controller.os.remove')
-    @patch('service.recording_controller.datetime')
-    def test_cleanup_temp_files_success(self, mock_datetime, mock_remove, mock_getmtime, mock_glob):
-        """正常系: 一時ファイルクリーンアップ成功"""
+    def test_cleanup_temp_files_runs_in_background(self):
+        """正常系: 一時ファイルの整理はバックグラウンドで要求するだけで待たない"""
         # Arrange
-        current_time = datetime(2024, 1, 1, 12)
-        old_file_time = (current_time - timedelta(minutes=300)).timestamp()  # 5時間前
-        recent_file_time = (current_time - timedelta(minutes=60)).timestamp()  # 1時間前
-
-        mock_datetime.now.return_value = current_time
-        mock_datetime.fromtimestamp = datetime.fromtimestamp
-        mock_glob.return_value = ['/test/temp/old_file.wav', '/test/temp/recent_file.wav']
-        mock_getmtime.side_effect = [old_file_time, recent_file_time]
+        janitor = Mock()
+        self.controller.temp_janitor = janitor
 
         # Act
         self.controller._cleanup_temp_files()
 
         # Assert
-        mock_remove.assert_called_once_with('/test/temp/old_file.wav')
-        # recent_file.wavは削除されない（240分以内）
+        janitor.start.assert_called_once()
+        janitor.request_sweep.assert_called_once()
+        janitor.sweep.assert_not_called()
 
-    @patch('service.recording_controller.glob.glob')
-    def test_cleanup_temp_files_no_files(self, mock_glob):
-        """境界値: 一時ファイルが存在しない"""
+    def test_cleanup_temp_files_removes_old_files(self, tmp_path):
+        """正常系: 保持期間を過ぎた一時ファイルを削除"""
         # Arrange
-        mock_glob.return_value = []
+        old_file = tmp_path / 'old_file.wav'
+        recent_file = tmp_path / 'recent_file.wav'
+        for path in (old_file, recent_file):
+            path.write_bytes(b'RIFF')
+        now = time.time()
+        os.utime(old_file, (now - 300 * 60, now - 300 * 60))  # 5時間前
+        os.utime(recent_file, (now - 60 * 60, now - 60 * 60))  # 1時間前
+        self.controller.temp_janitor.temp_dir = str(tmp_path)
 
         # Act
         self.controller._cleanup_temp_files()
+        assert self.controller.temp_janitor.stop(timeout=2.0)
 
-        # Assert - エラーが発生しないことを確認
+        # Assert
+        assert not old_file.exists()
+        assert recent_file.exists()
 
-    @patch('service.recording_controller.glob.glob')
-    @patch('service.recording_controller.os.path.getmtime')
-    @patch('service.recording_controller.os.remove')
-    @patch('service.recording_controller.datetime')
-    def test_cleanup_temp_files_remove_error(self, mock_datetime, mock_remove, mock_getmtime, mock_glob):
-        """異常系: ファイル削除エラー"""
+    def test_cleanup_temp_files_error(self):
+        """異常系: 整理の開始に失敗しても例外を出さない"""
         # Arrange
-        current_time = datetime(2024, 1, 1, 12)
-        old_file_time = (current_time - timedelta(minutes=300)).timestamp()
-
-        mock_datetime.now.return_value = current_time
-        mock_datetime.fromtimestamp = datetime.fromtimestamp
-        mock_glob.return_value = ['/test/temp/old_file.wav']
-        mock_getmtime.return_value = old_file_time
-        mock_remove.side_effect = PermissionError("Cannot delete file")
+        self.controller.temp_janitor = Mock()
+        self.controller.temp_janitor.start.side_effect = RuntimeError("can't start new thread")
 
         # Act & Assert - 例外が発生しないことを確認
         self.controller._cleanup_temp_files()
 
-
     def test_cleanup_no_active_components(self):
         """境界値: アクティブなコンポーネントがない場合"""
         # Arrange
@@ -816,7 +1313,7 @@ class TestRecordingControllerIntegration:
     @patch('service.recording_controller.threading.Timer')
     @patch('service.recording_controller.save_audio')
     @patch('service.recording_controller.transcribe_audio')
-    @patch('service.recording_controller.process_punctuation')
+    @patch('service.text_pipeline.TextPipeline.process')
     @patch('service.recording_controller.copy_and_paste_transcription')
     def test_complete_recording_workflow(self, mock_copy_paste, mock_process_punct, mock_transcribe,
                                         mock_save_audio, mock_timer_class, mock_thread_class):
@@ -915,41 +1412,36 @@ class TestRecordingControllerPerformance:
         assert (end_time - start_time) < 0.1  # 100ms以内で初期化完了
         assert controller is not None
 
-    @patch('service.recording_controller.glob.glob')
-    @patch('service.recording_controller.os.path.getmtime')
-    @patch('service.recording_controller.os.remove')
-    @patch('service.recording_controller.datetime')
-    def test_cleanup_large_files_performance(self, mock_datetime, mock_remove, 
-                                           mock_getmtime, mock_glob):
+    def test_cleanup_large_files_performance(self, tmp_path):
         """大量ファイルクリーンアップのパフォーマンステスト"""
         # Arrange
         mock_master = Mock(spec=tk.Tk)
         config = {
             'WHISPER': {'USE_PUNCTUATION': 'True'},
-            'PATHS': {'TEMP_DIR': '/test/temp', 'CLEANUP_MINUTES': '240'}
+            'PATHS': {'TEMP_DIR': str(tmp_path), 'CLEANUP_MINUTES': '240'}
         }
 
-        with patch('service.recording_controller.os.makedirs'):
+        with patch('service.recording_controller.RecordingController._cleanup_temp_files'):
             controller = RecordingController(
                 mock_master, config, Mock(), Mock(), {},
                 {'update_record_button': Mock(), 'update_status_label': Mock()}, Mock()
             )
 
-        # 1000個のファイルをシミュレート
-        mock_files = [f'/test/temp/file_{i}.wav' for i in range(1000)]
-        current_time = datetime(2024, 1, 1, 12)
-        old_time = (current_time - timedelta(minutes=300)).timestamp()
-
-        mock_datetime.now.return_value = current_time
-        mock_datetime.fromtimestamp = datetime.fromtimestamp
-        mock_glob.return_value = mock_files
-        mock_getmtime.return_value = old_time
+        # 1000個の古いファイル
+        old_time = time.time() - 300 * 60
+        for i in range(1000):
+            path = tmp_path / f'file_{i}.wav'
+            path.write_bytes(b'RIFF')
+            os.utime(path, (old_time, old_time))
 
         # Act
         start_time = time.time()
         controller._cleanup_temp_files()
+        ui_elapsed = time.time() - start_time
+        assert controller.temp_janitor.stop(timeout=5.0)
         end_time = time.time()
 
         # Assert
+        assert ui_elapsed < 0.05  # 呼び出し元は整理を待たない
         assert (end_time - start_time) < 1.0  # 1秒以内で1000ファイル処理
-        assert mock_remove.call_count == 1000
+        assert list(tmp_path.iterdir()) == []
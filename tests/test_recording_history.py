@@ -0,0 +1,146 @@
+import json
+import os
+from unittest.mock import patch
+
+from service.recording_history import MANIFEST_NAME, RecordingHistory, get_recording_history
+
+
+def _make_recordings(directory, history, count, start=1000.0):
+    paths = []
+    for i in range(count):
+        path = directory / f'audio_{i}.wav'
+        path.write_bytes(b'RIFF')
+        history.append(str(path), duration=1.0, size=4, created=start + i)
+        paths.append(path)
+    return paths
+
+
+class TestRecordingHistory:
+    """録音履歴のテストクラス"""
+
+    def test_latest_and_previous(self, tmp_path):
+        """正常系: 最新と直近N件を新しい順に返す"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path))
+        paths = _make_recordings(tmp_path, history, 5)
+
+        # Act
+        latest = history.latest()
+        recent = history.previous(3)
+
+        # Assert
+        assert latest.path == str(paths[4])
+        assert [entry.path for entry in recent] == [str(path) for path in paths[4:1:-1]]
+
+    def test_skips_deleted_files(self, tmp_path):
+        """正常系: 削除済みのファイルは読み飛ばす"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path))
+        paths = _make_recordings(tmp_path, history, 3)
+        paths[2].unlink()
+
+        # Act & Assert
+        assert history.latest().path == str(paths[1])
+
+    def test_find_at(self, tmp_path):
+        """正常系: 指定時刻以前で最も新しい録音を返す"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path))
+        paths = _make_recordings(tmp_path, history, 5)
+
+        # Act & Assert
+        assert history.find_at(1002.5).path == str(paths[2])
+        assert history.find_at(1004.0).path == str(paths[4])
+        assert history.find_at(999.0) is None
+
+    def test_find_at_after_eviction(self, tmp_path):
+        """境界値: 保持件数を超えて捨てた録音は時刻で検索しても返さない"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path), max_entries=3)
+        paths = _make_recordings(tmp_path, history, 5)
+
+        # Act & Assert
+        assert history.find_at(1001.5) is None
+        assert history.find_at(1003.5).path == str(paths[3])
+        assert history._created == [1002.0, 1003.0, 1004.0]
+
+    def test_restored_from_manifest_without_scanning(self, tmp_path):
+        """正常系: 再起動後はディレクトリを走査せずマニフェストから復元"""
+        # Arrange
+        paths = _make_recordings(tmp_path, RecordingHistory(str(tmp_path)), 3)
+
+        # Act
+        with patch('os.scandir') as mock_scandir, patch('glob.glob') as mock_glob:
+            restored = RecordingHistory(str(tmp_path))
+            latest = restored.latest()
+
+        # Assert
+        assert latest.path == str(paths[2])
+        assert len(restored) == 3
+        mock_scandir.assert_not_called()
+        mock_glob.assert_not_called()
+
+    def test_update_keeps_position(self, tmp_path):
+        """正常系: 長さとサイズを更新し、再起動後も最初に追加した位置のまま1件として復元"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path))
+        paths = _make_recordings(tmp_path, history, 2)
+
+        # Act
+        updated = history.update(str(paths[0]), 3.0, 96000)
+        restored = RecordingHistory(str(tmp_path))
+
+        # Assert
+        assert updated.duration == 3.0
+        assert updated.created == 1000.0
+        assert len(restored) == 2
+        assert restored.previous(2)[1] == updated
+        assert history.update(str(tmp_path / 'missing.wav'), 1.0, 4) is None
+
+    def test_manifest_compacted(self, tmp_path):
+        """境界値: マニフェストは保持件数の2倍を超えたら書き直す"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path), max_entries=3)
+
+        # Act
+        paths = _make_recordings(tmp_path, history, 7)
+
+        # Assert
+        lines = (tmp_path / MANIFEST_NAME).read_text(encoding='utf-8').splitlines()
+        assert len(lines) <= 6
+        assert json.loads(lines[-1])['path'] == str(paths[6])
+        assert len(history) == 3
+        assert history.previous(10)[-1].path == str(paths[4])
+
+    def test_invalid_lines_skipped(self, tmp_path, caplog):
+        """異常系: 壊れた行は読み飛ばす"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+        path.write_bytes(b'RIFF')
+        entry = {'path': str(path), 'created': 1000.0, 'duration': 1.0, 'size': 4}
+        (tmp_path / MANIFEST_NAME).write_text('{壊れた行\n' + json.dumps(entry) + '\n', encoding='utf-8')
+
+        # Act
+        history = RecordingHistory(str(tmp_path))
+
+        # Assert
+        assert history.latest().path == str(path)
+        assert "録音履歴の不正な行を読み飛ばしました" in caplog.text
+
+    def test_append_without_directory(self, tmp_path, caplog):
+        """異常系: マニフェストを書けなくてもメモリ上の履歴は更新"""
+        # Arrange
+        history = RecordingHistory(str(tmp_path / 'missing'))
+
+        # Act
+        entry = history.append(str(tmp_path / 'audio.wav'))
+
+        # Assert
+        assert len(history) == 1
+        assert entry.path == os.path.abspath(str(tmp_path / 'audio.wav'))
+        assert "録音履歴の保存に失敗しました" in caplog.text
+
+    def test_get_recording_history_shared(self, tmp_path):
+        """正常系: 同じ一時ディレクトリでは同じ履歴を返す"""
+        # Act & Assert
+        assert get_recording_history(str(tmp_path)) is get_recording_history(str(tmp_path / '.'))
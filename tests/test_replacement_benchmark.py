@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+from scripts.benchmark_replacements import (
+    compare_with_baseline,
+    generate_rule_lines,
+    generate_transcript,
+    main,
+    measure_replacements
+)
+from service.replacement_rules import parse_replacement_line
+
+# 1000文字の文字起こし1回あたりの置換時間の上限（ミリ秒）
+MAX_PER_CALL_MS = float(os.environ.get('REPLACEMENT_BENCH_MAX_MS', '50'))
+RUN_FULL_BENCHMARK = os.environ.get('GROQWHISPER_BENCHMARK') == '1'
+
+
+class TestSyntheticData:
+    """合成データ生成のテストクラス"""
+
+    def test_generate_rule_lines_deterministic(self):
+        """正常系: 同じシードで同じルールを生成"""
+        # Act & Assert
+        assert generate_rule_lines(100, seed=1) == generate_rule_lines(100, seed=1)
+
+    def test_generate_rule_lines_valid_and_unique(self):
+        """正常系: 生成したルールは全て解析可能で重複しない"""
+        # Act
+        lines = generate_rule_lines(1000)
+        rules = [parse_replacement_line(line) for line in lines]
+
+        # Assert
+        assert len(rules) == 1000
+        assert len({(rule.kind, rule.pattern) for rule in rules}) == 1000
+
+    def test_generate_transcript_length_and_hits(self):
+        """正常系: 指定文字数でルールの置換前文字列を含む"""
+        # Arrange
+        lines = generate_rule_lines(10)
+
+        # Act
+        transcript = generate_transcript(500, lines)
+
+        # Assert
+        assert len(transcript) == 500
+        assert any(line.split(',')[0] in transcript for line in lines)
+
+
+@pytest.mark.skipif(not RUN_FULL_BENCHMARK, reason="GROQWHISPER_BENCHMARK=1 で実行")
+class TestReplacementBenchmark:
+    """置換ルールの性能テストクラス（実行時間を比較するため、負荷のかかったCIでは実行しない）"""
+
+    @pytest.mark.parametrize("rule_count", [10, 100, 1000, 10000])
+    def test_per_call_time_within_threshold(self, rule_count):
+        """性能: 1回あたりの置換時間が上限以内"""
+        # Act
+        result = measure_replacements(rule_count, iterations=10)
+
+        # Assert
+        assert result['rules'] == rule_count
+        assert result['per_call_seconds'] * 1000 < MAX_PER_CALL_MS
+
+    def test_per_call_time_scales_sublinearly(self):
+        """性能: ルール数が10倍になっても置換時間は比例して増えない"""
+        # Act
+        small = measure_replacements(1000, iterations=20)
+        large = measure_replacements(10000, iterations=20)
+
+        # Assert
+        assert large['per_call_seconds'] < small['per_call_seconds'] * 4
+
+    def test_per_call_time_with_100000_rules(self):
+        """性能: 10万ルールでも1回あたりの置換時間が上限以内"""
+        # Act
+        result = measure_replacements(100000, iterations=10)
+
+        # Assert
+        assert result['per_call_seconds'] * 1000 < MAX_PER_CALL_MS
+
+
+class TestRegressionDetection:
+    """性能劣化検出のテストクラス"""
+
+    def test_compare_with_baseline_detects_regression(self):
+        """異常系: 基準値の許容倍率を超えた場合に検出"""
+        # Arrange
+        results = {100: {'per_call_seconds': 0.003}}
+        baseline = {'100': {'per_call_seconds': 0.001}}
+
+        # Act
+        regressions = compare_with_baseline(results, baseline, tolerance=1.5)
+
+        # Assert
+        assert len(regressions) == 1
+        assert "100ルール" in regressions[0]
+
+    def test_compare_with_baseline_within_tolerance(self):
+        """正常系: 許容倍率以内は検出しない"""
+        # Arrange
+        results = {100: {'per_call_seconds': 0.0012}, 1000: {'per_call_seconds': 1.0}}
+        baseline = {'100': {'per_call_seconds': 0.001}}
+
+        # Act & Assert
+        assert compare_with_baseline(results, baseline, tolerance=1.5) == []
+
+    def test_main_fails_when_threshold_exceeded(self, capsys):
+        """異常系: 上限を超えると終了コード1"""
+        # Act
+        exit_code = main(['--sizes', '10', '--iterations', '2', '--max-per-call-ms', '0'])
+
+        # Assert
+        assert exit_code == 1
+        assert "性能劣化を検出しました" in capsys.readouterr().out
+
+    def test_main_saves_and_compares_baseline(self, tmp_path):
+        """正常系: 基準値を保存して比較"""
+        # Arrange
+        baseline_path = str(tmp_path / 'baseline.json')
+
+        # Act
+        save_exit = main(['--sizes', '10', '--iterations', '2', '--save-baseline', baseline_path])
+        compare_exit = main(['--sizes', '10', '--iterations', '2', '--baseline', baseline_path,
+                             '--tolerance', '1000'])
+
+        # Assert
+        assert save_exit == 0
+        assert compare_exit == 0
@@ -0,0 +1,278 @@
+import logging
+
+import pytest
+
+from service.replacement_rules import (
+    LITERAL,
+    REGEX,
+    WORD,
+    ReplacementMatcher,
+    ReplacementRule,
+    compile_replacement_rules,
+    parse_replacement_line,
+    to_replacement_rules
+)
+
+
+class TestParseReplacementLine:
+    """置換ルール行解析のテストクラス"""
+
+    @pytest.mark.parametrize("line,expected", [
+        ("少子体,硝子体", ReplacementRule(LITERAL, '少子体', '硝子体', 0)),
+        ("  旧 , 新  ", ReplacementRule(LITERAL, '旧', '新', 0)),
+        ("旧,新,10", ReplacementRule(LITERAL, '旧', '新', 10)),
+        ("旧,新,-1", ReplacementRule(LITERAL, '旧', '新', -1)),
+        ("旧,新,+3", ReplacementRule(LITERAL, '旧', '新', 3)),
+        ("word:AI,エーアイ", ReplacementRule(WORD, 'AI', 'エーアイ', 0)),
+        ("re:(\\d+)歳,\\1才", ReplacementRule(REGEX, '(\\d+)歳', '\\1才', 0)),
+        ("re:x{1,2},Y", ReplacementRule(REGEX, 'x{1,2}', 'Y', 0)),
+        ("re:x{1,2},Y,5", ReplacementRule(REGEX, 'x{1,2}', 'Y', 5)),
+        ("削除,", ReplacementRule(LITERAL, '削除', '', 0)),
+    ])
+    def test_parse_valid_lines(self, line, expected):
+        """パラメータ化テスト: 有効な行の解析"""
+        # Act
+        result = parse_replacement_line(line)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize("line", ["", "   ", "# コメント,行"])
+    def test_parse_skipped_lines(self, line):
+        """境界値: 空行とコメント行はNone"""
+        # Act & Assert
+        assert parse_replacement_line(line) is None
+
+    @pytest.mark.parametrize("line", [
+        "カンマなし",
+        "a,b,c",
+        "旧,新,--5",
+        "旧,新,+-5",
+        "旧,新,5-",
+        ",置換後",
+        "re:(,x",
+        "re:パターンのみ",
+    ])
+    def test_parse_invalid_lines(self, line):
+        """異常系: 無効な行はValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            parse_replacement_line(line)
+
+
+class TestToReplacementRules:
+    """辞書形式からの変換のテストクラス"""
+
+    def test_convert_dict(self):
+        """正常系: 接頭辞付きのキーを種類に変換"""
+        # Act
+        rules = to_replacement_rules({'テスト': '試験', 're:\\s+': '', 'word:AI': 'エーアイ'})
+
+        # Assert
+        assert rules == [
+            ReplacementRule(LITERAL, 'テスト', '試験'),
+            ReplacementRule(REGEX, '\\s+', ''),
+            ReplacementRule(WORD, 'AI', 'エーアイ'),
+        ]
+
+    @pytest.mark.parametrize("replacements", [None, {}, []])
+    def test_convert_empty(self, replacements):
+        """境界値: 空の入力"""
+        # Act & Assert
+        assert to_replacement_rules(replacements) == []
+
+
+class TestReplacementMatcher:
+    """置換マッチャーのテストクラス"""
+
+    def test_literal_longest_match(self):
+        """正常系: 同じ優先度では最長一致"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(LITERAL, '少子', '小枝'),
+            ReplacementRule(LITERAL, '少子体', '硝子体'),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('少子体と少子') == '硝子体と小枝'
+
+    def test_single_pass_does_not_chain(self):
+        """正常系: 置換結果を再度置換しない"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(LITERAL, 'A', 'B'),
+            ReplacementRule(LITERAL, 'B', 'C'),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('AB') == 'BC'
+
+    def test_chained_rules_not_applied_in_file_order(self):
+        """互換性: 以前のファイル順の逐次置換とは異なり、前のルールの置換結果に後のルールを適用しない"""
+        # Arrange（以前は 'A' → 'B' → 'C' と連鎖していた）
+        matcher = ReplacementMatcher(to_replacement_rules({'A': 'B', 'B': 'C'}))
+
+        # Act & Assert
+        assert matcher.replace('A') == 'B'
+
+    def test_overlapping_rules_resolved_by_length_not_file_order(self):
+        """互換性: 重なるルールはファイルの順序ではなく最長一致で決まる"""
+        # Arrange（以前は先に書かれた '眼科' が適用され 'がんか医師' になっていた）
+        matcher = ReplacementMatcher(to_replacement_rules({'眼科': 'がんか', '眼科医師': '眼科医'}))
+
+        # Act & Assert
+        assert matcher.replace('眼科医師') == '眼科医'
+
+    def test_priority_wins_over_length(self):
+        """正常系: 同じ位置では優先度の高いルールを優先"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(LITERAL, '眼科医師', '眼科医', 0),
+            ReplacementRule(LITERAL, '眼科', 'がんか', 10),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('眼科医師') == 'がんか医師'
+
+    def test_word_boundary_rule(self):
+        """正常系: 英数字に挟まれた語は置換しない"""
+        # Arrange
+        matcher = ReplacementMatcher([ReplacementRule(WORD, 'AI', 'エーアイ')])
+
+        # Act & Assert
+        assert matcher.replace('AIとMAILとAIです') == 'エーアイとMAILとエーアイです'
+
+    def test_regex_rule_with_group_reference(self):
+        """正常系: グループ参照を含む正規表現ルール"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(REGEX, '(\\d+)歳', '\\1才'),
+            ReplacementRule(LITERAL, 'テスト', '試験'),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('テストは30歳') == '試験は30才'
+
+    def test_regex_rule_with_backreference_applied_standalone(self):
+        """正常系: 後方参照を含むルールは単独で適用"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(REGEX, '(.)\\1', '\\1'),
+            ReplacementRule(REGEX, '(?i)abc', 'Z'),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('ええと ABC') == 'えと Z'
+
+    def test_special_characters_escaped(self):
+        """正常系: 正規表現の特殊文字を含むリテラル"""
+        # Arrange
+        matcher = ReplacementMatcher([
+            ReplacementRule(LITERAL, 'C-Sharp', 'C#'),
+            ReplacementRule(LITERAL, 'a.b', 'X'),
+            ReplacementRule(LITERAL, '[^]', 'Y'),
+        ])
+
+        # Act & Assert
+        assert matcher.replace('C-Sharp a.b axb [^]') == 'C# X axb Y'
+
+    def test_invalid_regex_rule_skipped(self, caplog):
+        """異常系: コンパイルできない正規表現は記録してスキップ"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+
+        # Act
+        matcher = ReplacementMatcher([
+            ReplacementRule(REGEX, '(', 'x'),
+            ReplacementRule(LITERAL, 'テスト', '試験'),
+        ])
+
+        # Assert
+        assert matcher.replace('テスト(') == '試験('
+        assert "正規表現ルールのコンパイルに失敗しました" in caplog.text
+
+    def test_empty_matcher(self):
+        """境界値: ルールなし"""
+        # Arrange
+        matcher = ReplacementMatcher([])
+
+        # Act & Assert
+        assert matcher.replace('そのまま') == 'そのまま'
+        assert matcher.replace('') == ''
+
+
+
+class TestPendingPrefixLength:
+    """分割されたテキストの保留長のテストクラス"""
+
+    def setup_method(self):
+        self.matcher = ReplacementMatcher([
+            ReplacementRule(LITERAL, '白内障手術', 'cataract surgery'),
+            ReplacementRule(WORD, 'API', 'エーピーアイ'),
+            ReplacementRule(REGEX, r'第[0-9]+回', '第N回'),
+        ])
+
+    @pytest.mark.parametrize("text,expected", [
+        ("本日の白内障", 3),
+        ("本日の白内障手", 4),
+        ("本日の白内障手術", 0),
+        ("API", 0),
+        ("呼び出すAP", 2),
+        ("関係ない", 0),
+        ("第1", 0),
+        ("", 0),
+    ])
+    def test_pending_prefix_length(self, text, expected):
+        """正常系: 末尾がリテラルの先頭部分なら保留する長さを返す"""
+        # Act & Assert
+        assert self.matcher.pending_prefix_length(text) == expected
+
+    def test_split_replacement_matches_whole(self):
+        """正常系: 保留した末尾を連結して置換すると一括置換と同じ結果"""
+        # Arrange
+        parts = ["本日の白内", "障手術は", "成功しました"]
+        output = []
+        pending = ''
+
+        # Act
+        for part in parts:
+            combined = pending + part
+            hold = self.matcher.pending_prefix_length(combined)
+            output.append(self.matcher.replace(combined[:len(combined) - hold]))
+            pending = combined[len(combined) - hold:]
+        output.append(self.matcher.replace(pending))
+
+        # Assert
+        assert ''.join(output) == self.matcher.replace(''.join(parts))
+
+    def test_no_literal_rules(self):
+        """境界値: リテラルルールがなければ保留しない"""
+        # Arrange
+        matcher = ReplacementMatcher([ReplacementRule(REGEX, 'a+', 'b')])
+
+        # Act & Assert
+        assert matcher.pending_prefix_length('aaa') == 0
+
+class TestCompileReplacementRules:
+    """マッチャーのキャッシュのテストクラス"""
+
+    def test_same_rules_reuse_cached_matcher(self):
+        """正常系: 同一ルールセットはキャッシュを再利用"""
+        # Arrange
+        rules = [ReplacementRule(LITERAL, 'キャッシュ', 'cache')]
+
+        # Act
+        first = compile_replacement_rules(rules)
+        second = compile_replacement_rules(list(rules))
+
+        # Assert
+        assert first is second
+
+    def test_dict_and_rules_compile_equivalently(self):
+        """正常系: 辞書とルールのリストで同じ結果"""
+        # Act
+        from_dict = compile_replacement_rules({'テスト': '試験'})
+        from_rules = compile_replacement_rules([ReplacementRule(LITERAL, 'テスト', '試験')])
+
+        # Assert
+        assert from_dict is from_rules
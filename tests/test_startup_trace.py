@@ -0,0 +1,189 @@
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+import utils.startup_trace as startup_trace
+from scripts.benchmark_startup import build_command, format_summary, install_stubs, summarize
+from utils.startup_trace import StartupTrace, get_startup_trace
+
+
+@pytest.fixture
+def reset_trace():
+    startup_trace._trace = None
+    yield
+    startup_trace._trace = None
+
+
+class TestStartupTrace:
+    """起動時間の計測のテストクラス"""
+
+    def test_phases_recorded_with_nesting(self):
+        """正常系: 段階の所要時間と入れ子の深さを記録"""
+        # Arrange
+        trace = StartupTrace(enabled=True)
+
+        # Act
+        with trace.phase('setup_logging'):
+            with trace.phase('cleanup_old_logs'):
+                pass
+        with trace.phase('UI構築'):
+            pass
+        trace.mark('mainloop')
+
+        # Assert
+        phases = {phase.name: phase for phase in trace.phases}
+        assert [phase.name for phase in trace.phases] == ['setup_logging', 'cleanup_old_logs', 'UI構築']
+        assert phases['setup_logging'].depth == 0
+        assert phases['cleanup_old_logs'].depth == 1
+        assert phases['setup_logging'].duration >= phases['cleanup_old_logs'].duration
+        assert trace.marks['mainloop'] >= phases['UI構築'].start
+
+    def test_phase_in_other_thread(self):
+        """正常系: バックグラウンドスレッドの段階はスレッド名付きで記録"""
+        # Arrange
+        trace = StartupTrace(enabled=True)
+
+        def work():
+            with trace.phase('setup_groq_client'):
+                pass
+
+        # Act
+        thread = threading.Thread(target=work, name='Startup_0')
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert trace.phases[0].thread == 'Startup_0'
+        assert trace.phases[0].depth == 0
+        assert '[Startup_0]' in trace.report()
+
+    def test_phase_recorded_on_error(self):
+        """異常系: 例外が発生しても所要時間を記録"""
+        # Arrange
+        trace = StartupTrace(enabled=True)
+
+        # Act
+        with pytest.raises(ValueError):
+            with trace.phase('setup_groq_client'):
+                raise ValueError("GROQ_API_KEYが未設定です")
+
+        # Assert
+        assert trace.phases[0].name == 'setup_groq_client'
+
+    def test_disabled_records_nothing(self):
+        """正常系: 無効時は記録しない"""
+        # Arrange
+        trace = StartupTrace(enabled=False)
+
+        # Act
+        with trace.phase('load_config'):
+            pass
+        trace.mark('mainloop')
+
+        # Assert
+        assert trace.phases == []
+        assert trace.marks == {}
+
+    def test_emit_writes_json(self, tmp_path, monkeypatch):
+        """正常系: 指定したファイルへJSONで書き出す"""
+        # Arrange
+        path = tmp_path / 'startup.json'
+        monkeypatch.setenv(startup_trace.TRACE_FILE_ENV, str(path))
+        trace = StartupTrace(enabled=True)
+        with trace.phase('load_config'):
+            pass
+        trace.mark('mainloop')
+
+        # Act
+        trace.emit()
+
+        # Assert
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert data['phases'][0]['name'] == 'load_config'
+        assert 'mainloop' in data['marks']
+
+    def test_get_startup_trace_from_env(self, monkeypatch, reset_trace):
+        """正常系: 環境変数で有効化"""
+        # Arrange
+        monkeypatch.setenv(startup_trace.TRACE_ENV, '1')
+
+        # Act
+        trace = get_startup_trace()
+
+        # Assert
+        assert trace.enabled is True
+        assert get_startup_trace() is trace
+
+    def test_get_startup_trace_disabled_by_default(self, monkeypatch, reset_trace):
+        """正常系: 環境変数が無ければ無効"""
+        # Arrange
+        monkeypatch.delenv(startup_trace.TRACE_ENV, raising=False)
+        monkeypatch.delenv(startup_trace.TRACE_FILE_ENV, raising=False)
+
+        # Act & Assert
+        assert get_startup_trace().enabled is False
+
+
+class TestStartupBenchmark:
+    """起動ベンチマークのテストクラス"""
+
+    def test_summarize(self):
+        """正常系: 段階ごとの中央値・最小・最大を集計"""
+        # Arrange
+        traces = [
+            {'phases': [{'name': 'load_config', 'duration': duration}], 'marks': {'mainloop': mark}, 'wall': wall}
+            for duration, mark, wall in [(0.01, 0.5, 1.0), (0.03, 0.7, 1.2), (0.02, 0.6, 1.1)]
+        ]
+
+        # Act
+        summary = summarize(traces)
+
+        # Assert
+        assert summary['load_config'] == {'median': 0.02, 'min': 0.01, 'max': 0.03}
+        assert summary['mainloop']['median'] == 0.6
+        assert summary['プロセス全体']['max'] == 1.2
+        assert 'load_config' in format_summary(summary, 3)
+
+    def test_build_command_uses_virtual_display(self, monkeypatch):
+        """正常系: ディスプレイが無いLinuxではxvfb-runで実行"""
+        # Arrange
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        monkeypatch.delenv('DISPLAY', raising=False)
+        monkeypatch.setattr('scripts.benchmark_startup.shutil.which', lambda name: '/usr/bin/xvfb-run')
+
+        # Act
+        command = build_command()
+
+        # Assert
+        assert command[:2] == ['/usr/bin/xvfb-run', '-a']
+        assert command[-1] == '--child'
+
+    def test_build_command_without_display_or_xvfb(self, monkeypatch):
+        """異常系: ディスプレイもxvfb-runも無い場合はエラー"""
+        # Arrange
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        monkeypatch.delenv('DISPLAY', raising=False)
+        monkeypatch.setattr('scripts.benchmark_startup.shutil.which', lambda name: None)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            build_command()
+
+    def test_install_stubs(self, monkeypatch):
+        """正常系: 音声・キーボード・クリップボードとAPIキーをスタブに置き換える"""
+        # Arrange
+        import utils.env_loader as env_loader
+        modules = {}
+        monkeypatch.setattr(env_loader, 'load_env_variables', env_loader.load_env_variables)
+
+        # Act
+        install_stubs(modules)
+
+        # Assert
+        assert set(modules) == {'pyaudio', 'keyboard', 'pyperclip'}
+        modules['keyboard'].on_press_key('pause', lambda event: None)
+        assert env_loader.load_env_variables()['GROQ_API_KEY'] == 'benchmark'
+        assert os.environ.get('GROQ_API_KEY') != 'benchmark'
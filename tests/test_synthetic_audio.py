@@ -0,0 +1,155 @@
+import os
+import tempfile
+import time
+import wave
+from unittest.mock import Mock, patch
+
+import pytest
+
+from service.audio_recorder import AudioRecorder, chunk_rms, save_audio
+from tests.synthetic_audio import SyntheticAudio
+
+RUN_FULL_BENCHMARK = os.environ.get('GROQWHISPER_BENCHMARK') == '1'
+SILENCE_THRESHOLD = 500
+
+
+class TestSyntheticAudio:
+    """合成音声ジェネレーターのテストクラス"""
+
+    def test_deterministic_for_same_seed(self, synthetic_audio):
+        """正常系: 同じシードで同じPCMを生成"""
+        # Act & Assert
+        assert synthetic_audio(seed=3).pcm(5.0) == synthetic_audio(seed=3).pcm(5.0)
+        assert synthetic_audio(seed=3).pcm(5.0) != synthetic_audio(seed=4).pcm(5.0)
+
+    @pytest.mark.parametrize('sample_rate,channels', [(8000, 1), (16000, 1), (44100, 2), (48000, 2)])
+    def test_length_matches_duration(self, synthetic_audio, sample_rate, channels):
+        """正常系: サンプルレートとチャンネル数に応じたバイト数"""
+        # Arrange
+        audio = synthetic_audio(sample_rate=sample_rate, channels=channels)
+
+        # Act
+        frames = audio.frames(2.5, 1024)
+
+        # Assert
+        assert sum(len(frame) for frame in frames) == int(2.5 * sample_rate) * channels * 2
+        assert all(len(frame) == 1024 * channels * 2 for frame in frames[:-1])
+
+    def test_stereo_channels_interleaved(self, synthetic_audio):
+        """正常系: 複数チャンネルは同じ値をインターリーブ"""
+        # Arrange
+        from array import array
+        samples = array('h')
+
+        # Act
+        samples.frombytes(synthetic_audio(channels=2).pcm(0.1, kind='tone'))
+
+        # Assert
+        assert list(samples[0::2]) == list(samples[1::2])
+
+    def test_silence_and_noise_below_threshold(self, silence_frames, synthetic_audio):
+        """正常系: 無音と背景雑音は無音判定のしきい値未満"""
+        # Act
+        silent = synthetic_audio().frames(1.0, kind='silence')
+
+        # Assert
+        assert all(frame == bytes(len(frame)) for frame in silent)
+        assert all(0 < chunk_rms(frame) < SILENCE_THRESHOLD for frame in silence_frames)
+
+    def test_speech_has_bursts_and_pauses(self, speech_frames):
+        """正常系: 発話区間と間の両方を含む"""
+        # Act
+        levels = [chunk_rms(frame) for frame in speech_frames]
+
+        # Assert
+        assert sum(level >= SILENCE_THRESHOLD for level in levels) > len(levels) // 3
+        assert sum(level < SILENCE_THRESHOLD for level in levels) > len(levels) // 10
+
+    def test_invalid_kind(self, synthetic_audio):
+        """異常系: 未知の信号の種類はValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            list(synthetic_audio().chunks(1.0, kind='music'))
+
+    def test_long_duration_streams_quickly(self, synthetic_audio):
+        """性能: 10分の音声を逐次生成してもメモリに保持せず短時間で終わる"""
+        # Arrange
+        audio = synthetic_audio()
+        start = time.perf_counter()
+
+        # Act
+        total = sum(len(chunk) for chunk in audio.chunks(600.0, 1024))
+
+        # Assert
+        assert total == 600 * audio.bytes_per_second
+        assert time.perf_counter() - start < 5.0
+
+    def test_write_wav(self, synthetic_audio):
+        """正常系: WAVファイルへ書き込み"""
+        # Arrange
+        audio = synthetic_audio(sample_rate=8000)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Act
+            path = audio.write_wav(os.path.join(temp_dir, 'speech.wav'), 3.0)
+
+            # Assert
+            with wave.open(path, 'rb') as wf:
+                assert wf.getframerate() == 8000
+                assert wf.getnframes() == 24000
+                assert wf.readframes(24000) == audio.pcm(3.0)
+
+
+class TestSyntheticAudioWithRecorder:
+    """合成音声を使った録音処理のテストクラス"""
+
+    @patch('service.audio_recorder.os.makedirs')
+    def test_segments_split_on_pauses(self, mock_makedirs, speech_frames):
+        """正常系: 発話の間で区切られ、全フレームがセグメントに含まれる"""
+        # Arrange
+        config = {
+            'AUDIO': {'SAMPLE_RATE': '16000', 'CHANNELS': '1', 'CHUNK': '1024'},
+            'PATHS': {'TEMP_DIR': '/test/temp'},
+            'RECORDING': {
+                'segment_min_seconds': '1',
+                'segment_max_seconds': '5',
+                'segment_silence_ms': '300',
+                'silence_threshold': str(SILENCE_THRESHOLD)
+            }
+        }
+        recorder = AudioRecorder(config)
+        segments = []
+        recorder.set_segment_callback(lambda frames, rate: segments.append(frames))
+        mock_stream = Mock()
+        mock_stream.read.side_effect = list(speech_frames) + [Exception("Stop recording")]
+        recorder.stream = mock_stream
+        recorder.is_recording = True
+
+        # Act
+        recorder.record()
+        remaining = recorder.take_remaining_segment()
+
+        # Assert
+        assert len(segments) >= 2
+        emitted = sum(len(segment) for segment in segments) + len(remaining)
+        assert emitted <= len(speech_frames)
+        assert all(any(chunk_rms(frame) >= SILENCE_THRESHOLD for frame in segment) for segment in segments)
+
+    @pytest.mark.skipif(not RUN_FULL_BENCHMARK, reason='GROQWHISPER_BENCHMARK=1 で実行')
+    def test_save_audio_one_hour(self):
+        """性能: 1時間分の録音の保存時間"""
+        # Arrange
+        audio = SyntheticAudio()
+        frames = audio.frames(3600.0, 1024)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = {'PATHS': {'TEMP_DIR': temp_dir}, 'AUDIO': {'CHANNELS': '1'}}
+            start = time.perf_counter()
+
+            # Act
+            path = save_audio(frames, audio.sample_rate, config)
+            elapsed = time.perf_counter() - start
+
+            # Assert
+            assert path is not None
+            assert os.path.getsize(path) >= 3600 * audio.bytes_per_second
+        print(f"save_audio 1時間: {elapsed:.2f}秒")
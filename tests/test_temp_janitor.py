@@ -0,0 +1,176 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from service.temp_janitor import TempFileJanitor
+
+NOW = 1_700_000_000.0
+
+
+def _make_file(directory, name, minutes_old, size=4):
+    path = directory / name
+    path.write_bytes(b'x' * size)
+    mtime = NOW - minutes_old * 60
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestTempFileJanitor:
+    """一時ファイル整理のテストクラス"""
+
+    def test_rescan_builds_index(self, tmp_path):
+        """正常系: 音声ファイルのみを索引に登録"""
+        # Arrange
+        _make_file(tmp_path, 'a.wav', 10, size=100)
+        _make_file(tmp_path, 'b.wav', 5, size=50)
+        _make_file(tmp_path, 'notes.txt', 5)
+        (tmp_path / 'sub.wav').mkdir()
+        janitor = TempFileJanitor(str(tmp_path), 240)
+
+        # Act
+        janitor.rescan()
+
+        # Assert
+        assert janitor.file_count == 2
+        assert janitor.total_bytes == 150
+
+    def test_age_limit(self, tmp_path):
+        """正常系: 保持期間を過ぎたファイルを削除"""
+        # Arrange
+        old = _make_file(tmp_path, 'old.wav', 300)
+        recent = _make_file(tmp_path, 'recent.wav', 60)
+        janitor = TempFileJanitor(str(tmp_path), 240)
+
+        # Act
+        deleted = janitor.sweep(now=NOW)
+
+        # Assert
+        assert deleted == 1
+        assert not old.exists()
+        assert recent.exists()
+        assert janitor.file_count == 1
+
+    def test_file_count_quota_removes_oldest(self, tmp_path):
+        """正常系: 件数の上限を超えた分を古い順に削除"""
+        # Arrange
+        paths = [_make_file(tmp_path, f'{i}.wav', 100 - i) for i in range(5)]
+        janitor = TempFileJanitor(str(tmp_path), 240, max_files=3)
+
+        # Act
+        janitor.sweep(now=NOW)
+
+        # Assert
+        assert [path.exists() for path in paths] == [False, False, True, True, True]
+
+    def test_total_bytes_quota(self, tmp_path):
+        """正常系: 合計サイズの上限以下になるまで古い順に削除"""
+        # Arrange
+        paths = [_make_file(tmp_path, f'{i}.wav', 100 - i, size=400) for i in range(4)]
+        janitor = TempFileJanitor(str(tmp_path), 240, max_total_bytes=1000)
+
+        # Act
+        janitor.sweep(now=NOW)
+
+        # Assert
+        assert [path.exists() for path in paths] == [False, False, True, True]
+        assert janitor.total_bytes == 800
+
+    def test_quota_keeps_latest_and_recent_files(self, tmp_path):
+        """境界値: 上限超過でも最新と作成直後のファイルは削除しない"""
+        # Arrange
+        older = _make_file(tmp_path, 'older.wav', 0.5, size=400)
+        latest = _make_file(tmp_path, 'latest.wav', 0, size=400)
+        janitor = TempFileJanitor(str(tmp_path), 240, max_total_bytes=100)
+
+        # Act
+        deleted = janitor.sweep(now=NOW)
+
+        # Assert
+        assert deleted == 0
+        assert older.exists() and latest.exists()
+
+    def test_add_updates_index_and_requests_sweep(self, tmp_path):
+        """正常系: 保存したファイルを索引へ追加し、上限超過で整理を要求"""
+        # Arrange
+        janitor = TempFileJanitor(str(tmp_path), 240, max_files=1)
+        janitor.rescan()
+        first = _make_file(tmp_path, 'first.wav', 10)
+        second = _make_file(tmp_path, 'second.wav', 5)
+
+        # Act
+        with patch.object(janitor, 'request_sweep') as mock_request:
+            janitor.add(str(first))
+            mock_request.assert_not_called()
+            janitor.add(str(second))
+
+        # Assert
+        mock_request.assert_called_once()
+        assert janitor.file_count == 2
+
+    def test_add_missing_file_ignored(self, tmp_path):
+        """異常系: 存在しないファイルは索引に追加しない"""
+        # Arrange
+        janitor = TempFileJanitor(str(tmp_path), 240)
+
+        # Act
+        janitor.add(str(tmp_path / 'missing.wav'))
+
+        # Assert
+        assert janitor.file_count == 0
+
+    def test_remove_error_keeps_entry(self, tmp_path, caplog):
+        """異常系: 削除に失敗したファイルは索引に残し次回に再試行"""
+        # Arrange
+        _make_file(tmp_path, 'locked.wav', 300)
+        janitor = TempFileJanitor(str(tmp_path), 240)
+
+        # Act
+        with patch('service.temp_janitor.os.remove', side_effect=PermissionError("in use")):
+            deleted = janitor.sweep(now=NOW)
+
+        # Assert
+        assert deleted == 0
+        assert janitor.file_count == 1
+        assert "ファイル削除中にエラーが発生しました" in caplog.text
+
+    def test_missing_directory(self, tmp_path):
+        """境界値: 一時ディレクトリが無くてもエラーにしない"""
+        # Arrange
+        janitor = TempFileJanitor(str(tmp_path / 'missing'), 240)
+
+        # Act & Assert
+        assert janitor.sweep(now=NOW) == 0
+
+    def test_sweep_does_not_rescan_every_time(self, tmp_path):
+        """性能: 索引を再利用し、毎回ディレクトリを走査しない"""
+        # Arrange
+        janitor = TempFileJanitor(str(tmp_path), 240)
+        janitor.sweep(now=NOW)
+
+        # Act
+        with patch('service.temp_janitor.os.scandir') as mock_scandir:
+            janitor.sweep(now=NOW)
+
+        # Assert
+        mock_scandir.assert_not_called()
+
+    def test_background_thread(self, tmp_path):
+        """正常系: バックグラウンドで整理し、停止できる"""
+        # Arrange
+        old = tmp_path / 'old.wav'
+        old.write_bytes(b'x')
+        old_time = time.time() - 300 * 60
+        os.utime(old, (old_time, old_time))
+        janitor = TempFileJanitor(str(tmp_path), 240, interval=60)
+
+        # Act
+        janitor.start()
+        janitor.request_sweep()
+        stopped = janitor.stop(timeout=2.0)
+
+        # Assert
+        assert stopped is True
+        assert janitor.is_running is False
+        assert not old.exists()
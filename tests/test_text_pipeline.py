@@ -0,0 +1,273 @@
+import logging
+
+import pytest
+
+from service.replacement_rules import compile_replacement_rules
+from service.text_pipeline import SegmentTextBuffer, TextPipeline, PipelineStage, build_text_pipeline
+
+
+class TestBuildTextPipeline:
+    """パイプライン構築のテストクラス"""
+
+    def test_build_default_pipeline(self):
+        """正常系: 設定なしの場合は句読点・置換ステージのみ"""
+        # Arrange
+        config = {}
+        replacements = {'テスト': '試験'}
+
+        # Act
+        pipeline = build_text_pipeline(config, replacements)
+
+        # Assert
+        assert pipeline.stage_names == ['punctuation', 'replacements']
+
+    def test_build_pipeline_without_replacements(self):
+        """境界値: 置換ルールが空の場合は置換ステージを省略"""
+        # Act
+        pipeline = build_text_pipeline({}, {})
+
+        # Assert
+        assert pipeline.stage_names == ['punctuation']
+
+    def test_build_pipeline_none_replacements(self):
+        """境界値: 置換ルールがNone"""
+        # Act
+        pipeline = build_text_pipeline({}, None)
+
+        # Assert
+        assert pipeline.process('テスト。', False) == 'テスト'
+
+    def test_build_pipeline_custom_stages(self):
+        """正常系: 設定でステージを指定"""
+        # Arrange
+        config = {'PIPELINE': {'stages': 'replacements,casing', 'casing': 'upper'}}
+
+        # Act
+        pipeline = build_text_pipeline(config, {'abc': 'def'})
+
+        # Assert
+        assert pipeline.stage_names == ['replacements', 'casing']
+        assert pipeline.process('abc。', False) == 'DEF。'
+
+    def test_build_pipeline_unknown_stage(self, caplog):
+        """異常系: 不明なステージ名"""
+        # Arrange
+        caplog.set_level(logging.WARNING)
+        config = {'PIPELINE': {'stages': 'punctuation,unknown'}}
+
+        # Act
+        pipeline = build_text_pipeline(config, {})
+
+        # Assert
+        assert pipeline.stage_names == ['punctuation']
+        assert "不明なテキスト後処理ステージ 'unknown'" in caplog.text
+
+    def test_build_pipeline_invalid_normalize_form(self, caplog):
+        """異常系: 無効な正規化形式"""
+        # Arrange
+        caplog.set_level(logging.WARNING)
+        config = {'PIPELINE': {'normalize': 'XYZ'}}
+
+        # Act
+        pipeline = build_text_pipeline(config, {})
+
+        # Assert
+        assert 'normalize' not in pipeline.stage_names
+        assert "無効な正規化形式" in caplog.text
+
+    def test_build_pipeline_invalid_regex_rule(self, caplog):
+        """異常系: コンパイルできない正規表現ルール"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+
+        # Act
+        pipeline = build_text_pipeline({}, {'re:(': 'x', 'テスト': '試験'})
+
+        # Assert
+        assert pipeline.process('テスト(', True) == '試験('
+        assert "正規表現ルールのコンパイルに失敗しました" in caplog.text
+
+
+class TestTextPipelineProcess:
+    """パイプライン実行のテストクラス"""
+
+    @pytest.mark.parametrize("use_punctuation,text,expected", [
+        (True, "テスト。です、", "試験。です、"),
+        (False, "テスト。です、", "試験です"),
+        (False, "", ""),
+    ])
+    def test_process_punctuation_and_replacements(self, use_punctuation, text, expected):
+        """パラメータ化テスト: 句読点処理と置換の組み合わせ"""
+        # Arrange
+        pipeline = build_text_pipeline({}, {'テスト': '試験'})
+
+        # Act
+        result = pipeline.process(text, use_punctuation)
+
+        # Assert
+        assert result == expected
+
+    def test_process_punctuation_applied_before_replacements(self):
+        """正常系: 句読点削除後の文字列に置換を適用"""
+        # Arrange
+        pipeline = build_text_pipeline({}, {'少子体': '硝子体'})
+
+        # Act
+        result = pipeline.process('少子、体', False)
+
+        # Assert
+        assert result == '硝子体'
+
+    def test_process_regex_rules(self):
+        """正常系: re:接頭辞のルールを正規表現として適用"""
+        # Arrange
+        replacements = {'re:\\s+': '', 'テスト': '試験'}
+        pipeline = build_text_pipeline({}, replacements)
+
+        # Act
+        result = pipeline.process('テスト の 結果', True)
+
+        # Assert
+        assert pipeline.stage_names == ['punctuation', 'replacements']
+        assert result == '試験の結果'
+
+    def test_process_legacy_regex_stage_ignored(self):
+        """正常系: 旧設定のregexステージは置換ステージに統合"""
+        # Arrange
+        config = {'PIPELINE': {'stages': 'punctuation,replacements,regex'}}
+
+        # Act
+        pipeline = build_text_pipeline(config, {'re:\\d+': '#'})
+
+        # Assert
+        assert pipeline.stage_names == ['punctuation', 'replacements']
+        assert pipeline.process('第1章', True) == '第#章'
+
+    def test_process_normalize(self):
+        """正常系: NFKC正規化"""
+        # Arrange
+        config = {'PIPELINE': {'normalize': 'NFKC'}}
+        pipeline = build_text_pipeline(config, {'ABC': 'エービーシー'})
+
+        # Act
+        result = pipeline.process('ＡＢＣ', True)
+
+        # Assert
+        assert result == 'エービーシー'
+
+    def test_process_stage_error_continues(self, caplog):
+        """異常系: ステージでの例外は記録して後続を継続"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+
+        def broken(text):
+            raise RuntimeError("stage error")
+
+        pipeline = TextPipeline([
+            PipelineStage('broken', broken, 1),
+            PipelineStage('upper', str.upper, 1),
+        ])
+
+        # Act
+        result = pipeline.process('abc', True)
+
+        # Assert
+        assert result == 'ABC'
+        assert "テキスト後処理 'broken' でエラー" in caplog.text
+
+
+class TestTextPipelineCompile:
+    """パイプラインのコンパイル処理のテストクラス"""
+
+    def test_filters_moved_before_other_stages(self):
+        """正常系: 削除フィルタを先頭へ移動"""
+        # Arrange
+        config = {'PIPELINE': {'stages': 'replacements,punctuation'}}
+
+        # Act
+        pipeline = build_text_pipeline(config, {'テスト': '試験'})
+
+        # Assert
+        assert pipeline.compiled_stage_names(False) == ['punctuation', 'replacements']
+        assert pipeline.compiled_stage_names(True) == ['replacements']
+
+    def test_adjacent_filters_fused(self):
+        """正常系: 複数の削除フィルタを1つの変換に融合"""
+        # Arrange
+        extra = PipelineStage(
+            'symbols',
+            lambda text: text.translate(str.maketrans('', '', '!')),
+            0,
+            str.maketrans('', '', '!')
+        )
+        punctuation = build_text_pipeline({}, {}).stages[0]
+
+        # Act
+        pipeline = TextPipeline([punctuation, extra])
+
+        # Assert
+        assert pipeline.compiled_stage_names(False) == ['punctuation+symbols']
+        assert pipeline.process('テスト。です!', False) == 'テストです'
+
+    def test_profile_returns_timing_per_stage(self):
+        """正常系: ステージごとの処理時間を計測"""
+        # Arrange
+        pipeline = build_text_pipeline({}, {'テスト': '試験'})
+
+        # Act
+        timings = pipeline.profile('テスト。です', False, iterations=5)
+
+        # Assert
+        assert list(timings) == ['punctuation', 'replacements']
+        assert all(value >= 0 for value in timings.values())
+
+
+class TestSegmentTextBuffer:
+    """セグメント連結バッファのテストクラス"""
+
+    def setup_method(self):
+        self.matcher = compile_replacement_rules({'白内障手術': '水晶体再建術'})
+
+    def test_feed_returns_text_without_pending_prefix(self):
+        """正常系: ルールの先頭部分で終わる末尾を保留"""
+        # Arrange
+        buffer = SegmentTextBuffer(self.matcher)
+
+        # Act
+        ready = buffer.feed("本日は白内障")
+
+        # Assert
+        assert ready == "本日は"
+        assert buffer.pending == "白内障"
+
+    def test_rule_across_segments_is_replaced(self):
+        """正常系: セグメントをまたぐ置換ルールも適用される"""
+        # Arrange
+        buffer = SegmentTextBuffer(self.matcher)
+        pipeline = build_text_pipeline({}, {'白内障手術': '水晶体再建術'})
+
+        # Act
+        outputs = [pipeline.process(buffer.feed(text)) for text in ["本日は白内", "障手術を", "行います"]]
+        outputs.append(pipeline.process(buffer.flush()))
+
+        # Assert
+        assert ''.join(outputs) == "本日は水晶体再建術を行います"
+
+    def test_flush_returns_pending(self):
+        """正常系: 最後に保留中の末尾を返す"""
+        # Arrange
+        buffer = SegmentTextBuffer(self.matcher)
+        buffer.feed("最後は白内")
+
+        # Act & Assert
+        assert buffer.flush() == "白内"
+        assert buffer.flush() == ""
+
+    def test_feed_empty_text(self):
+        """境界値: 空のセグメント"""
+        # Arrange
+        buffer = SegmentTextBuffer(self.matcher)
+
+        # Act & Assert
+        assert buffer.feed("") == ""
+        assert buffer.feed(None) == ""
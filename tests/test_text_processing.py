@@ -5,17 +5,30 @@ from unittest.mock import Mock, patch, mock_open, call
 
 import pytest
 
+from service.clipboard_backend import InMemoryClipboardBackend, set_clipboard_backend
+from service.replacement_rules import LITERAL, REGEX, WORD, ReplacementRule
 from service.text_processing import (
     process_punctuation,
     get_replacements_path,
     load_replacements,
+    load_replacement_rules,
     replace_text,
     copy_and_paste_transcription,
     emergency_clipboard_recovery,
-    initialize_text_processing
+    get_output_worker,
+    initialize_text_processing,
+    schedule_clipboard_restore,
+    snapshot_clipboard
 )
 
 
+@pytest.fixture(autouse=True)
+def output_worker_running():
+    """threading.Threadをモックする前に出力ワーカーを起動しておく"""
+    get_output_worker().start()
+    yield
+
+
 class TestProcessPunctuation:
     """句読点処理のテストクラス"""
 
@@ -352,6 +365,58 @@ class TestLoadReplacements:
             assert "置換ルールの総数: 2" in caplog.text
 
 
+class TestLoadReplacementRules:
+    """拡張形式の置換ルール読み込みのテストクラス"""
+
+    @patch('service.text_processing.get_replacements_path')
+    def test_load_replacement_rules_extended_format(self, mock_get_path):
+        """正常系: 正規表現・単語境界・優先度付きのルール"""
+        # Arrange
+        mock_get_path.return_value = 'rules.txt'
+        file_content = "# コメント\n少子体,硝子体\nword:AI,エーアイ\nre:(\\d+)歳,\\1才,5\n"
+
+        with patch('builtins.open', mock_open(read_data=file_content)):
+            # Act
+            result = load_replacement_rules()
+
+            # Assert
+            assert result == [
+                ReplacementRule(LITERAL, '少子体', '硝子体', 0),
+                ReplacementRule(WORD, 'AI', 'エーアイ', 0),
+                ReplacementRule(REGEX, '(\\d+)歳', '\\1才', 5),
+            ]
+
+    @patch('service.text_processing.get_replacements_path')
+    def test_load_replacement_rules_invalid_regex(self, mock_get_path, caplog):
+        """異常系: コンパイルできない正規表現の行"""
+        # Arrange
+        caplog.set_level(logging.ERROR)
+        mock_get_path.return_value = 'rules.txt'
+        file_content = "re:(,x\n正常,置換\n"
+
+        with patch('builtins.open', mock_open(read_data=file_content)):
+            # Act
+            result = load_replacement_rules()
+
+            # Assert
+            assert result == [ReplacementRule(LITERAL, '正常', '置換', 0)]
+            assert "1行目に無効な行があります" in caplog.text
+
+    @patch('service.text_processing.get_replacements_path')
+    def test_load_replacements_returns_literal_rules_only(self, mock_get_path):
+        """正常系: load_replacementsはリテラルのルールのみ返す"""
+        # Arrange
+        mock_get_path.return_value = 'rules.txt'
+        file_content = "旧,新\nre:\\s+,\nword:AI,エーアイ\n"
+
+        with patch('builtins.open', mock_open(read_data=file_content)):
+            # Act
+            result = load_replacements()
+
+            # Assert
+            assert result == {'旧': '新'}
+
+
 class TestReplaceText:
     """テキスト置換のテストクラス"""
 
@@ -567,7 +632,7 @@ class TestCopyAndPasteTranscription:
     def test_copy_and_paste_transcription_success(
         self, mock_thread, mock_paste, mock_copy, mock_replace
     ):
-        """正常系: 正常なコピー&ペースト処理"""
+        """正常系: 出力ワーカーでコピーと貼り付けを実行"""
         # Arrange
         text = "テストテキスト"
         replaced_text = "試験テキスト"
@@ -575,18 +640,35 @@ class TestCopyAndPasteTranscription:
         mock_replace.return_value = replaced_text
         mock_copy.return_value = True
         mock_paste.return_value = True
-        
-        mock_thread_instance = Mock()
-        mock_thread.return_value = mock_thread_instance
 
         # Act
-        copy_and_paste_transcription(text, self.mock_replacements, self.mock_config)
+        future = copy_and_paste_transcription(text, self.mock_replacements, self.mock_config)
 
         # Assert
+        assert future.result(timeout=1) is True
         mock_replace.assert_called_once_with(text, self.mock_replacements)
         mock_copy.assert_called_once_with(replaced_text)
-        mock_thread.assert_called_once()
-        mock_thread_instance.start.assert_called_once()
+        mock_paste.assert_called_once()
+        # 貼り付けごとにスレッドを作成しない
+        mock_thread.assert_not_called()
+
+    @patch('service.text_processing.replace_text')
+    @patch('service.text_processing.safe_clipboard_copy')
+    @patch('service.text_processing.safe_paste_text', return_value=True)
+    def test_copy_and_paste_transcription_without_replacements(
+        self, mock_paste, mock_copy, mock_replace
+    ):
+        """正常系: 置換ルールがNoneの場合は置換せずにコピー"""
+        # Arrange
+        text = "処理済みテキスト"
+        mock_copy.return_value = True
+
+        # Act
+        copy_and_paste_transcription(text, None, self.mock_config).result(timeout=1)
+
+        # Assert
+        mock_replace.assert_not_called()
+        mock_copy.assert_called_once_with(text)
 
     @patch('service.text_processing.replace_text')
     def test_copy_and_paste_transcription_empty_text(self, mock_replace):
@@ -619,9 +701,12 @@ class TestCopyAndPasteTranscription:
         mock_replace.return_value = replaced_text
         mock_copy.return_value = False
 
-        # Act & Assert
+        # Act
+        future = copy_and_paste_transcription(text, self.mock_replacements, self.mock_config)
+
+        # Assert
         with pytest.raises(Exception, match="クリップボードへのコピーに失敗しました"):
-            copy_and_paste_transcription(text, self.mock_replacements, self.mock_config)
+            future.result(timeout=1)
 
     @patch('service.text_processing.replace_text')
     @patch('service.text_processing.safe_clipboard_copy')
@@ -645,11 +730,12 @@ class TestCopyAndPasteTranscription:
     @patch('service.text_processing.replace_text')
     @patch('service.text_processing.safe_clipboard_copy')
     @patch('service.text_processing.safe_paste_text')
+    @patch('service.text_processing.get_paste_delay', return_value=0.05)
     @patch('service.text_processing.time.sleep')
     def test_copy_and_paste_transcription_delayed_paste_execution(
-        self, mock_sleep, mock_paste, mock_copy, mock_replace
+        self, mock_sleep, mock_get_delay, mock_paste, mock_copy, mock_replace
     ):
-        """正常系: 遅延ペースト処理の実行確認"""
+        """正常系: 貼り付け前の待機の実行確認"""
         # Arrange
         text = "テストテキスト"
         replaced_text = "試験テキスト"
@@ -658,22 +744,27 @@ class TestCopyAndPasteTranscription:
         mock_copy.return_value = True
         mock_paste.return_value = True
 
-        # threading.Threadの代わりに直接実行する
-        with patch('service.text_processing.threading.Thread') as mock_thread:
-            def immediate_execute(target=None, **kwargs):
-                # スレッドの代わりに即座に実行
-                target()
-                thread_mock = Mock()
-                return thread_mock
-            
-            mock_thread.side_effect = immediate_execute
+        # Act
+        copy_and_paste_transcription(text, self.mock_replacements, self.mock_config).result(timeout=1)
 
-            # Act
-            copy_and_paste_transcription(text, self.mock_replacements, self.mock_config)
+        # Assert
+        mock_get_delay.assert_called_once_with(0.2)
+        mock_sleep.assert_called_once_with(0.05)
+        mock_paste.assert_called_once()
 
-            # Assert
-            mock_sleep.assert_called_once_with(0.2)
-            mock_paste.assert_called_once()
+    @patch('service.text_processing.safe_clipboard_copy')
+    @patch('service.text_processing.type_text_from_config', return_value=True)
+    def test_copy_and_paste_transcription_keystroke_mode(self, mock_type, mock_copy):
+        """正常系: キー入力モードではクリップボードを使わない"""
+        # Arrange
+        config = {'OUTPUT': {'mode': 'keystroke'}}
+
+        # Act
+        copy_and_paste_transcription("文字起こし", None, config).result(timeout=1)
+
+        # Assert
+        mock_type.assert_called_once_with("文字起こし", config)
+        mock_copy.assert_not_called()
 
     @patch('service.text_processing.replace_text')
     @patch('service.text_processing.safe_clipboard_copy')
@@ -743,34 +834,138 @@ class TestEmergencyClipboardRecovery:
         assert "クリップボード復旧中にエラー" in caplog.text
 
 
+class TestClipboardRestore:
+    """貼り付け後のクリップボード復元のテストクラス"""
+
+    def setup_method(self):
+        self.backend = InMemoryClipboardBackend("元の内容")
+        self.previous_backend = set_clipboard_backend(self.backend)
+
+    def teardown_method(self):
+        set_clipboard_backend(self.previous_backend)
+
+    def test_restore_after_paste(self):
+        """正常系: 貼り付け後に元の内容を復元"""
+        # Arrange
+        snapshot = snapshot_clipboard()
+        self.backend.copy("文字起こし")
+
+        # Act
+        schedule_clipboard_restore(snapshot, "文字起こし", 0).result(timeout=1)
+
+        # Assert
+        assert snapshot == "元の内容"
+        assert self.backend.text == "元の内容"
+
+    def test_restore_skipped_when_user_changed_clipboard(self, caplog):
+        """正常系: ユーザーがクリップボードを変更していれば復元しない"""
+        # Arrange
+        caplog.set_level(logging.INFO)
+        snapshot = snapshot_clipboard()
+        self.backend.copy("ユーザーの新しい内容")
+
+        # Act
+        schedule_clipboard_restore(snapshot, "文字起こし", 0).result(timeout=1)
+
+        # Assert
+        assert self.backend.text == "ユーザーの新しい内容"
+        assert "クリップボードが変更されたため復元をスキップしました" in caplog.text
+
+    def test_restore_skipped_for_empty_snapshot(self):
+        """境界値: 空の内容は復元しない"""
+        # Act
+        future = schedule_clipboard_restore("", "文字起こし", 0)
+
+        # Assert
+        assert future is None
+
+    def test_consecutive_pastes_restore_first_snapshot(self):
+        """正常系: 復元前に次の貼り付けが来ても最初の内容を復元"""
+        # Arrange
+        first_snapshot = snapshot_clipboard()
+        self.backend.copy("1回目")
+        first = schedule_clipboard_restore(first_snapshot, "1回目", 10)
+
+        # Act
+        second_snapshot = snapshot_clipboard()
+        self.backend.copy("2回目")
+        schedule_clipboard_restore(second_snapshot, "2回目", 0).result(timeout=1)
+
+        # Assert
+        assert first.cancelled()
+        assert second_snapshot == "元の内容"
+        assert self.backend.text == "元の内容"
+
+    def test_restore_dropped_when_worker_stops(self):
+        """境界値: 出力ワーカーの停止時は復元待ちを取り消し、停止後にワーカーを再開しない"""
+        # Arrange
+        snapshot = snapshot_clipboard()
+        self.backend.copy("文字起こし")
+        future = schedule_clipboard_restore(snapshot, "文字起こし", 10)
+
+        # Act
+        stopped = get_output_worker().stop(timeout=1.0)
+
+        # Assert
+        assert stopped is True
+        assert future.cancelled()
+        assert not get_output_worker().is_running
+        assert self.backend.text == "文字起こし"
+        snapshot_clipboard()  # 取り消した復元の状態を次の貼り付けで引き継いで片付ける
+
+    @patch('service.text_processing.safe_paste_text', return_value=True)
+    @patch('service.text_processing.safe_clipboard_copy', return_value=True)
+    @patch('service.text_processing.schedule_clipboard_restore')
+    def test_copy_and_paste_schedules_restore(self, mock_schedule, mock_copy, mock_paste):
+        """正常系: restore_clipboard有効時は貼り付け後に復元を予約"""
+        # Arrange
+        config = {'CLIPBOARD': {'paste_delay': '0', 'restore_clipboard': 'True', 'restore_delay': '0.3'}}
+
+        # Act
+        copy_and_paste_transcription("文字起こし", None, config).result(timeout=1)
+
+        # Assert
+        mock_schedule.assert_called_once_with("元の内容", "文字起こし", 0.3)
+
+    @patch('service.text_processing.safe_paste_text', return_value=True)
+    @patch('service.text_processing.safe_clipboard_copy', return_value=True)
+    @patch('service.text_processing.schedule_clipboard_restore')
+    def test_copy_and_paste_without_restore(self, mock_schedule, mock_copy, mock_paste):
+        """正常系: restore_clipboard無効時はクリップボードを読み取らない"""
+        # Arrange
+        config = {'CLIPBOARD': {'paste_delay': '0', 'restore_clipboard': 'False'}}
+
+        # Act
+        copy_and_paste_transcription("文字起こし", None, config).result(timeout=1)
+
+        # Assert
+        mock_schedule.assert_not_called()
+        assert self.backend.read_count == 0
+
+
 class TestInitializeModule:
     """モジュール初期化のテストクラス"""
 
     @patch('service.text_processing.is_paste_available')
     @patch('service.text_processing.emergency_clipboard_recovery')
     def test_initialize_module_success(self, mock_recovery, mock_paste_available):
-        """正常系: モジュール初期化成功"""
+        """正常系: モジュール初期化成功（クリップボードの読み書きなし）"""
         # Arrange
         mock_paste_available.return_value = True
-        mock_recovery.return_value = True
 
         # Act
         initialize_text_processing()
 
         # Assert
         mock_paste_available.assert_called_once()
-        mock_recovery.assert_called_once()
+        mock_recovery.assert_not_called()
 
     @patch('service.text_processing.is_paste_available')
-    @patch('service.text_processing.emergency_clipboard_recovery')
-    def test_initialize_module_paste_unavailable(
-        self, mock_recovery, mock_paste_available, caplog
-    ):
+    def test_initialize_module_paste_unavailable(self, mock_paste_available, caplog):
         """異常系: ペースト機能が利用不可"""
         # Arrange
         caplog.set_level(logging.ERROR)
         mock_paste_available.return_value = False
-        mock_recovery.return_value = True
 
         # Act
         initialize_text_processing()
@@ -778,22 +973,23 @@ class TestInitializeModule:
         # Assert
         assert "貼り付け機能初期化失敗" in caplog.text
 
-    @patch('service.text_processing.is_paste_available')
-    @patch('service.text_processing.emergency_clipboard_recovery')
-    def test_initialize_module_recovery_failure(
-        self, mock_recovery, mock_paste_available, caplog
-    ):
-        """異常系: クリップボード復旧失敗"""
+    @patch('service.text_processing.is_paste_available', return_value=True)
+    def test_initialize_module_keeps_clipboard(self, mock_paste_available):
+        """正常系: 起動時にクリップボードの内容を変更しない"""
         # Arrange
-        caplog.set_level(logging.WARNING)
-        mock_paste_available.return_value = True
-        mock_recovery.return_value = False
+        backend = InMemoryClipboardBackend("ユーザーの内容")
+        previous = set_clipboard_backend(backend)
 
         # Act
-        initialize_text_processing()
+        try:
+            initialize_text_processing()
+        finally:
+            set_clipboard_backend(previous)
 
         # Assert
-        assert "クリップボード初期化テストに失敗しました" in caplog.text
+        assert backend.text == "ユーザーの内容"
+        assert backend.copy_count == 0
+        assert backend.read_count == 0
 
     @patch('service.text_processing.is_paste_available')
     def test_initialize_module_exception(self, mock_paste_available, caplog):
@@ -837,16 +1033,14 @@ class TestIntegrationScenarios:
             
             mock_copy.return_value = True
             mock_paste.return_value = True
-            mock_thread_instance = Mock()
-            mock_thread.return_value = mock_thread_instance
 
             # Act
-            copy_and_paste_transcription(original_text, replacements, config)
+            copy_and_paste_transcription(original_text, replacements, config).result(timeout=1)
 
             # Assert
             mock_copy.assert_called_once_with("これは試験と例です")
-            mock_thread.assert_called_once()
-            mock_thread_instance.start.assert_called_once()
+            mock_paste.assert_called_once()
+            mock_thread.assert_not_called()
 
     @patch('service.text_processing.get_replacements_path')
     def test_load_and_apply_replacements_workflow(self, mock_get_path):
@@ -932,26 +1126,51 @@ class TestThreadingSafety:
 
     @patch('service.text_processing.threading.Thread')
     def test_concurrent_copy_paste_operations(self, mock_thread):
-        """並行コピー&ペースト操作のテスト"""
+        """並行コピー&ペースト操作は投入順に1つずつ実行される"""
         # Arrange
         config = {'CLIPBOARD': {'PASTE_DELAY': 0.01}}
         replacements = {"テスト": "試験"}
-        
-        # スレッドの動作をシミュレート
-        threads_created = []
-        
-        def capture_thread(*args, **kwargs):
-            thread_mock = Mock()
-            threads_created.append((args, kwargs))
-            return thread_mock
-        
-        mock_thread.side_effect = capture_thread
+        events = []
+
+        def record_copy(text):
+            events.append(('copy', text))
+            return True
+
+        def record_paste():
+            events.append(('paste', None))
+            return True
 
-        with patch('service.text_processing.safe_clipboard_copy', return_value=True):
+        with patch('service.text_processing.safe_clipboard_copy', side_effect=record_copy), \
+             patch('service.text_processing.safe_paste_text', side_effect=record_paste):
             # Act
-            copy_and_paste_transcription("テスト1", replacements, config)
-            copy_and_paste_transcription("テスト2", replacements, config)
+            futures = [
+                copy_and_paste_transcription(f"テスト{i}", replacements, config)
+                for i in range(5)
+            ]
+            for future in futures:
+                future.result(timeout=1)
 
-            # Assert
-            assert len(threads_created) == 2
-            assert mock_thread.call_count == 2
+        # Assert
+        expected = []
+        for i in range(5):
+            expected += [('copy', f"試験{i}"), ('paste', None)]
+        assert events == expected
+        mock_thread.assert_not_called()
+
+    def test_jobs_hold_clipboard_lock(self):
+        """出力ジョブは_clipboard_lockを保持して実行される"""
+        # Arrange
+        from service import text_processing
+        lock_states = []
+
+        def record_copy(text):
+            lock_states.append(text_processing._clipboard_lock.locked())
+            return True
+
+        with patch('service.text_processing.safe_clipboard_copy', side_effect=record_copy), \
+             patch('service.text_processing.safe_paste_text', return_value=True):
+            # Act
+            copy_and_paste_transcription("テスト", None, {}).result(timeout=1)
+
+        # Assert
+        assert lock_states == [True]
@@ -0,0 +1,128 @@
+import os
+import threading
+
+import pytest
+
+from service.transcription_job import TranscriptionJob, transcription_key
+
+
+class TestTranscriptionJob:
+    """文字起こしジョブのテストクラス"""
+
+    def test_result_and_progress(self):
+        """正常系: 段階の変化を通知し、結果を受け取る"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+        stages = []
+        job.add_progress_callback(lambda j: stages.append(j.stage))
+
+        # Act
+        job.set_stage('文字起こし中')
+        job.set_result("本日は晴天です")
+
+        # Assert
+        assert job.result(timeout=0) == "本日は晴天です"
+        assert stages == ['文字起こし中', '完了']
+        assert job.done() is True
+
+    def test_cancel_before_completion(self):
+        """正常系: 完了前のキャンセルで結果を破棄"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+
+        # Act
+        cancelled = job.cancel()
+        job.set_result("破棄される")
+
+        # Assert
+        assert cancelled is True
+        assert job.cancelled() is True
+        assert job.stage == 'キャンセル'
+        with pytest.raises(Exception):
+            job.result(timeout=0)
+
+    def test_cancel_after_completion(self):
+        """境界値: 完了後はキャンセルできない"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+        job.set_result("完了済み")
+
+        # Act & Assert
+        assert job.cancel() is False
+        assert job.cancelled() is False
+
+    def test_exception(self):
+        """異常系: 失敗を例外として受け取る"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+
+        # Act
+        job.set_exception(ValueError("音声ファイルの処理に失敗しました"))
+
+        # Assert
+        assert job.stage == 'エラー'
+        with pytest.raises(ValueError):
+            job.result(timeout=0)
+
+    def test_result_waits_for_other_thread(self):
+        """正常系: 別スレッドで設定した結果を待って受け取る"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+
+        # Act
+        threading.Timer(0.05, job.set_result, args=("遅れて完了",)).start()
+
+        # Assert
+        assert job.result(timeout=2.0) == "遅れて完了"
+
+    def test_progress_callback_error_ignored(self, caplog):
+        """異常系: 進捗の通知で例外が起きても処理を続ける"""
+        # Arrange
+        job = TranscriptionJob('/test/temp/audio.wav')
+        job.add_progress_callback(lambda j: 1 / 0)
+
+        # Act
+        job.set_stage('後処理中')
+
+        # Assert
+        assert job.stage == '後処理中'
+        assert "進捗の通知中にエラー" in caplog.text
+
+
+class TestTranscriptionKey:
+    """同一の文字起こし要求の判定キーのテストクラス"""
+
+    def test_same_file_and_params(self, tmp_path):
+        """正常系: 同じファイル・同じパラメーターなら同じキー（相対パスでも実体で判定）"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+        path.write_bytes(b'RIFF')
+
+        # Act
+        first = transcription_key(str(path), 'whisper', 'ja')
+        second = transcription_key(os.path.relpath(path), 'whisper', 'ja')
+
+        # Assert
+        assert first is not None
+        assert first == second
+
+    def test_differs_by_params_and_content(self, tmp_path):
+        """正常系: パラメーターやファイルの内容が変われば別のキー"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+        path.write_bytes(b'RIFF')
+        before = transcription_key(str(path), 'whisper', 'ja')
+
+        # Act
+        other_language = transcription_key(str(path), 'whisper', 'en')
+        path.write_bytes(b'RIFF-modified')
+        modified = transcription_key(str(path), 'whisper', 'ja')
+
+        # Assert
+        assert other_language != before
+        assert modified != before
+
+    def test_missing_file(self, tmp_path):
+        """異常系: 存在しないファイルはキーを作らない"""
+        # Act & Assert
+        assert transcription_key(str(tmp_path / 'missing.wav')) is None
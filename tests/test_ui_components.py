@@ -0,0 +1,65 @@
+import tkinter as tk
+from unittest.mock import Mock, patch
+
+from app.ui_components import UIComponents
+from service.recording_history import RecordingHistory
+
+
+class TestUIComponentsAudioFile:
+    """音声ファイルの再読み込み・選択のテストクラス"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される設定"""
+        self.mock_master = Mock(spec=tk.Tk)
+        self.mock_submit = Mock(return_value='job')
+
+    def _components(self, temp_dir):
+        config = {'PATHS': {'TEMP_DIR': str(temp_dir)}}
+        return UIComponents(self.mock_master, config, {'submit_file': self.mock_submit})
+
+    def test_reload_latest_audio_submits_path(self, tmp_path):
+        """正常系: 最新の録音のパスを直接投入し、クリップボードは使わない"""
+        # Arrange
+        audio_file = tmp_path / 'audio_20240101_120000.wav'
+        audio_file.write_bytes(b'RIFF')
+        components = self._components(tmp_path)
+
+        # Act
+        with patch('app.ui_components.get_recording_history') as mock_history:
+            mock_history.return_value = RecordingHistory(str(tmp_path))
+            mock_history.return_value.append(str(audio_file))
+            job = components.reload_latest_audio()
+
+        # Assert
+        assert job == 'job'
+        self.mock_submit.assert_called_once_with(str(audio_file))
+        self.mock_master.clipboard_append.assert_not_called()
+        self.mock_master.event_generate.assert_not_called()
+
+    @patch('app.ui_components.messagebox.showwarning')
+    def test_reload_without_recordings(self, mock_warning, tmp_path):
+        """異常系: 録音が無い場合は警告のみ"""
+        # Arrange
+        components = self._components(tmp_path)
+
+        # Act
+        job = components.reload_latest_audio()
+
+        # Assert
+        assert job is None
+        self.mock_submit.assert_not_called()
+        mock_warning.assert_called_once()
+
+    @patch('app.ui_components.filedialog.askopenfilename')
+    def test_open_audio_file_submits_path(self, mock_dialog, tmp_path):
+        """正常系: 選択したファイルのパスを直接投入"""
+        # Arrange
+        mock_dialog.return_value = str(tmp_path / 'selected.wav')
+        components = self._components(tmp_path)
+
+        # Act
+        components.open_audio_file()
+
+        # Assert
+        self.mock_submit.assert_called_once_with(str(tmp_path / 'selected.wav'))
+        self.mock_master.clipboard_clear.assert_not_called()
@@ -0,0 +1,75 @@
+import time
+import wave
+from unittest.mock import patch
+
+from service.wav_stream_writer import StreamingWavWriter
+
+
+def _read_wav(path):
+    with wave.open(str(path), 'rb') as wf:
+        return wf.getnchannels(), wf.getframerate(), wf.readframes(wf.getnframes())
+
+
+class TestStreamingWavWriter:
+    """録音の逐次保存のテストクラス"""
+
+    def test_write_and_close(self, tmp_path):
+        """正常系: 追記したチャンクを1つのWAVファイルとして保存"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+        writer = StreamingWavWriter(str(path), 16000, 1)
+
+        # Act
+        for value in range(10):
+            writer.write(bytes([value, 0]) * 160)
+        result = writer.close(timeout=2.0)
+
+        # Assert
+        channels, rate, data = _read_wav(path)
+        assert result == str(path)
+        assert (channels, rate) == (1, 16000)
+        assert data == b''.join(bytes([value, 0]) * 160 for value in range(10))
+        assert writer.duration == 0.1
+
+    def test_readable_while_recording(self, tmp_path):
+        """正常系: 録音中（クローズ前）でもフラッシュ済みの音声は有効なWAVとして読める"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+        writer = StreamingWavWriter(str(path), 16000, 1, flush_interval=0)
+
+        # Act
+        writer.write(b'\x01\x00' * 1600)
+        writer.write(b'\x02\x00' * 1600)
+        deadline = time.time() + 2.0
+        while writer.bytes_written < 6400 and time.time() < deadline:
+            time.sleep(0.01)
+        _, _, data = _read_wav(path)
+        writer.close(timeout=2.0)
+
+        # Assert
+        assert data == b'\x01\x00' * 1600 + b'\x02\x00' * 1600
+
+    def test_empty_recording(self, tmp_path):
+        """境界値: チャンクが無くても有効な空のWAVを残す"""
+        # Arrange
+        path = tmp_path / 'audio.wav'
+
+        # Act
+        StreamingWavWriter(str(path), 16000, 1).close(timeout=2.0)
+
+        # Assert
+        assert _read_wav(path)[2] == b''
+
+    def test_write_error(self, tmp_path, caplog):
+        """異常系: 書き込みに失敗した場合はパスを返さない"""
+        # Arrange
+        writer = StreamingWavWriter(str(tmp_path / 'audio.wav'), 16000, 1)
+
+        # Act
+        with patch.object(writer._wave, 'writeframes', side_effect=OSError("disk full")):
+            writer.write(b'\x00\x00')
+            result = writer.close(timeout=2.0)
+
+        # Assert
+        assert result is None
+        assert "録音の逐次保存中にエラー" in caplog.text
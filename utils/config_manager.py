@@ -21,6 +21,9 @@ def get_config_path():
 def get_config_value(config: configparser.ConfigParser, section: str, key: str, default: Any) -> Any:
     try:
         value = config[section][key]
+        if isinstance(default, bool) and isinstance(value, str):
+            # bool('False')はTrueになるため設定ファイルの真偽値表記で解釈する
+            return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
         return type(default)(value)
     except (KeyError, ValueError, TypeError):
         return default
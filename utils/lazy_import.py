@@ -0,0 +1,45 @@
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+from typing import Iterable
+
+# 確認から sys.modules への登録までを1つのスレッドで行い、同じ名前の遅延モジュールが複数作られないようにする
+_lock = threading.Lock()
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """初回の属性アクセスまで読み込みを遅らせたモジュールを返す
+
+    読み込み済みのモジュールはそのまま返す。属性アクセス時に本来のモジュールへ置き換わるため、
+    unittest.mock.patch('service.xxx.pyperclip.copy') のような差し替えもそのまま使える
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+    return module
+
+
+def preload_modules(names: Iterable[str]):
+    """遅延読み込みのモジュールを含めて読み込みを完了させる（起動時のバックグラウンド処理用）
+
+    Python 3.11のLazyLoaderは複数スレッドからの同時の初回アクセスに対応しないため、
+    UIを作る前に1つのスレッドで読み込みを済ませておく
+    """
+    for name in names:
+        module = importlib.import_module(name)
+        getattr(module, '__file__', None)
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from logging.handlers import TimedRotatingFileHandler
 
 from utils.config_manager import load_config, get_config_value
+from utils.startup_trace import get_startup_trace
 
 
 def setup_logging(config=None):
@@ -53,7 +54,8 @@ def setup_logging(config=None):
         console_handler.setLevel(logging.WARNING)  # WARNING以上のみコンソール出力
         root_logger.addHandler(console_handler)
 
-        cleanup_old_logs(log_directory, log_retention_days, project_name)
+        with get_startup_trace().phase('cleanup_old_logs'):
+            cleanup_old_logs(log_directory, log_retention_days, project_name)
 
         logging.info(f"ログシステムが初期化されました: {log_file}")
 
@@ -0,0 +1,119 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+# '1' で起動の各段階の所要時間をログに出力する
+TRACE_ENV = 'GROQWHISPER_STARTUP_TRACE'
+# 指定したパスへ計測結果をJSONで書き出す（ベンチマーク用）
+TRACE_FILE_ENV = 'GROQWHISPER_STARTUP_TRACE_FILE'
+# '1' でメインループ到達後に終了する（ベンチマーク用）
+EXIT_ENV = 'GROQWHISPER_STARTUP_EXIT'
+
+_PROCESS_START = time.perf_counter()
+
+
+class StartupPhase(NamedTuple):
+    name: str
+    start: float
+    duration: float
+    thread: str
+    depth: int
+
+
+class StartupTrace:
+    """起動の各段階の開始時刻と所要時間を記録（無効時は何もしない）"""
+
+    def __init__(self, enabled: bool = False, origin: Optional[float] = None):
+        self.enabled = enabled
+        self.origin = _PROCESS_START if origin is None else origin
+        self._phases: List[StartupPhase] = []
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._local.depth = depth
+            with self._lock:
+                self._phases.append(StartupPhase(
+                    name, start - self.origin, duration, threading.current_thread().name, depth
+                ))
+
+    def mark(self, name: str):
+        """ある時点（メインループ到達など）を記録"""
+        if self.enabled:
+            with self._lock:
+                self._marks[name] = time.perf_counter() - self.origin
+
+    @property
+    def phases(self) -> List[StartupPhase]:
+        with self._lock:
+            return sorted(self._phases, key=lambda phase: phase.start)
+
+    @property
+    def marks(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._marks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'phases': [phase._asdict() for phase in self.phases],
+            'marks': self.marks,
+        }
+
+    def report(self) -> str:
+        lines = [f"{'開始(ms)':>9} {'所要(ms)':>9}  段階"]
+        for phase in self.phases:
+            thread = '' if phase.thread == 'MainThread' else f"  [{phase.thread}]"
+            lines.append(
+                f"{phase.start * 1000:>9.1f} {phase.duration * 1000:>9.1f}  "
+                f"{'  ' * phase.depth}{phase.name}{thread}"
+            )
+        for name, at in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"{at * 1000:>9.1f} {'':>9}  {name}")
+        return '\n'.join(lines)
+
+    def write_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def emit(self):
+        """ログへの出力と、指定があればJSONファイルへの書き出し"""
+        if not self.enabled:
+            return
+        logging.info(f"起動時間の内訳:\n{self.report()}")
+        path = os.environ.get(TRACE_FILE_ENV)
+        if path:
+            try:
+                self.write_json(path)
+            except OSError as e:
+                logging.error(f"起動時間の書き出しに失敗しました: {path}, {e}")
+
+
+_trace: Optional[StartupTrace] = None
+
+
+def get_startup_trace() -> StartupTrace:
+    """環境変数で有効化される起動時間の計測（プロセスで1つ）"""
+    global _trace
+    if _trace is None:
+        _trace = StartupTrace(os.environ.get(TRACE_ENV) == '1' or bool(os.environ.get(TRACE_FILE_ENV)))
+    return _trace
+
+
+def exit_after_startup() -> bool:
+    return os.environ.get(EXIT_ENV) == '1'